@@ -0,0 +1,74 @@
+"""
+Command: api
+Start, stop and inspect the local command API (Unix socket + localhost HTTP).
+"""
+
+MANIFEST = {
+    "name": "api",
+    "description": "Local command API server (Unix socket + HTTP)",
+    "version": "1.0.0",
+    "usage": "api status | api start | api stop",
+    "author": "xsvStudio",
+    "required_role": "ADMIN",
+    "engine_deps": ["api", "security"],
+}
+DESCRIPTION = MANIFEST["description"]
+USAGE = MANIFEST["usage"]
+REQUIRED_ROLE = MANIFEST["required_role"]
+
+
+def execute(kernel, args):
+    """Manage the API server."""
+    api = kernel.get_engine("api")
+    if not api:
+        return "  [!] API engine not loaded"
+
+    parts = args.strip().split()
+    action = parts[0].lower() if parts else "status"
+
+    if action == "status":
+        return _show_status(api.get_status())
+
+    elif action == "start":
+        if api.running:
+            return _show_status(api.get_status())
+        status = api.start()
+        if not status["running"]:
+            errors = "; ".join(status["errors"]) or "no transport enabled"
+            return f"  [!] API failed to start: {errors}"
+        return _show_status(status)
+
+    elif action == "stop":
+        if api.stop():
+            return "  ✓ API server stopped"
+        return "  API server is not running"
+
+    else:
+        return (
+            "  Usage:\n"
+            "    api status   Show API server state\n"
+            "    api start    Start listening (settings.json \"api\" section)\n"
+            "    api stop     Stop the server"
+        )
+
+
+def _show_status(status):
+    lines = ["\n  ┌─ COMMAND API ─────────────────────────────┐"]
+    if not status["running"]:
+        lines.append("  │ State:    stopped")
+        lines.append("  │ Start with `api start`, or set \"api\": {\"enabled\": true}")
+    else:
+        stats = status["stats"]
+        lines.append("  │ State:    running")
+        lines.append(f"  │ HTTP:     {status['http'] or '-'}")
+        lines.append(f"  │ Socket:   {status['unix_socket'] or '-'}")
+        lines.append(f"  │ Workers:  {status['active']}/{status['workers']} busy"
+                     f" (max pending {status['max_pending']})")
+        lines.append(f"  │ Uptime:   {status['uptime']}s")
+        lines.append(f"  │ Requests: {stats['requests']} ({stats['executed']} executed,"
+                     f" {stats['denied']} denied, {stats['busy']} busy,"
+                     f" {stats['timeouts']} timed out)")
+    for error in status["errors"]:
+        lines.append(f"  │ [!] {error}")
+    lines.append("  └────────────────────────────────────────────┘")
+    return "\n".join(lines)
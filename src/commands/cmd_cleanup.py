@@ -1,16 +1,17 @@
 """
 Command: cleanup
 Remove __pycache__, .pyc files, and clear data/cache/.
+Also wipes the host-local shadow bytecode cache (GhostEngine bytecode policy).
 """
 
 MANIFEST = {
     "name": "cleanup",
     "description": "Remove pycache and temp files",
-    "version": "1.0.0",
+    "version": "1.1.0",
     "usage": "cleanup",
     "author": "xsvStudio",
     "required_role": "GUEST",
-    "engine_deps": ["root"],
+    "engine_deps": ["root", "ghost"],
 }
 DESCRIPTION = MANIFEST["description"]
 USAGE = MANIFEST["usage"]
@@ -36,8 +37,16 @@ def execute(kernel, args):
         f"  │ __pycache__ dirs removed: {result['pycache_dirs_removed']}",
         f"  │ .pyc files removed:       {result['pyc_files_removed']}",
         f"  │ cache/ items cleared:     {result['cache_items_cleared']} (was {before_count})",
-        "  └─────────────────────────────────────────────┘",
     ]
+
+    # Shadow bytecode lives on the host, only ever wiped here
+    ghost = kernel.get_engine("ghost")
+    if ghost:
+        shadow_removed = ghost.clear_bytecode_shadow()
+        policy = ghost.get_bytecode_status()["policy"]
+        lines.append(f"  │ shadow .pyc removed:      {shadow_removed} (policy: {policy})")
+
+    lines.append("  └─────────────────────────────────────────────┘")
     return "\n".join(lines)
 
 
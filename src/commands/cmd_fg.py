@@ -0,0 +1,62 @@
+"""
+Command: fg
+Follow a background job: replay its spooled output, then stream new output
+until it finishes. Ctrl+C detaches (the job keeps running).
+"""
+
+MANIFEST = {
+    "name": "fg",
+    "description": "Follow a background job's output until it finishes",
+    "version": "1.0.0",
+    "usage": "fg [%N]",
+    "author": "xsvStudio",
+    "required_role": "GUEST",
+    "engine_deps": ["jobs"],
+}
+DESCRIPTION = MANIFEST["description"]
+USAGE = MANIFEST["usage"]
+REQUIRED_ROLE = MANIFEST["required_role"]
+
+import sys
+import time
+
+# Seconds between spool reads while following
+FOLLOW_INTERVAL = 0.2
+
+
+def execute(kernel, args):
+    """Attach to a job's output."""
+    jobs = kernel.get_engine("jobs")
+    if not jobs:
+        return "  [!] Job engine unavailable"
+
+    spec = args.strip() or None
+    job = jobs.get_job(spec)
+    if job is None:
+        return f"  [!] No such job: {spec}" if spec else "  No background jobs"
+
+    print(f"[{job['id']}] {job['command']}")
+    offset = 0
+    try:
+        while True:
+            text, offset = jobs.read_output(job["id"], offset)
+            if text:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+            job = jobs.get_job(job["id"])
+            if job is None:
+                return None
+            if job["state"] != "running":
+                # Pick up anything written between the read and the exit
+                text, offset = jobs.read_output(job["id"], offset)
+                if text:
+                    sys.stdout.write(text)
+                break
+            time.sleep(FOLLOW_INTERVAL)
+    except KeyboardInterrupt:
+        return f"\n  Detached from [{job['id']}] (still running - kill %{job['id']} to stop)"
+
+    status = job["state"]
+    if job["returncode"] not in (None, 0):
+        status += f", exit {job['returncode']}"
+    return f"  [{job['id']}] {status} after {job['elapsed']}s"
@@ -0,0 +1,50 @@
+"""
+Command: jobs
+List background jobs started with a trailing `&` (see JobEngine).
+"""
+
+MANIFEST = {
+    "name": "jobs",
+    "description": "List background jobs",
+    "version": "1.0.0",
+    "usage": "jobs | jobs -l",
+    "author": "xsvStudio",
+    "required_role": "GUEST",
+    "engine_deps": ["jobs"],
+}
+DESCRIPTION = MANIFEST["description"]
+USAGE = MANIFEST["usage"]
+REQUIRED_ROLE = MANIFEST["required_role"]
+
+STATE_ICONS = {"running": "▶", "done": "✓", "failed": "✗", "killed": "■"}
+
+
+def execute(kernel, args):
+    """List the job table."""
+    jobs = kernel.get_engine("jobs")
+    if not jobs:
+        return "  [!] Job engine unavailable"
+
+    table = jobs.list_jobs()
+    if not table:
+        return "  No background jobs. Run a command with a trailing & to start one."
+
+    long_format = args.strip() == "-l"
+    lines = ["\n  ┌─ JOBS ────────────────────────────────────┐"]
+    for job in table:
+        icon = STATE_ICONS.get(job["state"], "?")
+        state = job["state"]
+        if job["returncode"] not in (None, 0):
+            state += f" ({job['returncode']})"
+        pid = f"pid {job['pid']}" if job["pid"] else "thread"
+        lines.append(
+            f"  │ {icon} [{job['id']}] {state:<12} {job['elapsed']:>7.1f}s  {pid:<11} {job['command']}"
+        )
+        if long_format:
+            lines.append(f"  │       started {job['started']}  log {job['spool']}")
+            if job["error"]:
+                lines.append(f"  │       error: {job['error']}")
+    lines.append("  │")
+    lines.append("  │ fg %N follows output · kill %N stops · wait [%N] blocks")
+    lines.append("  └────────────────────────────────────────────┘")
+    return "\n".join(lines)
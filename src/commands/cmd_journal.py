@@ -1,13 +1,16 @@
 """
 Command: journal
-Personal journal management. Add entries, list, search.
+Personal journal management. Add entries, list, show, tail, search.
+show/tail stream entries from the day files a page at a time; search runs
+on the vault's journal index: words, "phrases", #tags and word* prefixes.
+Both take --since/--until date bounds.
 """
 
 MANIFEST = {
     "name": "journal",
     "description": "Manage journal entries",
-    "version": "1.0.0",
-    "usage": "journal add <text> | journal list [date] | journal search <query>",
+    "version": "1.3.1",
+    "usage": "journal add <text> | journal list [date] | journal show [date] [#tag] [--page N] | journal tail [#tag] [-n N] | journal search <query> | journal reindex  (show/tail/search: [--since DATE] [--until DATE])",
     "author": "xsvStudio",
     "required_role": "GUEST",
     "engine_deps": ["vault"],
@@ -16,6 +19,13 @@ DESCRIPTION = MANIFEST["description"]
 USAGE = MANIFEST["usage"]
 REQUIRED_ROLE = MANIFEST["required_role"]
 
+import re
+from datetime import datetime
+
+
+_DATE_FLAG = re.compile(r"--(since|until)\s+(\S+)")
+_DATE = re.compile(r"^\d{4}-\d{2}-\d{2}$")
+
 
 def execute(kernel, args):
     """Manage journal entries."""
@@ -29,7 +39,11 @@ def execute(kernel, args):
             "  Usage:\n"
             "    journal add <entry text>\n"
             "    journal list [YYYY-MM-DD]\n"
-            "    journal search <query>"
+            "    journal show [YYYY-MM-DD] [#tag] [--page N] [-n per_page] [--since D] [--until D]\n"
+            "    journal tail [#tag] [-n N] [--since YYYY-MM-DD] [--until YYYY-MM-DD]\n"
+            "    journal search <query> [--since YYYY-MM-DD] [--until YYYY-MM-DD]\n"
+            "    journal reindex\n"
+            "  Query: words (all in one entry), \"exact phrase\", #tag, prefix*"
         )
 
     action = parts[0].lower()
@@ -42,33 +56,201 @@ def execute(kernel, args):
         return f"  ✓ Journal entry added ({result['date']} {result['timestamp']})"
 
     elif action == "list":
-        result = vault.journal_list(date=rest.strip() if rest.strip() else None)
-        if "content" in result:
-            if result["content"]:
-                return result["content"]
-            else:
-                return f"  No journal entries for {result['date']}"
-        else:
-            entries = result.get("entries", [])
-            if not entries:
-                return "  No journal entries yet. Try: journal add Hello world!"
-            lines = [f"\n  Recent journal files ({result.get('total_files', 0)} total):"]
-            for e in entries:
-                lines.append(f"    {e['date']}  ({e['size_bytes']} bytes)")
-            return "\n".join(lines)
+        if rest.strip():
+            # A single day is paged like `journal show`
+            return _show(vault, rest)
+        result = vault.journal_list()
+        entries = result.get("entries", [])
+        if not entries:
+            return "  No journal entries yet. Try: journal add Hello world!"
+        lines = [f"\n  Recent journal files ({result.get('total_files', 0)} total):"]
+        for e in entries:
+            lines.append(f"    {e['date']}  ({e['size_bytes']} bytes)")
+        return "\n".join(lines)
+
+    elif action == "show":
+        return _show(vault, rest)
+
+    elif action == "tail":
+        return _tail(vault, rest)
 
     elif action == "search":
-        if not rest:
-            return "  Usage: journal search <query>"
-        result = vault.journal_search(rest)
-        if not result["results"]:
-            return f"  No matches for '{rest}'"
-        lines = [f"\n  Found {result['total_matches']} matches for '{rest}':"]
-        for r in result["results"]:
-            lines.append(f"    {r['date']}:")
-            for preview in r.get("preview", []):
-                lines.append(f"      {preview}")
-        return "\n".join(lines)
+        return _search(vault, rest)
+
+    elif action == "reindex":
+        stats = vault.journal_reindex()
+        return (
+            f"  ✓ Journal index rebuilt: {stats['files']} days, {stats['entries']} entries, "
+            f"{stats['tokens']} terms ({stats['elapsed_ms']:.0f}ms)"
+        )
 
     else:
-        return f"  Unknown journal action: {action}\n  Try: journal add, list, or search"
+        return f"  Unknown journal action: {action}\n  Try: journal add, list, show, tail, search or reindex"
+
+
+def _search(vault, rest):
+    """journal search <query> [--since DATE] [--until DATE]"""
+    bounds = {}
+    for flag, value in _DATE_FLAG.findall(rest):
+        try:
+            datetime.strptime(value, "%Y-%m-%d")
+        except ValueError:
+            return f"  [!] Invalid date for --{flag}: {value} (use YYYY-MM-DD)"
+        bounds[flag] = value
+    query = _DATE_FLAG.sub("", rest).strip()
+    if not query:
+        return "  Usage: journal search <query> [--since YYYY-MM-DD] [--until YYYY-MM-DD]"
+
+    result = vault.journal_search(query, since=bounds.get("since"), until=bounds.get("until"))
+    if not result["results"]:
+        return f"  No matches for '{query}'"
+    lines = [
+        f"\n  Found {result['total_matches']} matches for '{query}' "
+        f"({result['total_entries']} entries, {result['elapsed_ms']:.1f}ms):"
+    ]
+    for r in result["results"]:
+        entries = f"{r['entries']} entr{'y' if r['entries'] == 1 else 'ies'}"
+        lines.append(f"    {r['date']}  ({entries}, score {r['score']}):")
+        for preview in r.get("preview", []):
+            lines.append(f"      {preview}")
+    return "\n".join(lines)
+
+
+def _parse_read_args(rest):
+    """
+    Parse [date] [--page N] [-n N] [--since D] [--until D] [--tag T | #T].
+    Returns (options dict, None) or (None, error message).
+    """
+    opts = {"date": None, "page": 1, "n": None, "since": None, "until": None, "tag": None}
+    tokens = rest.split()
+    i = 0
+    while i < len(tokens):
+        token = tokens[i]
+        if token in ("--page", "-n", "--since", "--until"):
+            if i + 1 >= len(tokens):
+                return None, f"  [!] {token} needs a value"
+            value = tokens[i + 1]
+            key = token.lstrip("-")
+            if key in ("page", "n"):
+                try:
+                    opts[key] = int(value)
+                except ValueError:
+                    return None, f"  [!] {token} expects a number: {value}"
+                if opts[key] < 1:
+                    return None, f"  [!] {token} must be at least 1"
+            elif not _valid_date(value):
+                return None, f"  [!] Invalid date for {token}: {value} (use YYYY-MM-DD)"
+            else:
+                opts[key] = value
+            i += 2
+            continue
+        if token == "--tag" or (token.startswith("#") and len(token) > 1):
+            if token == "--tag":
+                if i + 1 >= len(tokens):
+                    return None, "  [!] --tag needs a value"
+                token = tokens[i + 1]
+                i += 1
+            opts["tag"] = token.lstrip("#").lower()
+            i += 1
+            continue
+        if _DATE.match(token) and not _valid_date(token):
+            return None, f"  [!] Invalid date: {token}"
+        if opts["date"] is None and _valid_date(token):
+            opts["date"] = token
+        else:
+            return None, f"  [!] Unexpected argument: {token}"
+        i += 1
+    return opts, None
+
+
+def _valid_date(value):
+    if not _DATE.match(value):
+        return False
+    try:
+        datetime.strptime(value, "%Y-%m-%d")
+    except ValueError:
+        return False
+    return True
+
+
+def _show(vault, rest):
+    """journal show [date] [#tag] [--page N] [-n per_page] [--since D] [--until D]"""
+    opts, error = _parse_read_args(rest)
+    if error:
+        return error
+    kwargs = {"page": opts["page"], "since": opts["since"], "until": opts["until"],
+              "tag": opts["tag"]}
+    if opts["n"]:
+        kwargs["per_page"] = opts["n"]
+    result = vault.journal_page(date=opts["date"], **kwargs)
+
+    span = result["since"] if result["since"] == result["until"] else \
+        f"{result['since'] or '…'} → {result['until'] or '…'}"
+    if result["tag"]:
+        span += f" #{result['tag']}"
+    if not result["entries"]:
+        if result["page"] > 1:
+            return f"  No page {result['page']} for {span}"
+        return f"  No journal entries for {span}"
+
+    top = f"  ┌─ JOURNAL {span} · page {result['page']} ─┐"
+    lines = ["\n" + top]
+    lines.extend(_format_entries(result["entries"], with_date=result["since"] != result["until"]))
+    if result["has_more"]:
+        hint = ["journal show"]
+        if opts["date"]:
+            hint.append(opts["date"])
+        if opts["tag"]:
+            hint.append(f"#{opts['tag']}")
+        for flag in ("n", "since", "until"):
+            if opts[flag]:
+                hint.append(f"{'-n' if flag == 'n' else '--' + flag} {opts[flag]}")
+        hint.append(f"--page {result['page'] + 1}")
+        lines.append(f"  │ More: {' '.join(hint)}")
+    lines.append(_box_bottom(top))
+    return "\n".join(lines)
+
+
+def _tail(vault, rest):
+    """journal tail [#tag] [-n N] [--since D] [--until D]"""
+    opts, error = _parse_read_args(rest)
+    if error:
+        return error
+    if opts["date"]:
+        opts["since"] = opts["until"] = opts["date"]
+    kwargs = {"since": opts["since"], "until": opts["until"], "tag": opts["tag"]}
+    if opts["n"]:
+        kwargs["n"] = opts["n"]
+    result = vault.journal_tail(**kwargs)
+    if not result["entries"]:
+        if result["tag"]:
+            return f"  No journal entries tagged #{result['tag']}"
+        return "  No journal entries yet. Try: journal add Hello world!"
+
+    tagged = f" #{result['tag']}" if result["tag"] else ""
+    top = f"  ┌─ JOURNAL{tagged} · last {result['count']} entries ─┐"
+    lines = ["\n" + top]
+    lines.extend(_format_entries(result["entries"], with_date=True))
+    lines.append(_box_bottom(top))
+    return "\n".join(lines)
+
+
+def _box_bottom(top):
+    """Bottom border as wide as the (variable-width) top line."""
+    return "  └" + "─" * (len(top) - 4) + "┘"
+
+
+def _format_entries(entries, with_date=False):
+    """Box lines for a run of entries, a blank line between them."""
+    lines = []
+    for n, entry in enumerate(entries):
+        if n:
+            lines.append("  │")
+        stamp = entry["time"] or "--:--:--"
+        if with_date:
+            stamp = f"{entry['date']} {stamp}"
+        tags = "  " + " ".join(f"#{t}" for t in entry["tags"]) if entry["tags"] else ""
+        lines.append(f"  │ {stamp}{tags}")
+        for text in entry["text"].split("\n"):
+            lines.append(f"  │   {text}".rstrip())
+    return lines
@@ -12,7 +12,7 @@ Key Types:
 MANIFEST = {
     "name": "keys",
     "description": "Manage authentication keys",
-    "version": "1.0.0",
+    "version": "1.0.1",
     "usage": "keys list | keys issue <role> [label] | keys revoke <id> | keys info <id>",
     "author": "xsvStudio",
     "required_role": "ADMIN",
@@ -173,7 +173,7 @@ def _key_info(sec, key_id):
 def _whoami(sec):
     lines = [
         f"\n  Current Identity:",
-        f"    Role:    {sec.current_role}",
+        f"    Role:    {sec.effective_role}",
         f"    Key ID:  {sec.current_key_id}",
         f"    Auth:    {'Authenticated' if sec.authenticated else 'Not authenticated'}",
     ]
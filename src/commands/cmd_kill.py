@@ -0,0 +1,63 @@
+"""
+Command: kill
+Stop a background job (`kill %N`, `kill -9 %N`). Anything without a %job
+spec is passed through to the host's kill.
+"""
+
+MANIFEST = {
+    "name": "kill",
+    "description": "Stop a background job (or pass through to host kill)",
+    "version": "1.0.0",
+    "usage": "kill [-9|-KILL|-TERM|-INT] %N",
+    "author": "xsvStudio",
+    "required_role": "ADMIN",
+    "engine_deps": ["jobs", "root"],
+}
+DESCRIPTION = MANIFEST["description"]
+USAGE = MANIFEST["usage"]
+REQUIRED_ROLE = MANIFEST["required_role"]
+
+import signal
+
+
+def execute(kernel, args):
+    """Signal jobs by %spec; otherwise defer to the host."""
+    parts = args.split()
+    specs = [p for p in parts if p.startswith("%")]
+
+    if not specs:
+        root = kernel.get_engine("root")
+        if not parts or not root:
+            return f"  Usage: {USAGE}"
+        stdout, stderr = root.exec_silent(f"kill {args.strip()}")
+        return (stdout + stderr).rstrip() or None
+
+    jobs = kernel.get_engine("jobs")
+    if not jobs:
+        return "  [!] Job engine unavailable"
+
+    sig = signal.SIGTERM
+    flags = [p for p in parts if p.startswith("-")]
+    if flags:
+        sig = _parse_signal(flags[0][1:])
+        if sig is None:
+            return f"  [!] Unknown signal: {flags[0]}"
+
+    lines = []
+    for spec in specs:
+        ok, message = jobs.kill(spec, sig)
+        lines.append(f"  {'✓' if ok else '[!]'} {message}")
+    return "\n".join(lines)
+
+
+def _parse_signal(name):
+    """'9' / 'KILL' / 'SIGKILL' -> signal, or None."""
+    name = name.upper()
+    if name.isdigit():
+        try:
+            return signal.Signals(int(name))
+        except ValueError:
+            return None
+    if not name.startswith("SIG"):
+        name = "SIG" + name
+    return getattr(signal, name, None)
@@ -1,13 +1,14 @@
 """
 Command: net
-Network tools - check connectivity, interfaces, DNS.
+Network tools - check connectivity, interfaces, DNS, port scanning, traceroute,
+TCP throughput / RTT benchmarking, live interface throughput (net top).
 """
 
 MANIFEST = {
     "name": "net",
-    "description": "Network tools (check, interfaces, dns)",
-    "version": "1.0.0",
-    "usage": "net check | net interfaces | net dns <host>",
+    "description": "Network tools (check, interfaces, dns, scan, trace, bench, top)",
+    "version": "1.5.1",
+    "usage": "net check | net interfaces | net dns <host>... [-4|-6] | net dns --stats|--flush | net scan <host|cidr> [ports] [-c N] [-t s] [-r rate/s, 0=unlimited] | net trace <host> [-r rounds] [-m hops] [-n] | net bench <host|node|loopback> [-p port] [-t s] [-P 1,2,4] [-R] | net bench serve [bind] [-p port] | net bench stop | net top [-i iface] [-w [N]] [--stop]",
     "author": "xsvStudio",
     "required_role": "GUEST",
     "engine_deps": ["blackbox"],
@@ -16,6 +17,21 @@ DESCRIPTION = MANIFEST["description"]
 USAGE = MANIFEST["usage"]
 REQUIRED_ROLE = MANIFEST["required_role"]
 
+import os
+import re
+import socket
+import time
+
+_PORT_SPEC = re.compile(r'^(top|[\d,\-]+)$', re.IGNORECASE)
+# Default rounds (probes per hop) for net trace
+TRACE_ROUNDS = 5
+# net top: first-sample wait on a fresh monitor, -w refresh count, trend width
+TOP_FIRST_SAMPLE = 1.0
+TOP_WATCH_DEFAULT = 30
+TOP_SPARK_WIDTH = 20
+BENCH_USAGE = ("  Usage: net bench <host|node|loopback> [-p port] [-t sec] [-P 1,2,4] [-R]\n"
+               "         net bench serve [bind] [-p port] | net bench stop")
+
 
 def execute(kernel, args):
     """Network tools."""
@@ -29,7 +45,20 @@ def execute(kernel, args):
             "  Usage:\n"
             "    net check           Check internet connectivity\n"
             "    net interfaces      List network interfaces\n"
-            "    net dns <hostname>  Resolve a hostname"
+            "    net dns <host>... [-4|-6]\n"
+            "                        Resolve hostnames (cached, in parallel)\n"
+            "    net dns --stats | --flush\n"
+            "                        Resolver cache statistics / clear the cache\n"
+            "    net scan <host|cidr> [ports] [-c N] [-t sec] [-r rate] [--no-banner]\n"
+            "                        TCP connect scan (ports: 22,80 | 1-1024 | top)\n"
+            "    net trace <host> [-r rounds] [-m max_hops] [-n]\n"
+            "                        Parallel traceroute with per-hop loss/latency\n"
+            "    net bench <host|node|loopback> [-p port] [-t sec] [-P 1,2,4] [-R]\n"
+            "                        TCP throughput, RTT percentiles, stream scaling\n"
+            "    net bench serve [bind] [-p port] | net bench stop\n"
+            "                        Run the bench server other nodes measure against\n"
+            "    net top [-i iface] [-w [N]] [--stop]\n"
+            "                        Live interface throughput (-w: refresh N times)"
         )
 
     action = parts[0].lower()
@@ -50,12 +79,385 @@ def execute(kernel, args):
         return "\n".join(lines)
 
     elif action == "dns":
-        if len(parts) < 2:
-            return "  Usage: net dns <hostname>"
-        result = blackbox.resolve_dns(parts[1])
-        if result["resolved"]:
-            return f"  ✓ {result['hostname']} -> {result['ip']}"
-        return f"  ✗ Failed to resolve {result['hostname']}: {result.get('error', 'unknown')}"
+        return _dns(blackbox, parts[1:])
+
+    elif action == "scan":
+        return _scan(kernel, blackbox, parts[1:])
+
+    elif action in ("trace", "traceroute", "mtr"):
+        return _trace(blackbox, parts[1:])
+
+    elif action == "bench":
+        return _bench(kernel, blackbox, parts[1:])
+
+    elif action == "top":
+        return _top(kernel, blackbox, parts[1:])
 
     else:
         return f"  Unknown network action: {action}"
+
+
+def _dns(blackbox, parts):
+    """net dns - one or many names through BlackBox's resolver cache."""
+    if "--stats" in parts:
+        stats = blackbox.dns_stats()
+        lines = ["\n  ┌─ DNS CACHE ───────────────────────────────┐"]
+        lines.append(f"  │ Entries:  {stats['entries']} ({stats['negative_entries']} negative)")
+        lines.append(f"  │ Hits:     {stats['hits']}   negative hits: {stats['negative_hits']}"
+                     f"   misses: {stats['misses']}")
+        lines.append(f"  │ Hit rate: {stats['hit_rate_pct']}%   avg lookup: {stats['avg_lookup_ms']}ms")
+        lines.append(f"  │ TTL:      {stats['ttl_s']:g}s (failures {stats['negative_ttl_s']:g}s)")
+        lines.append("  └─────────────────────────────────────────┘")
+        return "\n".join(lines)
+    if "--flush" in parts:
+        return f"  ✓ DNS cache flushed ({blackbox.flush_dns_cache()} entries)"
+
+    family = socket.AF_UNSPEC
+    if "-4" in parts:
+        family = socket.AF_INET
+    elif "-6" in parts:
+        family = socket.AF_INET6
+    hosts = [p for p in parts if p not in ("-4", "-6")]
+    if not hosts:
+        return "  Usage: net dns <hostname> [hostname...] [-4|-6]"
+
+    results = blackbox.resolve_dns_many(hosts, family=family)
+    lines = []
+    for result in results:
+        if not result["resolved"]:
+            lines.append(f"  ✗ Failed to resolve {result['hostname']}: {result.get('error', 'unknown')}")
+            continue
+        source = "cached" if result["cached"] else f"{result['elapsed_ms']:.1f}ms"
+        lines.append(f"  ✓ {result['hostname']} -> {result['ip']}  ({source})")
+        for other in result["addresses"]:
+            if other != result["ip"]:
+                lines.append(f"      {other}")
+    return "\n".join(lines)
+
+
+def _scan(kernel, blackbox, parts):
+    """net scan - streams open ports as they are found, then a summary."""
+    sec = kernel.get_engine("security")
+    if sec and not sec.has_permission("ADMIN"):
+        return "  [!] Access Denied. net scan requires ADMIN role."
+
+    targets, port_spec = [], "top"
+    options = {"concurrency": None, "host_rate": None, "timeout": None}
+    flags = {"-c": "concurrency", "-r": "host_rate", "-t": "timeout"}
+    banner = True
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+        if part in flags and i + 1 < len(parts):
+            try:
+                options[flags[part]] = float(parts[i + 1])
+            except ValueError:
+                return f"  [!] Invalid value for {part}: {parts[i + 1]}"
+            i += 2
+            continue
+        if part == "--no-banner":
+            banner = False
+        elif targets and _PORT_SPEC.match(part):
+            port_spec = part
+        else:
+            targets.append(part)
+        i += 1
+
+    if not targets:
+        return "  Usage: net scan <host|cidr> [ports] [-c N] [-t sec] [-r rate] [--no-banner]"
+
+    kwargs = {"banner": banner}
+    if options["concurrency"]:
+        kwargs["concurrency"] = max(1, int(options["concurrency"]))
+    if options["host_rate"] is not None:
+        kwargs["host_rate"] = options["host_rate"]      # 0 = unlimited
+    if options["timeout"]:
+        kwargs["timeout"] = options["timeout"]
+
+    try:
+        ports = blackbox.parse_ports(port_spec)
+        hosts = blackbox.expand_targets(targets)
+    except ValueError as e:
+        return f"  [!] {e}"
+
+    print(f"  Scanning {len(hosts)} host(s) × {len(ports)} port(s)...")
+
+    def show(probe):
+        service = probe["service"] or "?"
+        banner_text = f"  {probe['banner']}" if probe["banner"] else ""
+        print(f"    ✓ {probe['host']}:{probe['port']:<6} {service:<12}"
+              f" {probe['latency_ms']:>7.1f}ms{banner_text}", flush=True)
+
+    report = blackbox.scan_ports(hosts, ports, on_result=show, **kwargs)
+
+    counts = report["counts"]
+    lines = ["\n  ┌─ PORT SCAN ───────────────────────────────┐"]
+    lines.append(f"  │ Hosts:    {len(report['targets'])}"
+                 + (f" ({len(report['unresolved'])} unresolved)" if report["unresolved"] else ""))
+    lines.append(f"  │ Probes:   {report['probes']} in {report['elapsed_s']}s")
+    lines.append(f"  │ Open:     {counts['open']}   closed: {counts['closed']}"
+                 f"   filtered: {counts['filtered']}   errors: {counts['error']}")
+    for host in report["unresolved"]:
+        lines.append(f"  │ [!] Could not resolve {host}")
+    lines.append("  └─────────────────────────────────────────┘")
+    return "\n".join(lines)
+
+
+def _trace(blackbox, parts):
+    """net trace - round progress live, then the mtr-style hop table."""
+    host, options, resolve = None, {}, True
+    flags = {"-r": "rounds", "-m": "max_hops"}
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+        if part in flags and i + 1 < len(parts):
+            try:
+                options[flags[part]] = max(1, int(parts[i + 1]))
+            except ValueError:
+                return f"  [!] Invalid value for {part}: {parts[i + 1]}"
+            i += 2
+            continue
+        if part == "-n":
+            resolve = False
+        elif host is None:
+            host = part
+        i += 1
+
+    if not host:
+        return "  Usage: net trace <host> [-r rounds] [-m max_hops] [-n]"
+
+    rounds = options.setdefault("rounds", TRACE_ROUNDS)
+    print(f"  Tracing {host} ({rounds} rounds, all hops probed in parallel)...")
+
+    def show(round_no, replies):
+        print(f"    round {round_no}/{rounds}: {len(replies)} hop(s) answered", flush=True)
+
+    result = blackbox.trace(host, resolve=resolve, on_round=show, **options)
+    if result.get("error"):
+        return f"  [!] {result['error']}"
+
+    lines = [f"\n  ┌─ TRACE {host} ({result['address']}) ─────────────────┐"]
+    lines.append(f"  │ {'Hop':>3}  {'Host':<38} {'Loss':>6} {'avg':>8} {'min':>8} {'max':>8} {'jitter':>8}")
+    for hop in result["hops"]:
+        name = hop["host"]
+        if hop["hostname"]:
+            name = f"{hop['hostname']} ({name})"
+        if hop["unreachable"]:
+            name += " !unreachable"
+        if len(name) > 38:
+            name = name[:37] + "…"
+        if hop["status"] == "UNREACHABLE":
+            lines.append(f"  │ {hop['ttl']:>3}. {name:<38} {'100%':>6} {'-':>8} {'-':>8} {'-':>8} {'-':>8}")
+            continue
+        lines.append(
+            f"  │ {hop['ttl']:>3}. {name:<38} {hop['loss_pct']:>5.0f}%"
+            f" {hop['average_ms']:>6.1f}ms {hop['min_ms']:>6.1f}ms"
+            f" {hop['max_ms']:>6.1f}ms {hop['jitter_ms']:>6.1f}ms"
+        )
+        for other in hop["addresses"][1:]:
+            lines.append(f"  │      {'also ' + other:<38}")
+    lines.append("  │")
+    status = "destination reached" if result["reached"] else "destination not reached"
+    lines.append(f"  │ {len(result['hops'])} hops · {status} · "
+                 f"{result['rounds']} rounds in {result['elapsed_s']}s")
+    lines.append("  └─────────────────────────────────────────┘")
+    return "\n".join(lines)
+
+
+def _bench(kernel, blackbox, parts):
+    """net bench - client run against a bench server, or manage the local server."""
+    target, options = None, {}
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+        if part in ("-p", "-t", "-P", "-n") and i + 1 < len(parts):
+            value = parts[i + 1]
+            try:
+                if part == "-p":
+                    options["port"] = int(value)
+                elif part == "-t":
+                    options["seconds"] = max(0.5, float(value))
+                elif part == "-n":
+                    options["rtt_count"] = max(1, int(value))
+                else:
+                    options["streams"] = [max(1, int(n)) for n in value.split(",")]
+            except ValueError:
+                return f"  [!] Invalid value for {part}: {value}"
+            i += 2
+            continue
+        if part == "-R":
+            options["reverse"] = True
+        elif target is None:
+            target = part
+        else:
+            options["bind"] = part
+        i += 1
+
+    if target is None:
+        return BENCH_USAGE
+
+    if target in ("serve", "stop"):
+        sec = kernel.get_engine("security")
+        if sec and not sec.has_permission("ADMIN"):
+            return f"  [!] Access Denied. net bench {target} requires ADMIN role."
+        if target == "stop":
+            return "  ✓ Bench server stopped" if blackbox.bench_stop() else "  Bench server not running"
+        result = blackbox.bench_serve(options.get("bind", "127.0.0.1"), options.get("port"))
+        if not result["ok"]:
+            return f"  [!] {result['error']}"
+        state = "already listening" if result.get("already_running") else "listening"
+        return (f"  ✓ Bench server {state} on {result['address']}:{result['port']}"
+                f"  (net bench stop to close)")
+
+    options.pop("bind", None)
+    loopback = target == "loopback"
+    if loopback:
+        # Private throwaway server on an ephemeral port - works offline and
+        # leaves a `net bench serve` server alone
+        options.pop("port", None)
+        print("  Benchmarking loopback (127.0.0.1, private server)...")
+    else:
+        host = target
+        legion = kernel.get_engine("legion")
+        node = legion.find_node(target) if legion else None
+        if node:
+            host = legion.node_host(node) or target
+        print(f"  Benchmarking {target} ({host}:{options.get('port', blackbox.bench_port)})...")
+
+    def show(stage, result):
+        if stage == "rtt":
+            if result.get("count"):
+                print(f"    RTT      p50 {result['p50_ms']:.3f}ms  p99 {result['p99_ms']:.3f}ms"
+                      f"  ({result['count']} round trips)", flush=True)
+        elif "error" in result:
+            print(f"    {result['streams']:>2} stream(s)  ✗ {result['error']}", flush=True)
+        else:
+            print(f"    {result['streams']:>2} stream(s)  {_rate(result['mbps'])}", flush=True)
+
+    if loopback:
+        report = blackbox.bench_loopback(on_progress=show, **options)
+    else:
+        report = blackbox.bench(host, on_progress=show, **options)
+    if report.get("error"):
+        return f"  [!] {report['error']}"
+
+    rtt = report["rtt"]
+    lines = [f"\n  ┌─ NET BENCH {target} ({report['direction']}) ─────────────────┐"]
+    lines.append(f"  │ RTT ({rtt['count']} × request/response)")
+    lines.append(f"  │   min {rtt['min_ms']:.3f}  avg {rtt['avg_ms']:.3f}  max {rtt['max_ms']:.3f}"
+                 f"  jitter {rtt['jitter_ms']:.3f} ms")
+    lines.append(f"  │   p50 {rtt['p50_ms']:.3f}  p90 {rtt['p90_ms']:.3f}  p99 {rtt['p99_ms']:.3f} ms")
+    lines.append("  │")
+    lines.append(f"  │ {'Streams':>7}  {'Throughput':>14}  {'Per stream':>14}  {'Data':>10}")
+    for result in report["throughput"]:
+        if "error" in result:
+            lines.append(f"  │ {result['streams']:>7}  ✗ {result['error']}")
+            continue
+        lines.append(f"  │ {result['streams']:>7}  {_rate(result['mbps']):>14}"
+                     f"  {_rate(result['per_stream_mbps']):>14}  {_size(result['bytes']):>10}")
+    if report["best_mbps"]:
+        scaling = f" ({report['scaling']}× one stream)" if report["scaling"] else ""
+        lines.append("  │")
+        lines.append(f"  │ Best: {_rate(report['best_mbps'])}{scaling}")
+        estimate = _vault_sync_estimate(kernel, report["best_mbps"])
+        if estimate:
+            lines.append(f"  │ {estimate}")
+    lines.append("  └─────────────────────────────────────────┘")
+    return "\n".join(lines)
+
+
+def _vault_sync_estimate(kernel, mbps):
+    """How long the vault would take to sync at the measured rate (None without a vault)."""
+    vault = kernel.get_engine("vault")
+    if not vault or mbps <= 0:
+        return None
+    total = 0
+    for dirpath, _dirs, files in os.walk(vault.vault_dir):
+        for name in files:
+            try:
+                total += os.path.getsize(os.path.join(dirpath, name))
+            except OSError:
+                pass
+    seconds = total * 8 / (mbps * 1e6)
+    duration = f"~{seconds:.1f}s" if seconds >= 0.1 else "<0.1s"
+    return f"Vault sync: {_size(total)} -> {duration} at this rate"
+
+
+def _rate(mbps):
+    return f"{mbps / 1000:.2f} Gbit/s" if mbps >= 1000 else f"{mbps:.1f} Mbit/s"
+
+
+def _size(n):
+    for unit in ("B", "KB", "MB", "GB"):
+        if n < 1024 or unit == "GB":
+            return f"{n:.0f} {unit}" if unit == "B" else f"{n:.1f} {unit}"
+        n /= 1024
+
+
+def _top(kernel, blackbox, parts):
+    """net top - interface rates from the traffic monitor's rings."""
+    if "--stop" in parts:
+        return "  ✓ Traffic monitor stopped" if blackbox.traffic_stop() else "  Traffic monitor not running"
+
+    iface_filter, watch = None, 0
+    i = 0
+    while i < len(parts):
+        if parts[i] == "-i" and i + 1 < len(parts):
+            iface_filter = parts[i + 1]
+            i += 1
+        elif parts[i] == "-w":
+            watch = TOP_WATCH_DEFAULT
+            if i + 1 < len(parts) and parts[i + 1].isdigit():
+                watch = int(parts[i + 1])
+                i += 1
+        i += 1
+
+    report = blackbox.traffic_rates()
+    if not report["running"]:
+        started = blackbox.traffic_start()
+        if not started["ok"]:
+            return f"  [!] {started['error']}"
+        print(f"  Traffic monitor started (every {started['interval']:g}s)")
+    report = blackbox.traffic_rates()
+    if report["samples"] < 2 or report["span_s"] < TOP_FIRST_SAMPLE:
+        # Fresh monitor: one short interval so there is a rate to show
+        blackbox.traffic_sample()
+        time.sleep(TOP_FIRST_SAMPLE)
+        blackbox.traffic_sample()
+
+    if not watch:
+        return _top_table(kernel, blackbox, iface_filter)
+
+    try:
+        for n in range(watch):
+            if n:
+                time.sleep(blackbox.traffic_rates()["interval"] or 1)
+            print(_top_table(kernel, blackbox, iface_filter), flush=True)
+    except KeyboardInterrupt:
+        pass
+    return None
+
+
+def _top_table(kernel, blackbox, iface_filter=None):
+    report = blackbox.traffic_rates(history=TOP_SPARK_WIDTH)
+    iface = kernel.get_engine("interface")
+    rows = [r for r in report["interfaces"]
+            if r["present"] and (iface_filter in (None, r["name"]))
+            and (iface_filter or r["rx_total"] or r["tx_total"])]
+
+    lines = [f"\n  ┌─ NET TOP ({report['samples']} samples over {report['span_s']:g}s) ────────────┐"]
+    lines.append(f"  │ {'Iface':<10} {'RX/s':>11} {'TX/s':>11} {'RX pk/s':>8} {'TX pk/s':>8}"
+                 f" {'RX peak':>11} {'TX peak':>11} {'err/drop':>9}  trend")
+    for r in rows:
+        history = [rx + tx for rx, tx in zip(r["history_rx"], r["history_tx"])]
+        trend = iface.format_sparkline(history, TOP_SPARK_WIDTH) if iface else ""
+        lines.append(
+            f"  │ {r['name'][:10]:<10} {_size(r['rx_bps']) + '/s':>11} {_size(r['tx_bps']) + '/s':>11}"
+            f" {r['rx_pps']:>8.0f} {r['tx_pps']:>8.0f}"
+            f" {_size(r['rx_peak_bps']) + '/s':>11} {_size(r['tx_peak_bps']) + '/s':>11}"
+            f" {str(r['errors']) + '/' + str(r['drops']):>9}  {trend}"
+        )
+    if not rows:
+        lines.append(f"  │ (no {'interface ' + iface_filter if iface_filter else 'active interfaces'})")
+    lines.append("  └─────────────────────────────────────────┘")
+    return "\n".join(lines)
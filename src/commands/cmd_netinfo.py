@@ -1,12 +1,14 @@
 """
 Command: netinfo
 Detailed network diagnostics — interfaces, gateway, DNS, connectivity.
+On Linux everything is read from /proc and /sys (no subprocess) and the
+connectivity check is a cached background probe, so it answers in ms.
 """
 
 MANIFEST = {
     "name": "netinfo",
     "description": "Show network info (IPs, DNS, gateway)",
-    "version": "1.0.0",
+    "version": "1.1.0",
     "usage": "netinfo | netinfo flush",
     "author": "xsvStudio",
     "required_role": "GUEST",
@@ -28,16 +30,30 @@ def execute(kernel, args):
     if subcmd == "flush":
         success, msg = root.flush_dns()
         icon = "✓" if success else "✗"
-        return f"  {icon} {msg}"
+        output = f"  {icon} {msg}"
+        blackbox = kernel.get_engine("blackbox")
+        if blackbox:
+            output += f"\n  ✓ Ghost resolver cache cleared ({blackbox.flush_dns_cache()} entries)"
+        return output
 
     # Full network report
     info = root.get_network_info()
     lines = ["\n  ┌─ NETWORK INFO ─────────────────────────────┐"]
 
-    # Connectivity
-    conn_icon = "✓" if info["internet"] else "✗"
-    lines.append(f"  │ Internet:  {conn_icon} {'Connected' if info['internet'] else 'Offline'}")
-    lines.append(f"  │ Gateway:   {info.get('gateway') or 'unknown'}")
+    # Connectivity (cached background probe - never blocks for long)
+    internet = info["internet"]
+    if internet is None:
+        conn = "… checking (run netinfo again in a moment)"
+    else:
+        conn = "✓ Connected" if internet else "✗ Offline"
+        age = info.get("internet_age_s")
+        if age and age >= 1:
+            conn += f" (checked {age:.0f}s ago)"
+    lines.append(f"  │ Internet:  {conn}")
+    gateway = info.get("gateway") or "unknown"
+    if info.get("gateway_iface"):
+        gateway += f" via {info['gateway_iface']}"
+    lines.append(f"  │ Gateway:   {gateway}")
 
     # DNS servers
     dns = info.get("dns_servers", [])
@@ -57,8 +73,10 @@ def execute(kernel, args):
         ips = iface.get("ips", [])
         if not ips:
             continue
+        state = iface.get("state")
+        state = f"  ({state})" if state and state != "unknown" else ""
         for ip in ips:
-            lines.append(f"  │   {iface['name'][:20]:<20} {ip}")
+            lines.append(f"  │   {iface['name'][:20]:<20} {ip:<16}{state}")
             shown += 1
         if shown >= 8:
             break
@@ -1,13 +1,16 @@
 """
 Command: ping
 Enhanced ping with jitter/variance analysis via BlackBoxEngine.
+Replies render live as they arrive; without a usable ping binary it falls
+back to TCP-connect latency. Several hosts, a CIDR block or the Legion node
+list are probed in parallel.
 """
 
 MANIFEST = {
     "name": "ping",
     "description": "Ping with jitter analysis",
-    "version": "1.0.0",
-    "usage": "ping <host> [count]",
+    "version": "1.2.0",
+    "usage": "ping <host> [count] [-i interval] | ping <host|cidr> <host|cidr>... [count] | ping nodes [count]",
     "author": "xsvStudio",
     "required_role": "GUEST",
     "engine_deps": ["blackbox", "interface", "vault"],
@@ -16,27 +19,62 @@ DESCRIPTION = MANIFEST["description"]
 USAGE = MANIFEST["usage"]
 REQUIRED_ROLE = MANIFEST["required_role"]
 
+import time
+
+
+# Default packets per host when sweeping many hosts
+SWEEP_COUNT_DEFAULT = 1
+# Live reply bar: one cell per this many ms (capped at BAR_MAX cells)
+BAR_MS_PER_CELL = 5
+BAR_MAX = 40
+
 
 def execute(kernel, args):
     """Execute enhanced ping."""
     parts = args.strip().split()
     if not parts:
-        return "  Usage: ping <host> [count]\n  Example: ping 8.8.8.8 10"
+        return (
+            "  Usage: ping <host> [count] [-i interval]\n"
+            "         ping <host|cidr> <host|cidr>... [count]\n"
+            "         ping nodes [count]\n"
+            "  Example: ping 8.8.8.8 10  |  ping 192.168.1.0/24"
+        )
 
-    host = parts[0]
-    count = 4
-    if len(parts) > 1:
+    targets = []
+    count = None
+    interval = 1.0
+    i = 0
+    while i < len(parts):
+        part = parts[i]
+        if part == "-i" and i + 1 < len(parts):
+            try:
+                interval = float(parts[i + 1])
+            except ValueError:
+                return f"  [!] Invalid interval: {parts[i + 1]}"
+            i += 2
+            continue
         try:
-            count = int(parts[1])
+            count = int(part)
         except ValueError:
-            pass
+            targets.append(part)
+        i += 1
 
     blackbox = kernel.get_engine("blackbox")
     if not blackbox:
         return "  [!] BlackBox engine not available"
 
+    if targets == ["nodes"]:
+        return _ping_nodes(kernel, blackbox, count or SWEEP_COUNT_DEFAULT)
+    if len(targets) > 1 or any("/" in t for t in targets):
+        return _ping_sweep(blackbox, targets, count or SWEEP_COUNT_DEFAULT)
+    if not targets:
+        return "  Usage: ping <host> [count]"
+
+    host = targets[0]
+    count = count or 4
+
     print(f"  Pinging {host} ({count} packets)...")
-    result = blackbox.ping(host, count=count)
+    result = blackbox.ping(host, count=count, interval=interval, on_reply=_show_reply)
 
     # Format output
     iface = kernel.get_engine("interface")
@@ -44,6 +82,9 @@ def execute(kernel, args):
         output = iface.format_ping_result(result)
     else:
         output = f"  {result}"
+    method = result.get("method", "icmp")
+    if method != "icmp":
+        output += f"\n    (TCP connect latency via {method} - ping unavailable or not permitted)"
 
     # Log to vault if available
     vault = kernel.get_engine("vault")
@@ -54,3 +95,65 @@ def execute(kernel, args):
         )
 
     return output
+
+
+def _show_reply(seq, ms):
+    """Render one reply as it arrives."""
+    if ms is None:
+        print(f"    #{seq:<3} ✗ no reply", flush=True)
+    else:
+        bar = "▇" * max(1, min(BAR_MAX, int(ms / BAR_MS_PER_CELL)))
+        print(f"    #{seq:<3} {ms:>8.2f}ms  {bar}", flush=True)
+
+
+def _ping_sweep(blackbox, targets, count, labels=None):
+    """Ping many hosts in parallel and tabulate the results."""
+    try:
+        hosts = blackbox.expand_targets(targets)
+    except ValueError as e:
+        return f"  [!] {e}"
+
+    is_sweep = any("/" in t for t in targets)
+    print(f"  Pinging {len(hosts)} hosts in parallel ({count} packet{'s' if count != 1 else ''} each)...")
+    start = time.perf_counter()
+    results = blackbox.ping_many(hosts, count=count, timeout=1 if is_sweep else 2)
+    elapsed = time.perf_counter() - start
+
+    up = [r for r in results if r["status"] != "UNREACHABLE"]
+    # A CIDR sweep lists only live hosts; an explicit list shows every host
+    shown = up if is_sweep else results
+
+    lines = ["\n  ┌─ PING SWEEP ──────────────────────────────┐"]
+    lines.append(f"  │ {'Host':<22} {'Status':<12} {'avg':>8} {'min':>8} {'max':>8} {'jitter':>8} {'loss':>6}")
+    for r in shown:
+        name = r["host"]
+        if labels and labels.get(name):
+            name = f"{labels[name]} ({name})"
+        if r["status"] == "UNREACHABLE":
+            lines.append(f"  │ ✗ {name:<20} {'UNREACHABLE':<12} {'-':>8} {'-':>8} {'-':>8} {'-':>8} {'100%':>6}")
+            continue
+        icon = "✓" if r["status"] == "STABLE" else "⚠"
+        lines.append(
+            f"  │ {icon} {name:<20} {r['status']:<12} {r['average_ms']:>6.1f}ms"
+            f" {r['min_ms']:>6.1f}ms {r['max_ms']:>6.1f}ms {r['jitter_ms']:>6.1f}ms {r['loss_pct']:>5.0f}%"
+        )
+    lines.append("  │")
+    lines.append(f"  │ {len(up)}/{len(results)} hosts up · {elapsed:.1f}s")
+    lines.append("  └─────────────────────────────────────────┘")
+    return "\n".join(lines)
+
+
+def _ping_nodes(kernel, blackbox, count):
+    """Ping every known Legion node."""
+    legion = kernel.get_engine("legion")
+    if not legion:
+        return "  [!] Legion engine not loaded"
+
+    labels = {}
+    for node in legion.list_nodes():
+        host = legion.node_host(node)
+        if host:
+            labels[host] = node.get("label") or node.get("node_id")
+    if not labels:
+        return "  No Legion nodes registered (legion register <address>)"
+    return _ping_sweep(blackbox, list(labels), count, labels=labels)
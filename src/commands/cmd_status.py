@@ -1,13 +1,14 @@
 """
 Command: status
 System health dashboard — engines, commands by tier, boot diagnostics, vault stats.
+`status boot` shows the boot profile: slowest phases/engines vs previous boots.
 """
 
 MANIFEST = {
     "name": "status",
     "description": "Show system health status",
-    "version": "2.0.0",
-    "usage": "status",
+    "version": "2.1.3",
+    "usage": "status | status boot [N]",
     "author": "xsvStudio",
     "required_role": "GUEST",
     "engine_deps": ["ghost_core", "security", "heartbeat", "vault", "legion", "eve"],
@@ -17,8 +18,16 @@ USAGE = MANIFEST["usage"]
 REQUIRED_ROLE = MANIFEST["required_role"]
 
 
+# Default number of previous boots to compare against in `status boot`
+BOOT_COMPARE_DEFAULT = 5
+
+
 def execute(kernel, args):
     """Display system status."""
+    parts = args.strip().split()
+    if parts and parts[0].lower() == "boot":
+        return _boot_report(kernel, parts[1:])
+
     lines = []
 
     # ── System / Node ──────────────────────────────────────────────────────────
@@ -39,7 +48,7 @@ def execute(kernel, args):
     # ── Security ───────────────────────────────────────────────────────────────
     sec = kernel.get_engine("security")
     if sec:
-        lines.append(f"  │ Role:     {sec.current_role}")
+        lines.append(f"  │ Role:     {sec.effective_role}")
         lines.append(f"  │ Auth:     {'Yes' if sec.authenticated else 'No'}")
 
     # ── Health ─────────────────────────────────────────────────────────────────
@@ -57,7 +66,9 @@ def execute(kernel, args):
     lines.append("  │")
     lines.append("  │ Engines:")
     for name, engine in kernel.engines.items():
-        if engine is not None:
+        if kernel.is_lazy(name):
+            lines.append(f"  │   ◌ {name:<14} lazy (not loaded yet)")
+        elif engine is not None:
             ver = getattr(engine, 'ENGINE_VERSION', '?')
             lines.append(f"  │   ✓ {name:<14} v{ver}")
         else:
@@ -107,10 +118,13 @@ def execute(kernel, args):
         diag = heartbeat.get_last_diagnostics()
         if diag:
             lines.append("  │")
+            scanned = ""
+            if "files_checked" in diag:
+                scanned = f" ({diag['files_checked']} files, {diag['files_rechecked']} re-checked)"
             if diag["clean"]:
-                lines.append("  │ Boot Diagnostics: ✓ Clean")
+                lines.append(f"  │ Boot Diagnostics: ✓ Clean{scanned}")
             else:
-                lines.append("  │ Boot Diagnostics: ⚠ Issues found")
+                lines.append(f"  │ Boot Diagnostics: ⚠ Issues found{scanned}")
                 for err in diag.get("syntax_errors", []):
                     lines.append(f"  │   [syntax] {err['file']}")
                 for d in diag.get("missing_dirs", []):
@@ -125,13 +139,14 @@ def execute(kernel, args):
         lines.append(f"  │ Todos:    {stats['active_todos']} active, {stats['completed_todos']} done")
 
     # ── Legion ─────────────────────────────────────────────────────────────────
-    legion = kernel.get_engine("legion")
+    # Deferred engines are reported as-is; status must not force them to boot
+    legion = None if kernel.is_lazy("legion") else kernel.get_engine("legion")
     if legion:
         lstatus = legion.get_status()
         lines.append(f"  │ Legion:   {'Online' if lstatus['operational'] else 'Standby'} ({lstatus['known_nodes']} nodes)")
 
     # ── Eve AI ─────────────────────────────────────────────────────────────────
-    eve = kernel.get_engine("eve")
+    eve = None if kernel.is_lazy("eve") else kernel.get_engine("eve")
     if eve:
         estatus = eve.get_status()
         lines.append(f"  │ Eve AI:   Tier={estatus['active_tier']} Ollama={'✓' if estatus['ollama_local'] else '✗'}")
@@ -139,3 +154,95 @@ def execute(kernel, args):
     lines.append("  └─────────────────────────────────────────┘")
 
     return "\n".join(lines)
+
+
+def _boot_report(kernel, args):
+    """Boot timing breakdown for this session, compared with the previous N boots."""
+    current = kernel.boot_profile
+    if not current:
+        return "  [!] No boot profile recorded for this session"
+
+    count = BOOT_COMPARE_DEFAULT
+    if args:
+        try:
+            count = max(1, int(args[0]))
+        except ValueError:
+            return "  Usage: status boot [N]"
+
+    heartbeat = kernel.get_engine("heartbeat")
+    history = heartbeat.get_boot_history() if heartbeat else []
+    # By session id: the history holds a re-serialized copy of this boot
+    previous = [p for p in history if p.get("session_id") != current["session_id"]][-count:]
+
+    mode = "parallel" if current.get("parallel") else "serial"
+    if current.get("lazy"):
+        mode += ", lazy"
+
+    lines = ["\n  ┌─ BOOT PROFILE ─────────────────────────────┐"]
+    lines.append(f"  │ Session:  {current['session_id']} ({mode})")
+
+    total_line = f"  │ Total:    {current['total_ms']:.1f}ms"
+    if previous:
+        avg_total = _avg(p.get("total_ms") for p in previous)
+        total_line += f"   vs avg {avg_total:.1f}ms of last {len(previous)} {_delta(current['total_ms'], avg_total)}"
+    lines.append(total_line)
+
+    # ── Phases ─────────────────────────────────────────────────────────────────
+    lines.append("  │")
+    lines.append("  │ Phases:")
+    for phase, ms in sorted(current.get("phases", {}).items(), key=lambda kv: kv[1], reverse=True):
+        line = f"  │   {phase:<14} {ms:>8.1f}ms"
+        if previous:
+            avg_ms = _avg(p.get("phases", {}).get(phase) for p in previous)
+            if avg_ms is not None:
+                line += f"   avg {avg_ms:>7.1f}ms {_delta(ms, avg_ms)}"
+        lines.append(line)
+
+    # ── Slowest engines ────────────────────────────────────────────────────────
+    engines = current.get("engines", {})
+    if engines:
+        lines.append("  │")
+        lines.append("  │ Slowest engines:        import / init")
+        ranked = sorted(engines.items(), key=lambda kv: kv[1]["total_ms"], reverse=True)
+        for name, t in ranked[:8]:
+            line = (
+                f"  │   {name:<12} {t['total_ms']:>8.1f}ms"
+                f"  {t['import_ms']:>6.1f} / {t['init_ms']:<7.1f}"
+            )
+            if previous:
+                avg_ms = _avg(p.get("engines", {}).get(name, {}).get("total_ms") for p in previous)
+                if avg_ms is not None:
+                    line += f" avg {avg_ms:>7.1f}ms {_delta(t['total_ms'], avg_ms)}"
+            lines.append(line.rstrip())
+
+    # ── Previous boots ─────────────────────────────────────────────────────────
+    if previous:
+        lines.append("  │")
+        lines.append(f"  │ Previous boots ({len(previous)}):")
+        for p in reversed(previous):
+            slowest = max(
+                p.get("engines", {}).items(),
+                key=lambda kv: kv[1].get("total_ms", 0),
+                default=(None, None),
+            )[0]
+            lines.append(
+                f"  │   {p.get('session_id', '?'):<16} {p.get('total_ms', 0):>8.1f}ms"
+                f"  slowest: {slowest or '-'}"
+            )
+
+    lines.append("  └────────────────────────────────────────────┘")
+    return "\n".join(lines)
+
+
+def _avg(values):
+    """Mean of the non-None values, or None if there are none."""
+    values = [v for v in values if v is not None]
+    return sum(values) / len(values) if values else None
+
+
+def _delta(value, baseline):
+    """Format a percentage change against a baseline, e.g. (+12.5%)."""
+    if not baseline:
+        return ""
+    pct = (value - baseline) / baseline * 100
+    return f"({pct:+.1f}%)"
@@ -1,13 +1,15 @@
 """
 Command: sysinfo
 Display detailed system information about the host machine.
+`sysinfo shell` manages the shell coprocess and benchmarks it against Popen;
+switching it and benchmarking (which runs host commands) need ADMIN.
 """
 
 MANIFEST = {
     "name": "sysinfo",
     "description": "Show host system information",
-    "version": "2.0.0",
-    "usage": "sysinfo",
+    "version": "2.1.1",
+    "usage": "sysinfo | sysinfo shell [on|off] | sysinfo shell bench [N] [cmd]",
     "author": "xsvStudio",
     "required_role": "GUEST",
     "engine_deps": ["ghost_core", "root"],
@@ -21,8 +23,16 @@ import sys
 import os
 
 
+# Default call count for `sysinfo shell bench`
+BENCH_RUNS_DEFAULT = 50
+
+
 def execute(kernel, args):
     """Show system information."""
+    parts = args.strip().split()
+    if parts and parts[0].lower() == "shell":
+        return _shell(kernel, parts[1:])
+
     lines = [
         "\n  ┌─ SYSTEM INFO ─────────────────────────────┐",
         f"  │ OS:           {platform.system()} {platform.release()}",
@@ -74,3 +84,73 @@ def execute(kernel, args):
 
     lines.append("  └─────────────────────────────────────────┘")
     return "\n".join(lines)
+
+
+def _shell(kernel, parts):
+    """Shell coprocess status / toggle / benchmark."""
+    root = kernel.get_engine("root")
+    if not root:
+        return "  [!] Root engine unavailable"
+
+    action = parts[0].lower() if parts else "status"
+    if action in ("on", "off", "bench"):
+        # Session-wide switch / arbitrary host commands: not for GUEST callers
+        sec = kernel.get_engine("security")
+        if sec and not sec.has_permission("ADMIN"):
+            return f"  [!] Access Denied. sysinfo shell {action} requires ADMIN role."
+
+    if action in ("on", "off"):
+        enabled = root.set_coprocess(action == "on")
+        if action == "on" and not enabled:
+            return "  [!] Shell coprocess needs a POSIX shell (not available on this host)"
+        return f"  ✓ Shell coprocess {'enabled' if enabled else 'disabled'} for this session"
+
+    if action == "bench":
+        runs = BENCH_RUNS_DEFAULT
+        rest = parts[1:]
+        if rest and rest[0].isdigit():
+            runs = int(rest[0])
+            rest = rest[1:]
+        cmd = " ".join(rest) or "true"
+        return _bench_report(root.benchmark_exec(runs, cmd))
+
+    status = root.get_coprocess_status()
+    state = "enabled" if status["enabled"] else "disabled"
+    if not status["supported"]:
+        state = "unsupported on this host"
+    lines = [
+        "\n  ┌─ SHELL COPROCESS ─────────────────────────┐",
+        f"  │ State:     {state}",
+        f"  │ Shell:     {status['shell'] or '-'}",
+        f"  │ Running:   {'pid ' + str(status['pid']) if status['alive'] else 'no'}",
+        f"  │ Commands:  {status['commands']} ({status['restarts']} restarts)",
+        "  │",
+        "  │ sysinfo shell on|off · sysinfo shell bench [N] [cmd]  (ADMIN)",
+        "  │ Persist with \"shell_coprocess\": true in settings.json",
+        "  └─────────────────────────────────────────┘",
+    ]
+    return "\n".join(lines)
+
+
+def _bench_report(bench):
+    if bench["error"]:
+        return f"  {bench['error']} ({bench['cmd']})"
+    lines = [
+        "\n  ┌─ EXEC LATENCY ────────────────────────────┐",
+        f"  │ Command:   {bench['cmd']}  ({bench['runs']} calls each)",
+        "  │",
+        f"  │ {'':<12}{'median':>9}{'mean':>9}{'p95':>9}{'min':>9}",
+    ]
+    for label, stats in (("Popen", bench["popen"]), ("Coprocess", bench["coprocess"])):
+        if stats is None:
+            lines.append(f"  │ {label:<12}{'n/a':>9}")
+            continue
+        lines.append(
+            f"  │ {label:<12}{stats['median_ms']:>7.2f}ms{stats['mean_ms']:>7.2f}ms"
+            f"{stats['p95_ms']:>7.2f}ms{stats['min_ms']:>7.2f}ms"
+        )
+    if bench["speedup"]:
+        lines.append("  │")
+        lines.append(f"  │ Coprocess is {bench['speedup']}x faster per call (median)")
+    lines.append("  └─────────────────────────────────────────┘")
+    return "\n".join(lines)
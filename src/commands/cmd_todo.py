@@ -1,13 +1,16 @@
 """
 Command: todo
 Task management with priorities.
+Storage is the vault's todo backend: JSON by default, or SQLite with
+"vault_todo_backend": "sqlite" in settings.json. Switching back to json
+exports the SQLite rows to active.json at the next boot.
 """
 
 MANIFEST = {
     "name": "todo",
     "description": "Manage todo items",
-    "version": "1.0.0",
-    "usage": "todo add <text> | todo list | todo done <id> | todo rm <id>",
+    "version": "1.2.1",
+    "usage": "todo add <text> | todo list [all] [priority] | todo done <id> | todo rm <id> | todo backend",
     "author": "xsvStudio",
     "required_role": "GUEST",
     "engine_deps": ["vault", "interface"],
@@ -17,6 +20,9 @@ USAGE = MANIFEST["usage"]
 REQUIRED_ROLE = MANIFEST["required_role"]
 
 
+PRIORITIES = ("critical", "high", "normal", "low")
+
+
 def execute(kernel, args):
     """Manage todos."""
     vault = kernel.get_engine("vault")
@@ -55,8 +61,13 @@ def execute(kernel, args):
         return f"  ✓ Todo #{item['id']} added ({priority}): {rest}"
 
     elif action == "list":
-        show_done = rest.strip().lower() == "all"
-        result = vault.todo_list(show_done=show_done)
+        words = rest.lower().split()
+        show_done = "all" in words
+        priority = next((w for w in words if w in PRIORITIES), None)
+        unknown = [w for w in words if w != "all" and w not in PRIORITIES]
+        if unknown:
+            return f"  Usage: todo list [all] [{'|'.join(PRIORITIES)}]"
+        result = vault.todo_list(show_done=show_done, priority=priority)
         iface = kernel.get_engine("interface")
         if iface:
             return iface.format_todo_list(result["items"])
@@ -81,5 +92,25 @@ def execute(kernel, args):
             return f"  ✓ Todo #{todo_id} removed"
         return f"  [!] Todo #{todo_id} not found"
 
+    elif action == "backend":
+        info = vault.todo_backend_info()
+        lines = [
+            "\n  ┌─ TODO STORAGE ─────────────────────────┐",
+            f"  │ Backend:   {info['backend']}",
+            f"  │ File:      {info['path']}",
+            f"  │ Active:    {info['active']}",
+            f"  │ Completed: {info['completed']}",
+        ]
+        if "wal_records" in info:
+            lines.append(f"  │ WAL:       {info['wal_records']} records ({info['wal_bytes']} bytes) since last compaction")
+        migrated = info.get("migrated")
+        if migrated and migrated.get("items"):
+            lines.append(f"  │ Migrated:  {migrated['items']} items from active.json ({migrated['at'][:19]})")
+        lines.append("  │")
+        lines.append('  │ Switch with "vault_todo_backend": "json" | "sqlite" in settings.json')
+        lines.append("  │ sqlite imports active.json; back to json exports todos.db (kept as todos.db.exported)")
+        lines.append("  └─────────────────────────────────────────┘")
+        return "\n".join(lines)
+
     else:
-        return f"  Unknown todo action: {action}\n  Try: todo add, list, done, rm"
+        return f"  Unknown todo action: {action}\n  Try: todo add, list, done, rm, backend"
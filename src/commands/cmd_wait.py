@@ -0,0 +1,43 @@
+"""
+Command: wait
+Block until background jobs finish (all running jobs, or one %N).
+"""
+
+MANIFEST = {
+    "name": "wait",
+    "description": "Wait for background jobs to finish",
+    "version": "1.0.0",
+    "usage": "wait [%N]",
+    "author": "xsvStudio",
+    "required_role": "GUEST",
+    "engine_deps": ["jobs"],
+}
+DESCRIPTION = MANIFEST["description"]
+USAGE = MANIFEST["usage"]
+REQUIRED_ROLE = MANIFEST["required_role"]
+
+
+def execute(kernel, args):
+    """Wait for jobs."""
+    jobs = kernel.get_engine("jobs")
+    if not jobs:
+        return "  [!] Job engine unavailable"
+
+    spec = args.strip() or None
+    try:
+        finished = jobs.wait(spec)
+    except KeyError:
+        return f"  [!] No such job: {spec}"
+    except KeyboardInterrupt:
+        return "\n  Stopped waiting (jobs still running - see `jobs`)"
+
+    if not finished:
+        return "  No running jobs"
+
+    lines = []
+    for job in finished:
+        status = job["state"]
+        if job["returncode"] not in (None, 0):
+            status += f", exit {job['returncode']}"
+        lines.append(f"  [{job['id']}] {status:<14} {job['elapsed']:>7.1f}s  {job['command']}")
+    return "\n".join(lines)
@@ -0,0 +1,489 @@
+"""
+Engine 14: API Engine - The Gateway
+=====================================
+Local command API. Exposes the kernel's resolution chain and engine status
+over a Unix domain socket and a localhost HTTP port, so editors, scripts
+and other tools can drive a running Ghost Shell without a terminal.
+
+Transports (configured under "api" in data/config/settings.json):
+  Unix socket   one JSON object per line, one JSON reply per line
+                {"op": "execute", "command": "status"} | {"op": "status"}
+  HTTP          POST /execute  {"command": "status"}
+                GET  /status   GET /health
+
+Auth:
+- HTTP callers must present a key secret (Authorization: Bearer <secret>)
+- Unix socket callers act as the session owner (socket is 0600, in a
+  per-user 0700 dir when "auto");
+  they may send "token" to act as that key's role instead
+- Every command is checked with SecurityEngine.has_permission against the
+  caller's role. Aliases, library scripts and host passthrough require
+  "passthrough_role" (ADMIN by default).
+
+Compartmentalization:
+- Own asyncio loop in a daemon thread; commands run on a bounded worker
+  pool, never on the loop, and overflow is rejected (busy) not queued
+- Binds to localhost only
+- MUST NOT bypass resolve_and_execute or the kernel's permission checks
+"""
+
+import os
+import json
+import stat
+import socket
+import asyncio
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+
+DEFAULT_API_SETTINGS = {
+    "enabled": False,           # start automatically at boot
+    "host": "127.0.0.1",
+    "port": 8765,               # 0/null disables HTTP
+    "unix_socket": "auto",      # path, "auto" (per-user dir in host temp) or null
+    "workers": 4,               # commands executing at once
+    "max_pending": 16,          # executing + waiting; beyond this -> busy
+    "timeout": 120,             # seconds before a request gets a 504
+    "passthrough_role": "ADMIN",
+}
+
+MAX_BODY = 64 * 1024
+MAX_HEADERS = 64
+LOCAL_HOSTS = ("127.0.0.1", "::1", "localhost")
+
+HTTP_REASONS = {
+    200: "OK", 400: "Bad Request", 401: "Unauthorized", 403: "Forbidden",
+    404: "Not Found", 405: "Method Not Allowed", 413: "Payload Too Large",
+    503: "Service Unavailable", 504: "Gateway Timeout",
+}
+
+
+class ApiEngine:
+    """The Gateway - local command API."""
+
+    ENGINE_NAME = "api"
+    ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = ["ghost_core", "security"]
+
+    def __init__(self, kernel):
+        self.kernel = kernel
+        self.root_dir = kernel.root_dir
+        self.config = dict(DEFAULT_API_SETTINGS)
+        self.config.update(kernel.settings.get("api") or {})
+
+        self.running = False
+        self.started_at = None
+        self.http_address = None
+        self.unix_path = None
+        self.errors = []
+        self.stats = {"requests": 0, "executed": 0, "denied": 0, "busy": 0, "timeouts": 0}
+
+        self._thread = None
+        self._loop = None
+        self._servers = []
+        self._executor = None
+        self._slots = None
+        self._active = 0
+        self._lock = threading.Lock()
+
+        kernel.on("shutdown", lambda _data: self.stop())
+
+    @property
+    def autostart(self):
+        return bool(self.config.get("enabled"))
+
+    # =========================================================================
+    # LIFECYCLE
+    # =========================================================================
+
+    def start(self):
+        """
+        Start the API server thread. Returns get_status(); transports that
+        failed to bind are listed under "errors".
+        """
+        with self._lock:
+            if self.running:
+                return self.get_status()
+            self.errors = []
+            ready = threading.Event()
+            self._thread = threading.Thread(
+                target=self._serve, args=(ready,), daemon=True, name="GhostAPI"
+            )
+            self._thread.start()
+        ready.wait(5)
+        return self.get_status()
+
+    def stop(self):
+        """Stop the server and remove the Unix socket."""
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            if not self.running or loop is None:
+                return False
+            self.running = False
+        loop.call_soon_threadsafe(loop.stop)
+        if thread and thread is not threading.current_thread():
+            thread.join(5)
+        return True
+
+    def get_status(self):
+        """Server state and counters."""
+        return {
+            "running": self.running,
+            "http": self.http_address,
+            "unix_socket": self.unix_path,
+            "workers": self._workers(),
+            "max_pending": self._max_pending(),
+            "active": self._active,
+            "uptime": round(time.time() - self.started_at, 1) if self.running else 0,
+            "stats": dict(self.stats),
+            "errors": list(self.errors),
+        }
+
+    def _serve(self, ready):
+        """Server thread: own event loop until stop()."""
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        self._loop = loop
+        self._executor = ThreadPoolExecutor(
+            max_workers=self._workers(), thread_name_prefix="GhostAPIWorker"
+        )
+        try:
+            loop.run_until_complete(self._open_servers())
+            if self._servers:
+                self.running = True
+                self.started_at = time.time()
+            ready.set()
+            if self.running:
+                loop.run_forever()
+        finally:
+            ready.set()
+            self.running = False
+            for server in self._servers:
+                server.close()
+            try:
+                # Drop open connections, then let the servers finish closing
+                tasks = asyncio.all_tasks(loop)
+                for task in tasks:
+                    task.cancel()
+                loop.run_until_complete(asyncio.gather(*tasks, return_exceptions=True))
+                loop.run_until_complete(self._close_servers())
+            except Exception:
+                pass
+            self._servers = []
+            self._executor.shutdown(wait=False)
+            loop.close()
+            self._loop = None
+            self._remove_socket()
+            self.http_address = None
+            self.unix_path = None
+
+    async def _open_servers(self):
+        self._slots = asyncio.Semaphore(self._max_pending())
+
+        port = self.config.get("port")
+        host = self.config.get("host") or "127.0.0.1"
+        if port:
+            if host not in LOCAL_HOSTS:
+                self.errors.append(f"http: refusing non-local host {host}")
+            else:
+                try:
+                    server = await asyncio.start_server(self._handle_http, host, int(port))
+                    self._servers.append(server)
+                    bound = server.sockets[0].getsockname()
+                    self.http_address = f"http://{host}:{bound[1]}"
+                except OSError as e:
+                    self.errors.append(f"http: {e}")
+
+        path = self._socket_path()
+        if path:
+            try:
+                if self.config.get("unix_socket") == "auto":
+                    self._private_socket_dir(os.path.dirname(path))
+                self._clear_stale_socket(path)
+                # Bound under umask 077: never reachable by others, even before the chmod
+                umask = os.umask(0o077)
+                try:
+                    server = await asyncio.start_unix_server(self._handle_unix, path)
+                finally:
+                    os.umask(umask)
+                os.chmod(path, 0o600)
+                self._servers.append(server)
+                self.unix_path = path
+            except OSError as e:
+                self.errors.append(f"unix: {e}")
+
+    async def _close_servers(self):
+        for server in self._servers:
+            await server.wait_closed()
+
+    def _socket_path(self):
+        """Resolved Unix socket path, or None if unsupported/disabled."""
+        path = self.config.get("unix_socket")
+        if not path or not hasattr(socket, "AF_UNIX") or os.name == "nt":
+            return None
+        if path == "auto":
+            # Host temp dir (removable media filesystems can't hold sockets),
+            # inside a per-user dir: a predictable name in the shared temp dir
+            # could be pre-created or swapped by another user
+            core = self.kernel.get_engine("ghost_core")
+            node = getattr(core, "node_id", None) or self.kernel.session_id
+            return os.path.join(tempfile.gettempdir(), f"ghost_api-{os.getuid()}", f"{node}.sock")
+        if not os.path.isabs(path):
+            path = os.path.join(self.root_dir, path)
+        return path
+
+    @staticmethod
+    def _private_socket_dir(path):
+        """Create `path` 0700, or accept it only if it's a real dir of ours that no one else can write."""
+        try:
+            os.mkdir(path, 0o700)
+        except FileExistsError:
+            pass
+        st = os.lstat(path)
+        if (not stat.S_ISDIR(st.st_mode) or st.st_uid != os.getuid()
+                or st.st_mode & (stat.S_IRWXG | stat.S_IRWXO)):
+            raise OSError(f"{path} is not a private directory (owner/mode check failed)")
+
+    @staticmethod
+    def _clear_stale_socket(path):
+        """Unlink a leftover socket (or symlink) at `path`; refuse to delete anything else."""
+        try:
+            st = os.lstat(path)
+        except FileNotFoundError:
+            return
+        if not (stat.S_ISSOCK(st.st_mode) or stat.S_ISLNK(st.st_mode)):
+            raise OSError(f"{path} exists and is not a socket")
+        os.unlink(path)
+
+    def _remove_socket(self, path=None):
+        path = path or self.unix_path
+        if path:
+            try:
+                self._clear_stale_socket(path)
+            except OSError:
+                pass
+
+    def _workers(self):
+        return max(1, int(self.config.get("workers") or 1))
+
+    def _max_pending(self):
+        return max(self._workers(), int(self.config.get("max_pending") or 1))
+
+    # =========================================================================
+    # REQUEST DISPATCH
+    # =========================================================================
+
+    def required_role(self, command):
+        """Role needed to run a command line through the API."""
+        parts = command.strip().split(None, 1)
+        if not parts:
+            return None
+        cmd_module = self.kernel.commands.get(parts[0].lower())
+        if cmd_module is not None:
+            return getattr(cmd_module, "REQUIRED_ROLE", None)
+        return self.config.get("passthrough_role") or "ADMIN"
+
+    def resolve_role(self, secret, transport):
+        """Caller role: from the presented secret, else the transport default."""
+        sec = self.kernel.get_engine("security")
+        if not sec:
+            return None
+        if secret:
+            return sec.role_for_secret(secret)
+        if transport == "unix":
+            return sec.current_role
+        return None
+
+    async def dispatch(self, request, role):
+        """
+        Handle one decoded request for an authenticated caller.
+        Returns (status_code, payload dict).
+        """
+        op = request.get("op", "execute")
+        self.stats["requests"] += 1
+
+        if op == "status":
+            return 200, self.kernel_status()
+        if op != "execute":
+            return 400, {"ok": False, "error": f"Unknown op: {op}"}
+
+        command = request.get("command")
+        if not isinstance(command, str) or not command.strip():
+            return 400, {"ok": False, "error": "Missing 'command'"}
+
+        required = self.required_role(command)
+        sec = self.kernel.get_engine("security")
+        if required and not (sec and sec.has_permission(required, role=role)):
+            self.stats["denied"] += 1
+            return 403, {
+                "ok": False, "command": command, "role": role,
+                "error": f"Access Denied. Required role: {required}",
+            }
+
+        if self._slots.locked():
+            self.stats["busy"] += 1
+            return 503, {"ok": False, "command": command, "error": "Server busy, retry later"}
+
+        async with self._slots:
+            self._active += 1
+            try:
+                loop = asyncio.get_running_loop()
+                future = loop.run_in_executor(
+                    self._executor, self._execute_as, role, command
+                )
+                result = await asyncio.wait_for(future, self.config.get("timeout") or None)
+            except asyncio.TimeoutError:
+                self.stats["timeouts"] += 1
+                return 504, {"ok": False, "command": command, "error": "Command timed out"}
+            finally:
+                self._active -= 1
+
+        self.stats["executed"] += 1
+        result["role"] = role
+        return 200, result
+
+    def _execute_as(self, role, command):
+        """Worker thread: run the command with the caller's role as the effective role."""
+        sec = self.kernel.get_engine("security")
+        if sec is None:
+            return self.kernel.execute_captured(command)
+        with sec.acting_as(role):
+            return self.kernel.execute_captured(command)
+
+    def kernel_status(self):
+        """Kernel and engine snapshot (never forces lazy engines to load)."""
+        engines = {}
+        for name, engine in list(self.kernel.engines.items()):
+            if self.kernel.is_lazy(name):
+                state, version = "deferred", None
+            elif engine is None:
+                state, version = "failed", None
+            else:
+                state, version = "loaded", getattr(engine, "ENGINE_VERSION", None)
+            engines[name] = {"state": state, "version": version}
+
+        uptime = time.time() - self.kernel.boot_time if self.kernel.boot_time else 0
+        return {
+            "ok": True,
+            "version": self.kernel.VERSION,
+            "session_id": self.kernel.session_id,
+            "uptime": round(uptime, 1),
+            "engines": engines,
+            "commands": len(self.kernel.commands),
+            "api": self.get_status(),
+        }
+
+    # =========================================================================
+    # TRANSPORTS
+    # =========================================================================
+
+    async def _handle_unix(self, reader, writer):
+        """Newline-delimited JSON: one reply per request, connection reusable."""
+        try:
+            while True:
+                try:
+                    line = await reader.readline()
+                except ValueError:
+                    await self._write_line(writer, {"ok": False, "error": "Request too large"})
+                    break
+                if not line:
+                    break
+                if not line.strip():
+                    continue
+                try:
+                    request = json.loads(line)
+                    if not isinstance(request, dict):
+                        raise ValueError("expected a JSON object")
+                except ValueError as e:
+                    await self._write_line(writer, {"ok": False, "error": f"Bad JSON: {e}"})
+                    continue
+
+                role = self.resolve_role(request.get("token"), "unix")
+                if not role:
+                    payload = {"ok": False, "error": "Invalid key"}
+                else:
+                    _, payload = await self.dispatch(request, role)
+                await self._write_line(writer, payload)
+        except (ConnectionError, asyncio.IncompleteReadError, asyncio.CancelledError):
+            pass  # client went away or server stopping
+        finally:
+            writer.close()
+
+    async def _write_line(self, writer, payload):
+        writer.write(json.dumps(payload, ensure_ascii=False).encode() + b"\n")
+        await writer.drain()
+
+    async def _handle_http(self, reader, writer):
+        """Minimal HTTP/1.1: one request per connection, JSON in and out."""
+        try:
+            status, payload = await self._http_request(reader)
+        except (ValueError, asyncio.IncompleteReadError, asyncio.LimitOverrunError):
+            status, payload = 400, {"ok": False, "error": "Malformed request"}
+        except (ConnectionError, asyncio.CancelledError):
+            writer.close()
+            return
+
+        body = json.dumps(payload, ensure_ascii=False).encode()
+        head = (
+            f"HTTP/1.1 {status} {HTTP_REASONS.get(status, 'OK')}\r\n"
+            "Content-Type: application/json; charset=utf-8\r\n"
+            f"Content-Length: {len(body)}\r\n"
+            "Connection: close\r\n\r\n"
+        )
+        try:
+            writer.write(head.encode() + body)
+            await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            writer.close()
+
+    async def _http_request(self, reader):
+        """Parse one request and route it. Returns (status, payload)."""
+        request_line = (await reader.readline()).decode("latin-1").strip()
+        method, target, _version = request_line.split(" ", 2)
+        path = target.split("?", 1)[0]
+
+        headers = {}
+        for _ in range(MAX_HEADERS + 1):
+            line = (await reader.readline()).decode("latin-1").strip()
+            if not line:
+                break
+            name, _, value = line.partition(":")
+            headers[name.strip().lower()] = value.strip()
+        else:
+            return 400, {"ok": False, "error": "Too many headers"}
+
+        length = int(headers.get("content-length") or 0)
+        if length > MAX_BODY:
+            return 413, {"ok": False, "error": "Request too large"}
+        raw_body = await reader.readexactly(length) if length else b""
+
+        if path == "/health":
+            return 200, {"ok": True}
+        if path not in ("/status", "/execute"):
+            return 404, {"ok": False, "error": f"No route: {path}"}
+
+        auth = headers.get("authorization", "")
+        secret = auth[7:].strip() if auth.lower().startswith("bearer ") else None
+        role = self.resolve_role(secret, "http")
+        if not role:
+            return 401, {"ok": False, "error": "Missing or invalid key"}
+
+        if path == "/status":
+            if method != "GET":
+                return 405, {"ok": False, "error": "Use GET"}
+            return await self.dispatch({"op": "status"}, role)
+
+        if method != "POST":
+            return 405, {"ok": False, "error": "Use POST"}
+        try:
+            request = json.loads(raw_body or b"{}")
+        except ValueError as e:
+            return 400, {"ok": False, "error": f"Bad JSON: {e}"}
+        if not isinstance(request, dict):
+            return 400, {"ok": False, "error": "Expected a JSON object"}
+        request["op"] = "execute"
+        return await self.dispatch(request, role)
@@ -2,66 +2,255 @@
 Engine 04: BlackBox Engine - The Network Operator
 ===================================================
 Network interface enumeration, ping with jitter analysis,
-traceroute, and future port scanning.
+parallel ping sweeps, asyncio TCP connect port scanning,
+parallel traceroute with mtr-style per-hop statistics, a cached
+DNS resolver shared with Legion and Eve, an iperf-style TCP
+throughput / RTT benchmark (client + server), and a live interface
+traffic monitor sampled from /proc/net/dev by a PulseEngine task.
 
 Compartmentalization:
 - MUST NOT write to Vault (VaultEngine does that)
 - Returns data structures, doesn't format output
 """
 
+import os
 import subprocess
+import socketserver
 import platform
 import statistics
 import socket
 import re
 import time
+import errno
+import shutil
+import threading
+import ipaddress
+import asyncio
+import select
+import struct
+import urllib.error
+import urllib.parse
+import urllib.request
+from array import array
+from collections import Counter, OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeout
+
+
+# Parallel probing (ping_many / check_internet)
+PING_WORKERS = 64           # concurrent ping probes
+SWEEP_MAX_HOSTS = 1024      # largest CIDR expand_targets will accept
+INTERNET_TARGETS = ["8.8.8.8", "1.1.1.1"]
+
+# Streaming ping
+PING_MIN_INTERVAL = 0.2     # Linux refuses shorter intervals without root
+TCP_PING_PORTS = (443, 80, 22, 53)
+
+_PING_SEQ = re.compile(r'icmp_seq=(\d+)')
+_PING_TIME = re.compile(r'time[=<]\s*(\d+\.?\d*)\s*ms', re.IGNORECASE)
+_PING_LOST = re.compile(r'no answer yet|timed out|unreachable', re.IGNORECASE)
+
+# Port scanning (scan_ports)
+SCAN_CONCURRENCY = 500      # sockets open at once (clamped to the fd limit)
+SCAN_HOST_RATE = 200        # connection attempts per second per host
+SCAN_TIMEOUT = 1.0          # connect timeout (s)
+SCAN_BANNER_TIMEOUT = 1.0   # wait for a banner after connecting (s)
+SCAN_MAX_PORTS = 65535
+TOP_PORTS = (
+    21, 22, 23, 25, 53, 80, 110, 111, 135, 139, 143, 443, 445, 465, 587,
+    993, 995, 1433, 1723, 3000, 3306, 3389, 5000, 5432, 5900, 6379, 8000,
+    8080, 8443, 8765, 8888, 9000, 9090, 11434, 27017,
+)
+HTTP_PROBE_PORTS = {80, 3000, 5000, 8000, 8080, 8765, 8888, 9000, 9090, 11434}
+
+# Traceroute (trace)
+TRACE_MAX_HOPS = 30
+TRACE_ROUNDS = 5            # probes per hop (one per round, like mtr cycles)
+TRACE_TIMEOUT = 2.0         # wait for the slowest hop each round (s)
+TRACE_INTERVAL = 1.0        # pause between rounds (s); hosts rate-limit ICMP
+TRACE_BASE_PORT = 33434     # classic traceroute UDP port range
+TRACE_PAYLOAD = b"\x00" * 32
+# DNS resolver cache (resolve_dns / resolve_dns_many)
+DNS_CACHE_TTL = 300         # seconds an answer is reused (setting "dns_cache_ttl")
+DNS_NEGATIVE_TTL = 30       # seconds a failure is remembered ("dns_negative_ttl")
+DNS_CACHE_MAX = 1024        # entries kept, least recently stored evicted first
+DNS_WORKERS = 16            # concurrent lookups in resolve_dns_many
+# Throughput benchmark (bench / bench_serve)
+BENCH_PORT = 8766           # bench server port (setting "bench_port"); API is 8765
+BENCH_MAGIC = "GHOSTBENCH"  # first line of every bench connection: "GHOSTBENCH <mode> [arg]"
+BENCH_CHUNK = 128 * 1024    # bytes per send in stream tests
+BENCH_SECONDS = 3.0         # duration of each throughput test
+BENCH_STREAMS = (1, 2, 4)   # parallel-stream counts tried in turn
+BENCH_RTT_COUNT = 500       # request/response round trips measured
+BENCH_RTT_SIZE = 64         # bytes per RTT request (echoed back)
+BENCH_MAX_SECONDS = 60      # server-side cap on any one test
+BENCH_MAX_STREAMS = 32      # connections the server serves at once
+BENCH_IDLE_TIMEOUT = 30     # server drops a silent connection after this (s)
+# Traffic monitor (traffic_start / net top)
+TRAFFIC_INTERVAL = 2        # seconds between samples ("net_monitor_interval", 0 = off)
+TRAFFIC_SAMPLES = 300       # ring slots per interface ("net_monitor_samples"): 10 min at 2 s
+TRAFFIC_FIELDS = ("rx_bytes", "rx_packets", "rx_errors", "rx_dropped",
+                  "tx_bytes", "tx_packets", "tx_errors", "tx_dropped")
+TRAFFIC_COLUMNS = (0, 1, 2, 3, 8, 9, 10, 11)    # their /proc/net/dev columns
+TRAFFIC_MIN_GAP = 0.25      # a sample this soon after the last is skipped (noisy rate)
+# Linux extended socket errors: ICMP replies to unprivileged UDP probes
+IP_RECVERR = getattr(socket, "IP_RECVERR", 11)
+IPV6_RECVERR = getattr(socket, "IPV6_RECVERR", 25)
+MSG_ERRQUEUE = getattr(socket, "MSG_ERRQUEUE", 0x2000)
 
 
 class BlackBoxEngine:
     """The Network Operator - connectivity and diagnostics."""
 
     ENGINE_NAME = "blackbox"
-    ENGINE_VERSION = "1.0.0"
+    ENGINE_VERSION = "1.7.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
         self.os_type = platform.system().upper()
 
-    def ping(self, host, count=4):
+        # Resolver cache: {(name, family): (expires, entry)}
+        self.dns_ttl = float(kernel.settings.get("dns_cache_ttl", DNS_CACHE_TTL))
+        self.dns_negative_ttl = float(kernel.settings.get("dns_negative_ttl", DNS_NEGATIVE_TTL))
+        self._dns_cache = OrderedDict()
+        self._dns_inflight = {}     # {(name, family): Future} shared by concurrent misses
+        self._dns_lock = threading.Lock()
+        self._dns_stats = {"hits": 0, "negative_hits": 0, "misses": 0, "lookup_ms": 0.0}
+
+        self.bench_port = int(kernel.settings.get("bench_port", BENCH_PORT))
+        self._bench_server = None
+        self._bench_thread = None
+        kernel.on("shutdown", lambda _data: self.bench_stop())
+
+        self.traffic_interval = float(kernel.settings.get("net_monitor_interval", TRAFFIC_INTERVAL))
+        self.traffic_samples = int(kernel.settings.get("net_monitor_samples", TRAFFIC_SAMPLES))
+        self._traffic = None
+
+    def ping(self, host, count=4, timeout=2, interval=1.0, on_reply=None):
         """
         Ping a host with jitter/variance analysis.
+        One `ping -c N -i interval` process; replies are parsed as they
+        stream in and on_reply(seq, ms) fires for each (ms=None when lost).
+        Falls back to a TCP-connect probe (tcp_ping) when ping is missing or
+        not permitted. `timeout` is the per-reply wait in seconds.
         Returns structured data (not formatted output).
         """
+        binary = shutil.which("ping")
+        if not binary:
+            return self.tcp_ping(host, count, timeout=timeout, interval=interval,
+                                 on_reply=on_reply)
+
+        interval = max(PING_MIN_INTERVAL, interval)
+        if self.os_type == "WINDOWS":
+            cmd = [binary, "-n", str(count), "-w", str(int(timeout * 1000)), host]
+        elif self.os_type == "DARWIN":
+            cmd = [binary, "-n", "-c", str(count), "-i", str(interval),
+                   "-W", str(int(timeout * 1000)), host]
+        else:
+            cmd = [binary, "-n", "-c", str(count), "-i", str(interval),
+                   "-W", str(max(1, int(timeout))), host]
+
+        try:
+            process = subprocess.Popen(
+                cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+                text=True, errors="replace",
+            )
+        except OSError:
+            return self.tcp_ping(host, count, timeout=timeout, interval=interval,
+                                 on_reply=on_reply)
+
+        # Whole run: every interval plus the last reply's wait
+        watchdog = threading.Timer(count * interval + timeout + 3, process.kill)
+        watchdog.daemon = True
+        watchdog.start()
+
         times = []
-        lost = 0
+        answered = set()
+        next_seq = 1
+        try:
+            for line in process.stdout:
+                reply = _parse_ping_line(line, self.os_type)
+                if reply is None:
+                    continue
+                seq, ms = reply
+                if seq is None:             # Windows: replies aren't numbered
+                    seq = next_seq
+                if ms is None:
+                    answered.add(seq)
+                    next_seq = seq + 1
+                    if on_reply:
+                        on_reply(seq, None)
+                    continue
+                # A gap in icmp_seq means the packets in between were lost
+                for missing in range(next_seq, seq):
+                    if missing not in answered:
+                        answered.add(missing)
+                        if on_reply:
+                            on_reply(missing, None)
+                if seq in answered:
+                    continue                # duplicate reply
+                answered.add(seq)
+                next_seq = max(next_seq, seq + 1)
+                times.append(ms)
+                if on_reply:
+                    on_reply(seq, ms)
+            stderr = process.stderr.read()
+            process.wait()
+        finally:
+            watchdog.cancel()
+            if process.poll() is None:
+                process.kill()
 
-        for i in range(count):
-            start = time.time()
-            try:
-                if self.os_type == "WINDOWS":
-                    cmd = ["ping", "-n", "1", "-w", "2000", host]
-                else:
-                    cmd = ["ping", "-c", "1", "-W", "2", host]
+        if not times and _ping_not_permitted(process.returncode, stderr):
+            return self.tcp_ping(host, count, timeout=timeout, interval=interval,
+                                 on_reply=on_reply)
 
-                result = subprocess.run(
-                    cmd, capture_output=True, text=True, timeout=5
-                )
+        if on_reply:
+            for missing in range(1, count + 1):
+                if missing not in answered:
+                    on_reply(missing, None)
 
-                # Parse time from output
-                output = result.stdout
-                if self.os_type == "WINDOWS":
-                    match = re.search(r'time[=<](\d+)ms', output)
-                else:
-                    match = re.search(r'time=(\d+\.?\d*)\s*ms', output)
+        result = self._ping_summary(host, count, times, count - len(times))
+        result["method"] = "icmp"
+        return result
 
-                if match:
-                    times.append(float(match.group(1)))
-                else:
-                    lost += 1
+    def tcp_ping(self, host, count=4, port=None, timeout=2, interval=1.0, on_reply=None):
+        """
+        Latency via TCP connect time (no privileges, no ping binary).
+        Tries TCP_PING_PORTS until one answers, unless `port` is given.
+        A refused connection still proves the host is up and is timed too.
+        Same result structure as ping(), plus "method": "tcp:<port>".
+        """
+        target = self.resolve_address(host)
+        if target is None:
+            result = self._ping_summary(host, count, [], count)
+            result["method"] = "tcp"
+            return result
+        family, address = target
 
-            except (subprocess.TimeoutExpired, Exception):
-                lost += 1
+        ports = [port] if port else list(TCP_PING_PORTS)
+        times = []
+        for seq in range(1, count + 1):
+            if seq > 1:
+                time.sleep(interval)
+            ms = None
+            while ports:
+                ms = _tcp_connect_ms(family, address, ports[0], timeout)
+                if ms is not None or len(ports) == 1 or seq > 1:
+                    break
+                ports.pop(0)                # silent port: try the next one
+            if ms is not None:
+                ms = round(ms, 3)
+                times.append(ms)
+            if on_reply:
+                on_reply(seq, ms)
+
+        result = self._ping_summary(host, count, times, count - len(times))
+        result["method"] = f"tcp:{ports[0]}"
+        return result
 
+    def _ping_summary(self, host, count, times, lost):
+        """Jitter/loss structure shared by every ping mode."""
         if not times:
             return {
                 "host": host,
@@ -87,47 +276,1219 @@ class BlackBoxEngine:
             "times": times,
         }
 
+    def ping_many(self, hosts, count=4, timeout=2, workers=PING_WORKERS, on_result=None):
+        """
+        Ping many hosts in parallel (thread pool of ping probes).
+        Returns one ping() result per host, in input order.
+        on_result(result) is called as each host finishes (completion order).
+        """
+        hosts = list(dict.fromkeys(hosts))     # dedupe, keep order
+        if not hosts:
+            return []
+
+        results = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(workers, len(hosts))),
+                                thread_name_prefix="GhostPing") as pool:
+            futures = {pool.submit(self.ping, host, count, timeout): host for host in hosts}
+            for future in as_completed(futures):
+                host = futures[future]
+                try:
+                    result = future.result()
+                except Exception:
+                    result = self._ping_summary(host, count, [], count)
+                results[host] = result
+                if on_result:
+                    on_result(result)
+        return [results[host] for host in hosts]
+
+    def expand_targets(self, targets):
+        """
+        Expand ping/scan targets: hostnames and IPs pass through, CIDR
+        blocks become their host addresses (capped at SWEEP_MAX_HOSTS).
+        Raises ValueError for an oversized network.
+        """
+        hosts = []
+        for target in targets:
+            if "/" not in target:
+                hosts.append(target)
+                continue
+            network = ipaddress.ip_network(target, strict=False)
+            if network.num_addresses > SWEEP_MAX_HOSTS + 2:
+                raise ValueError(
+                    f"{target} has {network.num_addresses} addresses "
+                    f"(max {SWEEP_MAX_HOSTS})"
+                )
+            members = list(network.hosts()) or [network.network_address]
+            hosts.extend(str(ip) for ip in members)
+        return hosts
+
     def get_interfaces(self):
         """Enumerate network interfaces."""
         interfaces = []
-        try:
-            hostname = socket.gethostname()
-            local_ip = socket.gethostbyname(hostname)
-            interfaces.append({
-                "name": "primary",
-                "hostname": hostname,
-                "ip": local_ip,
-            })
-        except Exception:
-            pass
-
-        # Get all IPs
-        try:
-            for info in socket.getaddrinfo(socket.gethostname(), None):
-                ip = info[4][0]
-                if ip not in [i.get("ip") for i in interfaces]:
-                    interfaces.append({
-                        "name": f"interface-{len(interfaces)}",
-                        "ip": ip,
-                    })
-        except Exception:
-            pass
+        hostname = socket.gethostname()
+        result = self.resolve_dns(hostname)     # one lookup for every address
+        if not result["resolved"]:
+            return interfaces
 
+        interfaces.append({
+            "name": "primary",
+            "hostname": hostname,
+            "ip": result["ip"],
+        })
+        for ip in result["addresses"]:
+            if ip != result["ip"]:
+                interfaces.append({
+                    "name": f"interface-{len(interfaces)}",
+                    "ip": ip,
+                })
         return interfaces
 
     def check_internet(self):
-        """Quick internet connectivity check."""
-        targets = ["8.8.8.8", "1.1.1.1"]
-        for target in targets:
-            result = self.ping(target, count=1)
-            if result["status"] != "UNREACHABLE":
-                return {"connected": True, "via": target, "latency_ms": result["average_ms"]}
-        return {"connected": False}
+        """
+        Quick internet connectivity check.
+        Probes every target at once and answers with the first reply.
+        """
+        pool = ThreadPoolExecutor(max_workers=len(INTERNET_TARGETS),
+                                  thread_name_prefix="GhostPing")
+        try:
+            futures = [pool.submit(self.ping, t, 1) for t in INTERNET_TARGETS]
+            for future in as_completed(futures):
+                result = future.result()
+                if result["status"] != "UNREACHABLE":
+                    return {"connected": True, "via": result["host"],
+                            "latency_ms": result["average_ms"]}
+            return {"connected": False}
+        finally:
+            pool.shutdown(wait=False)
+
+    # =========================================================================
+    # PORT SCANNING
+    # =========================================================================
+
+    def parse_ports(self, spec):
+        """
+        "22,80,443" / "1-1024" / "top" (TOP_PORTS) / mixes -> sorted port list.
+        Raises ValueError on anything else.
+        """
+        ports = set()
+        for part in str(spec).split(","):
+            part = part.strip().lower()
+            if not part:
+                continue
+            if part == "top":
+                ports.update(TOP_PORTS)
+            elif "-" in part:
+                low, high = (int(x) for x in part.split("-", 1))
+                ports.update(range(low, high + 1))
+            else:
+                ports.add(int(part))
+        if not ports or min(ports) < 1 or max(ports) > SCAN_MAX_PORTS:
+            raise ValueError(f"Invalid port spec: {spec}")
+        return sorted(ports)
+
+    def scan_ports(self, targets, ports, concurrency=SCAN_CONCURRENCY,
+                   host_rate=SCAN_HOST_RATE, timeout=SCAN_TIMEOUT,
+                   banner=True, on_result=None):
+        """
+        TCP connect scan of every (host, port) on one asyncio loop.
+
+        A fixed pool of `concurrency` worker coroutines pulls probes from a
+        generator (ports outer, hosts inner), so memory and open sockets stay
+        bounded however many probes there are. Each host is held to
+        `host_rate` connection attempts per second. Open ports are read
+        for a banner (HTTP-ish ports get a HEAD request).
+
+        targets: hostnames/IPs/CIDR blocks. ports: list or parse_ports spec.
+        on_result(probe) fires for every open port as it is found.
+        Returns {targets, ports, probes, open, counts, unresolved, elapsed_s}.
+        """
+        if isinstance(ports, str):
+            ports = self.parse_ports(ports)
+        hosts = self.expand_targets(targets)
+
+        addresses, unresolved = {}, []
+        for entry in self.resolve_dns_many(hosts):
+            if entry["resolved"]:
+                addresses[entry["hostname"]] = entry["addresses"][0]
+            else:
+                unresolved.append(entry["hostname"])
+
+        start = time.perf_counter()
+        report = asyncio.run(self._scan(
+            addresses, list(ports), min(concurrency, _fd_budget()),
+            host_rate, timeout, banner, on_result,
+        ))
+        report.update({
+            "targets": list(addresses),
+            "ports": len(ports),
+            "unresolved": unresolved,
+            "elapsed_s": round(time.perf_counter() - start, 2),
+        })
+        order = {host: i for i, host in enumerate(hosts)}
+        report["open"].sort(key=lambda p: (order[p["host"]], p["port"]))
+        return report
+
+    async def _scan(self, addresses, ports, concurrency, host_rate, timeout,
+                    banner, on_result):
+        counts = {"open": 0, "closed": 0, "filtered": 0, "error": 0}
+        found = []
+        spacing = 1.0 / host_rate if host_rate else 0
+        next_slot = {host: 0.0 for host in addresses}
+        probes = ((host, port) for port in ports for host in addresses)
+        loop = asyncio.get_running_loop()
+
+        async def worker():
+            for host, port in probes:
+                if spacing:
+                    # Per-host rate limit: reserve the next free slot
+                    now = loop.time()
+                    slot = max(now, next_slot[host])
+                    next_slot[host] = slot + spacing
+                    if slot > now:
+                        await asyncio.sleep(slot - now)
+                probe = await _probe_port(host, addresses[host], port, timeout, banner)
+                counts[probe["state"]] += 1
+                if probe["state"] == "open":
+                    found.append(probe)
+                    if on_result:
+                        on_result(probe)
+
+        workers = min(concurrency, len(ports) * len(addresses)) or 1
+        await asyncio.gather(*(worker() for _ in range(workers)))
+        return {"probes": sum(counts.values()), "open": found, "counts": counts}
+
+    # =========================================================================
+    # TRACEROUTE
+    # =========================================================================
+
+    def trace(self, host, rounds=TRACE_ROUNDS, max_hops=TRACE_MAX_HOPS,
+              timeout=TRACE_TIMEOUT, interval=TRACE_INTERVAL, resolve=True,
+              on_round=None):
+        """
+        Traceroute with mtr-style per-hop statistics.
+
+        Every TTL is probed at once each round (one UDP probe per hop, no
+        privileges needed - replies come back on the socket error queue),
+        so a round costs one round trip rather than one per hop. Once the
+        destination answers, later rounds stop at its TTL.
+
+        on_round(round_no, replies) fires after each round, with replies
+        {ttl: (address, ms)}. Each hop has the ping() summary fields plus
+        ttl, addresses (all responders seen), hostname and unreachable (the
+        hop reported the destination unreachable - traceroute's !H/!N).
+        Returns {host, address, reached, hops, rounds, elapsed_s, method}.
+        """
+        result = {"host": host, "address": None, "reached": False, "hops": [],
+                  "rounds": 0, "elapsed_s": 0, "method": "udp"}
+        if self.os_type != "LINUX" or not hasattr(select, "poll"):
+            result["error"] = "traceroute needs Linux (IP_RECVERR socket errors)"
+            return result
+        target = self.resolve_address(host)
+        if target is None:
+            result["error"] = f"Could not resolve {host}"
+            return result
+        family, address = target
+        result["address"] = address
+
+        samples = {}                # {ttl: [(address, ms) or None per round]}
+        unreachable = set()         # TTLs that answered "destination unreachable"
+        path_len = max_hops
+        start = time.perf_counter()
+        for round_no in range(1, rounds + 1):
+            if round_no > 1:
+                time.sleep(interval)
+            replies, end = _trace_round(family, address, path_len, timeout)
+            for ttl in range(1, path_len + 1):
+                samples.setdefault(ttl, []).append(replies.get(ttl))
+            if end:
+                path_len, kind = end
+                if kind == "reached":
+                    result["reached"] = True
+                else:
+                    unreachable.add(path_len)
+            result["rounds"] = round_no
+            if on_round:
+                on_round(round_no, {ttl: reply for ttl, reply in replies.items()
+                                    if ttl <= path_len})
+
+        # Unanswered hops past the last responder are noise, not path
+        last = max((ttl for ttl in range(1, path_len + 1) if any(samples[ttl])),
+                   default=0)
+        for ttl in range(1, last + 1):
+            answered = [reply for reply in samples[ttl] if reply]
+            seen = Counter(addr for addr, _ms in answered)
+            hop = self._ping_summary(
+                seen.most_common(1)[0][0] if seen else "???",
+                len(samples[ttl]), [ms for _addr, ms in answered],
+                len(samples[ttl]) - len(answered),
+            )
+            hop.update({"ttl": ttl, "addresses": list(seen), "hostname": None,
+                        "unreachable": ttl in unreachable})
+            result["hops"].append(hop)
+
+        if resolve:
+            names = _reverse_dns({a for hop in result["hops"] for a in hop["addresses"]})
+            for hop in result["hops"]:
+                hop["hostname"] = names.get(hop["host"])
+        result["elapsed_s"] = round(time.perf_counter() - start, 2)
+        return result
+
+    # =========================================================================
+    # THROUGHPUT BENCHMARK
+    # =========================================================================
+
+    def bench_serve(self, host="127.0.0.1", port=None):
+        """
+        Start the bench server (thread per connection, daemon). The far end
+        of `bench`: it sinks, sources or echoes data as each connection asks.
+        Bind 0.0.0.0 / a Tailscale address to test a Legion link.
+        Returns {"ok", "address", "port"} or {"ok": False, "error"}.
+        """
+        if self._bench_server is not None:
+            address, bound = self._bench_server.server_address[:2]
+            return {"ok": True, "address": address, "port": bound, "already_running": True}
+        port = self.bench_port if port is None else port
+        try:
+            family = socket.AF_INET6 if ":" in host else socket.AF_INET
+            server = _BenchServer((host, port), _BenchHandler, family)
+        except OSError as e:
+            return {"ok": False, "error": f"Cannot listen on {host}:{port}: {e}"}
+
+        self._bench_server = server
+        self._bench_thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.25},
+            daemon=True, name="GhostBench",
+        )
+        self._bench_thread.start()
+        address, bound = server.server_address[:2]
+        return {"ok": True, "address": address, "port": bound}
+
+    def bench_stop(self):
+        """Stop the bench server. Returns True if one was running."""
+        server, self._bench_server = self._bench_server, None
+        if server is None:
+            return False
+        server.shutdown()
+        server.server_close()
+        self._bench_thread = None
+        return True
+
+    def bench_status(self):
+        """{"running", "address", "port", "connections"} for the bench server."""
+        server = self._bench_server
+        if server is None:
+            return {"running": False, "port": self.bench_port}
+        address, port = server.server_address[:2]
+        return {"running": True, "address": address, "port": port,
+                "connections": server.active}
+
+    def bench_loopback(self, **options):
+        """
+        `bench` against a private throwaway server on 127.0.0.1 (ephemeral
+        port), separate from any bench_serve() server, which is left alone.
+        Works offline. Takes bench()'s keyword options except host/port.
+        """
+        try:
+            server = _BenchServer(("127.0.0.1", 0), _BenchHandler, socket.AF_INET)
+        except OSError as e:
+            return {"error": f"Cannot listen on 127.0.0.1: {e}"}
+        thread = threading.Thread(
+            target=server.serve_forever, kwargs={"poll_interval": 0.25},
+            daemon=True, name="GhostBenchLoopback",
+        )
+        thread.start()
+        try:
+            return self.bench("127.0.0.1", port=server.server_address[1], **options)
+        finally:
+            server.shutdown()
+            server.server_close()
+
+    def bench(self, host, port=None, seconds=BENCH_SECONDS, streams=BENCH_STREAMS,
+              rtt_count=BENCH_RTT_COUNT, rtt_size=BENCH_RTT_SIZE, reverse=False,
+              on_progress=None):
+        """
+        Benchmark the path to a bench server (bench_serve on the far node).
+
+        1. RTT: rtt_count request/response round trips of rtt_size bytes on
+           one TCP_NODELAY connection -> min/avg/max/jitter and p50/p90/p99.
+        2. Throughput: for each count in `streams`, that many connections
+           send (or with reverse=True receive) as fast as possible for
+           `seconds`; bytes are counted by the receiving side.
+
+        on_progress(stage, result) fires after the RTT test ("rtt") and after
+        each stream count ("streams").
+        Returns {host, address, port, rtt, throughput, best_mbps, scaling,
+        direction, elapsed_s} or {"error"} when the server can't be reached.
+        """
+        port = self.bench_port if port is None else port
+        target = self.resolve_address(host)
+        if target is None:
+            return {"host": host, "error": f"Could not resolve {host}"}
+        family, address = target
+        start = time.perf_counter()
 
-    def resolve_dns(self, hostname):
-        """Resolve a hostname to IP."""
         try:
-            ip = socket.gethostbyname(hostname)
-            return {"hostname": hostname, "ip": ip, "resolved": True}
-        except socket.gaierror as e:
-            return {"hostname": hostname, "resolved": False, "error": str(e)}
+            times = _bench_rtt(family, address, port, rtt_count, rtt_size)
+        except OSError as e:
+            return {"host": host, "address": address, "port": port,
+                    "error": f"Bench server unreachable at {address}:{port}: {e}"}
+        rtt = _latency_percentiles(times)
+        if on_progress:
+            on_progress("rtt", rtt)
+
+        throughput = []
+        for count in streams:
+            try:
+                result = _bench_streams(family, address, port, count, seconds, reverse)
+            except OSError as e:
+                result = {"streams": count, "error": str(e)}
+            throughput.append(result)
+            if on_progress:
+                on_progress("streams", result)
+
+        rates = [r["mbps"] for r in throughput if "mbps" in r]
+        single = next((r["mbps"] for r in throughput
+                       if r.get("streams") == 1 and "mbps" in r), None)
+        best = max(rates) if rates else None
+        return {
+            "host": host,
+            "address": address,
+            "port": port,
+            "direction": "download" if reverse else "upload",
+            "rtt": rtt,
+            "throughput": throughput,
+            "best_mbps": best,
+            "scaling": round(best / single, 2) if best and single else None,
+            "elapsed_s": round(time.perf_counter() - start, 2),
+        }
+
+
+    # =========================================================================
+    # TRAFFIC MONITOR
+    # =========================================================================
+
+    def traffic_start(self, interval=None):
+        """
+        Sample interface counters every `interval` seconds on a PulseEngine
+        task (default net_monitor_interval). Called at boot unless the
+        interval is 0; safe to call again to change the interval.
+        Returns {"ok", "interval"} or {"ok": False, "error"}.
+        """
+        interval = self.traffic_interval if interval is None else interval
+        if not TrafficMonitor.supported():
+            return {"ok": False, "error": "traffic monitor needs /proc/net/dev (Linux)"}
+        pulse = self.kernel.get_engine("pulse")
+        if not pulse:
+            return {"ok": False, "error": "Pulse engine not available"}
+        if interval <= 0:
+            return {"ok": False, "error": "monitor interval must be > 0"}
+
+        if self._traffic is None:
+            self._traffic = TrafficMonitor(max(2, self.traffic_samples))
+        self._traffic.interval = interval
+        pulse.unregister_task("net_traffic")
+        pulse.register_task("net_traffic", interval, self._traffic.sample)
+        return {"ok": True, "interval": interval}
+
+    def traffic_stop(self):
+        """Stop sampling (the rings are kept). Returns True if it was running."""
+        pulse = self.kernel.get_engine("pulse")
+        stopped = bool(pulse and pulse.unregister_task("net_traffic"))
+        if self._traffic is not None:
+            self._traffic.interval = None
+            self._traffic.close()
+        return stopped
+
+    def traffic_sample(self):
+        """Take one sample now (outside the Pulse schedule). False if unavailable."""
+        return self._traffic is not None and self._traffic.sample()
+
+    def traffic_rates(self, window=None, history=30):
+        """
+        Per-interface rates from the monitor's rings, busiest first.
+        Returns {running, interval, samples, span_s, interfaces: [...]} where
+        each interface has current rx/tx bytes and packets per second (last
+        interval), avg and peak byte rates over `window` seconds (default:
+        everything kept), errors/drops in that window, counter totals and
+        the last `history` per-interval rx/tx byte rates (oldest first).
+        """
+        if self._traffic is None:
+            return {"running": False, "interval": None, "samples": 0,
+                    "span_s": 0, "interfaces": []}
+        report = self._traffic.rates(window, history)
+        report.update({"running": self._traffic.interval is not None,
+                       "interval": self._traffic.interval})
+        report["interfaces"].sort(key=lambda i: -(i["rx_bps"] + i["tx_bps"]))
+        return report
+
+    # =========================================================================
+    # DNS RESOLVER
+    # =========================================================================
+
+    def resolve_dns(self, hostname, family=socket.AF_UNSPEC):
+        """
+        Cached name lookup (getaddrinfo, so IPv4 and IPv6).
+        Answers are reused for dns_ttl seconds and failures for
+        dns_negative_ttl; concurrent lookups of one name share a single
+        resolver call. IP literals are answered without touching the cache.
+        Returns {hostname, resolved, ip, addresses, ipv4, ipv6, cached,
+        elapsed_ms} plus error when unresolved. ip prefers IPv4;
+        addresses keeps the system's preference order.
+        """
+        start = time.perf_counter()
+        name = str(hostname).strip()
+        if _is_ip_literal(name):
+            entry, cached = _dns_entry(name, [name]), False
+        else:
+            entry, cached = self._resolve_cached(name.lower().rstrip("."), family)
+        entry = dict(entry, hostname=hostname, cached=cached)
+        entry["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 3)
+        return entry
+
+    def _resolve_cached(self, key_name, family):
+        key = (key_name, family)
+        with self._dns_lock:
+            hit = self._dns_cache.get(key)
+            if hit and hit[0] > time.monotonic():
+                self._dns_stats["hits" if hit[1]["resolved"] else "negative_hits"] += 1
+                return hit[1], True
+            future = self._dns_inflight.get(key)
+            owner = future is None
+            if owner:
+                future = self._dns_inflight[key] = Future()
+                self._dns_stats["misses"] += 1
+            else:
+                self._dns_stats["hits"] += 1
+        if not owner:
+            return future.result(), True
+
+        start = time.perf_counter()
+        try:
+            entry = _getaddrinfo_entry(key_name, family)
+        except Exception as e:
+            entry = _dns_entry(key_name, [], error=str(e))
+        ttl = self.dns_ttl if entry["resolved"] else self.dns_negative_ttl
+        with self._dns_lock:
+            self._dns_stats["lookup_ms"] += (time.perf_counter() - start) * 1000
+            if ttl > 0:
+                self._dns_cache[key] = (time.monotonic() + ttl, entry)
+                self._dns_cache.move_to_end(key)
+                while len(self._dns_cache) > DNS_CACHE_MAX:
+                    self._dns_cache.popitem(last=False)
+            del self._dns_inflight[key]
+        future.set_result(entry)
+        return entry, False
+
+    def resolve_dns_many(self, hostnames, family=socket.AF_UNSPEC,
+                         workers=DNS_WORKERS, on_result=None):
+        """
+        Resolve many names concurrently (thread pool; cache hits and IP
+        literals never wait on it). Returns one resolve_dns() result per
+        name in input order; on_result(entry) fires as each completes.
+        """
+        hostnames = list(dict.fromkeys(hostnames))
+        results = {}
+        pending = []
+        for name in hostnames:
+            if _is_ip_literal(name):
+                results[name] = self.resolve_dns(name, family)
+                if on_result:
+                    on_result(results[name])
+            else:
+                pending.append(name)
+
+        if pending:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(pending))),
+                                    thread_name_prefix="GhostDNS") as pool:
+                futures = {pool.submit(self.resolve_dns, name, family): name
+                           for name in pending}
+                for future in as_completed(futures):
+                    results[futures[future]] = future.result()
+                    if on_result:
+                        on_result(results[futures[future]])
+        return [results[name] for name in hostnames]
+
+    def resolve_address(self, hostname, family=socket.AF_UNSPEC):
+        """(family, address) to connect to for a name, or None if it doesn't resolve."""
+        entry = self.resolve_dns(hostname, family)
+        if not entry["resolved"]:
+            return None
+        address = entry["addresses"][0]
+        return (socket.AF_INET6 if ":" in address else socket.AF_INET), address
+
+    def resolve_url(self, url):
+        """
+        Candidate (url, host_header) pairs for a URL, in resolver order: one
+        per cached address, the host swapped for it (userinfo kept) and the
+        original host for the Host header. https URLs and IP literals come
+        back unchanged as the only candidate - pinning https to an address
+        would break TLS hostname checks and SNI. [] when the name doesn't
+        resolve.
+        """
+        parts = urllib.parse.urlsplit(url)
+        host = parts.hostname
+        if not host or _is_ip_literal(host) or parts.scheme == "https":
+            return [(url, None)]
+        entry = self.resolve_dns(host)
+        if not entry["resolved"]:
+            return []
+        userinfo, _, host_header = parts.netloc.rpartition("@")
+        candidates = []
+        for address in entry["addresses"]:
+            netloc = f"[{address}]" if ":" in address else address
+            if parts.port:
+                netloc += f":{parts.port}"
+            if userinfo:
+                netloc = f"{userinfo}@{netloc}"
+            candidates.append((urllib.parse.urlunsplit(parts._replace(netloc=netloc)), host_header))
+        return candidates
+
+    def open_url(self, url, data=None, headers=None, timeout=10):
+        """
+        urllib.request.urlopen() through the resolver cache. Each candidate
+        from resolve_url() is tried in order and a connection failure moves
+        on to the next address, as getaddrinfo-based connects do (localhost
+        is often ::1 first while a server listens only on 127.0.0.1). An
+        HTTP error is the server's answer and is raised as-is. Raises
+        OSError when the name doesn't resolve.
+        """
+        candidates = self.resolve_url(url)
+        if not candidates:
+            raise OSError(f"cannot resolve {urllib.parse.urlsplit(url).hostname}")
+        error = None
+        for target, host_header in candidates:
+            request_headers = dict(headers or {})
+            if host_header:
+                request_headers["Host"] = host_header
+            request = urllib.request.Request(target, data=data, headers=request_headers)
+            try:
+                return urllib.request.urlopen(request, timeout=timeout)
+            except urllib.error.HTTPError:
+                raise
+            except OSError as e:        # URLError, refused, unreachable, timeout
+                error = e
+        raise error
+
+    def dns_stats(self):
+        """Resolver cache statistics."""
+        with self._dns_lock:
+            stats = dict(self._dns_stats)
+            entries = len(self._dns_cache)
+            negative = sum(1 for _exp, e in self._dns_cache.values() if not e["resolved"])
+        answered = stats["hits"] + stats["negative_hits"]
+        lookups = answered + stats["misses"]
+        return {
+            "entries": entries,
+            "negative_entries": negative,
+            "hits": stats["hits"],
+            "negative_hits": stats["negative_hits"],
+            "misses": stats["misses"],
+            "hit_rate_pct": round(answered / lookups * 100, 1) if lookups else 0.0,
+            "avg_lookup_ms": round(stats["lookup_ms"] / stats["misses"], 2) if stats["misses"] else 0.0,
+            "ttl_s": self.dns_ttl,
+            "negative_ttl_s": self.dns_negative_ttl,
+        }
+
+    def flush_dns_cache(self):
+        """Drop every cached answer. Returns how many entries were removed."""
+        with self._dns_lock:
+            count = len(self._dns_cache)
+            self._dns_cache.clear()
+        return count
+
+
+# ─── helpers ──────────────────────────────────────────────────────────────────
+
+def _is_ip_literal(name):
+    try:
+        ipaddress.ip_address(str(name).split("%")[0])
+        return True
+    except ValueError:
+        return False
+
+
+def _getaddrinfo_entry(hostname, family):
+    """Uncached lookup -> resolver entry (see resolve_dns)."""
+    try:
+        infos = socket.getaddrinfo(hostname, None, family, socket.SOCK_STREAM)
+    except (socket.gaierror, socket.herror, UnicodeError) as e:
+        return _dns_entry(hostname, [], error=str(e))
+    return _dns_entry(hostname, [info[4][0] for info in infos])
+
+
+def _dns_entry(hostname, addresses, error=None):
+    addresses = list(dict.fromkeys(addresses))
+    ipv4 = [a for a in addresses if ":" not in a]
+    ipv6 = [a for a in addresses if ":" in a]
+    entry = {
+        "hostname": hostname,
+        "resolved": bool(addresses),
+        "ip": (ipv4 or ipv6 or [None])[0],
+        "addresses": addresses,
+        "ipv4": ipv4,
+        "ipv6": ipv6,
+    }
+    if not addresses:
+        entry["error"] = error or "no addresses"
+    return entry
+
+
+async def _probe_port(host, address, port, timeout, banner):
+    """One TCP connect probe -> {host, address, port, state, latency_ms, service, banner}."""
+    probe = {"host": host, "address": address, "port": port, "state": "filtered",
+             "latency_ms": None, "service": _service_name(port), "banner": None}
+    start = time.perf_counter()
+    writer = None
+    try:
+        reader, writer = await asyncio.wait_for(
+            asyncio.open_connection(address, port), timeout)
+        probe["state"] = "open"
+        probe["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        if banner:
+            probe["banner"] = await _grab_banner(reader, writer, host, port)
+    except ConnectionRefusedError:
+        probe["state"] = "closed"
+        probe["latency_ms"] = round((time.perf_counter() - start) * 1000, 2)
+    except asyncio.TimeoutError:
+        pass
+    except OSError as e:
+        probe["state"] = "closed" if e.errno == errno.ECONNREFUSED else "error"
+    finally:
+        if writer is not None:
+            writer.close()
+    return probe
+
+
+async def _grab_banner(reader, writer, host, port):
+    """First line a service volunteers (or answers to HEAD), printable, <= 80 chars."""
+    try:
+        if port in HTTP_PROBE_PORTS:
+            writer.write(f"HEAD / HTTP/1.0\r\nHost: {host}\r\n\r\n".encode())
+            await writer.drain()
+        data = await asyncio.wait_for(reader.read(256), SCAN_BANNER_TIMEOUT)
+    except (asyncio.TimeoutError, OSError):
+        return None
+    text = data.decode("utf-8", errors="replace").strip().splitlines()
+    if not text:
+        return None
+    line = "".join(ch for ch in text[0] if ch.isprintable())
+    return line[:80] or None
+
+
+def _service_name(port):
+    try:
+        return socket.getservbyport(port, "tcp")
+    except OSError:
+        return None
+
+
+def _fd_budget():
+    """Sockets we can safely hold open at once (soft RLIMIT_NOFILE minus headroom)."""
+    try:
+        import resource
+        soft, _hard = resource.getrlimit(resource.RLIMIT_NOFILE)
+        if soft != resource.RLIM_INFINITY:
+            return max(16, soft - 64)
+    except (ImportError, ValueError, OSError):
+        pass
+    return SCAN_CONCURRENCY
+
+
+def _parse_ping_line(line, os_type):
+    """
+    One line of ping output -> (seq, ms) for a reply, (seq, None) for a
+    reported loss, or None for anything else. seq is None on Windows.
+    """
+    seq_match = _PING_SEQ.search(line)
+    seq = int(seq_match.group(1)) if seq_match else None
+    time_match = _PING_TIME.search(line)
+    if time_match and ("bytes from" in line or "Reply from" in line):
+        return seq, float(time_match.group(1))
+    if _PING_LOST.search(line) and (seq is not None or os_type == "WINDOWS"):
+        return seq, None
+    return None
+
+
+def _ping_not_permitted(returncode, stderr):
+    """True when ping failed for lack of privileges rather than no reply."""
+    if returncode in (0, 1):
+        return False
+    text = (stderr or "").lower()
+    return any(s in text for s in ("permission", "not permitted", "socket:", "setuid"))
+
+
+def _tcp_connect_ms(family, address, port, timeout):
+    """Milliseconds to connect (or be refused), or None on timeout/no route."""
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(timeout)
+    start = time.perf_counter()
+    try:
+        sock.connect((address, port))
+    except ConnectionRefusedError:
+        pass                                # RST: host is up
+    except OSError as e:
+        if e.errno != errno.ECONNREFUSED:
+            return None
+    finally:
+        sock.close()
+    return (time.perf_counter() - start) * 1000
+
+
+def _trace_round(family, address, hops, timeout):
+    """
+    One round: a UDP probe for every TTL 1..hops, all in flight together.
+    Returns ({ttl: (responder, ms)}, end) where end is (ttl, "reached" or
+    "unreachable") for the nearest hop that ended the path, else None.
+    """
+    if family == socket.AF_INET6:
+        level, hop_opt, recverr = socket.IPPROTO_IPV6, socket.IPV6_UNICAST_HOPS, IPV6_RECVERR
+    else:
+        level, hop_opt, recverr = socket.IPPROTO_IP, socket.IP_TTL, IP_RECVERR
+
+    poller = select.poll()
+    pending = {}                # {fd: (ttl, sock, sent_at)}
+    sockets = []
+    replies, end = {}, None
+    try:
+        for ttl in range(1, hops + 1):
+            sock = socket.socket(family, socket.SOCK_DGRAM)
+            sockets.append(sock)
+            try:
+                sock.setsockopt(level, recverr, 1)
+                sock.setsockopt(level, hop_opt, ttl)
+                sock.connect((address, TRACE_BASE_PORT + ttl))
+                sent_at = time.perf_counter()
+                sock.send(TRACE_PAYLOAD)
+            except OSError:
+                continue            # no route: counts as lost
+            pending[sock.fileno()] = (ttl, sock, sent_at)
+            poller.register(sock, select.POLLERR)
+
+        deadline = time.perf_counter() + timeout
+        while pending:
+            # Done once every hop up to the end of the path has answered
+            if end and not any(ttl < end[0] for ttl, _s, _t in pending.values()):
+                break
+            remaining = deadline - time.perf_counter()
+            if remaining <= 0:
+                break
+            for fd, _event in poller.poll(remaining * 1000):
+                ttl, sock, sent_at = pending.pop(fd)
+                poller.unregister(fd)
+                error = _read_icmp_error(sock, family, level, recverr)
+                if error is None:
+                    continue
+                responder, final = error
+                replies[ttl] = (responder, round((time.perf_counter() - sent_at) * 1000, 3))
+                if final and (end is None or ttl < end[0]):
+                    kind = "reached" if final == "port" or responder == address else "unreachable"
+                    end = (ttl, kind)
+    finally:
+        for sock in sockets:
+            sock.close()
+    return replies, end
+
+
+def _read_icmp_error(sock, family, level, recverr):
+    """
+    Pull one ICMP error off a socket's error queue -> (responder, final) where
+    final is None (time exceeded), "port" (destination port unreachable) or
+    "other" (any other unreachable), or None if it wasn't an ICMP reply.
+    """
+    try:
+        _data, ancdata, _flags, _addr = sock.recvmsg(512, 512, MSG_ERRQUEUE)
+    except OSError:
+        return None
+    for cmsg_level, cmsg_type, data in ancdata:
+        if (cmsg_level, cmsg_type) != (level, recverr) or len(data) < 16:
+            continue
+        # struct sock_extended_err, then the offender's sockaddr
+        _errno, origin, icmp_type, code = struct.unpack_from("=IBBB", data)
+        if family == socket.AF_INET6:
+            if origin != 3:         # SO_EE_ORIGIN_ICMP6
+                return None
+            responder = socket.inet_ntop(family, data[24:40])
+            unreachable, port_code = icmp_type == 1, 4
+        else:
+            if origin != 2:         # SO_EE_ORIGIN_ICMP
+                return None
+            responder = socket.inet_ntop(family, data[20:24])
+            unreachable, port_code = icmp_type == 3, 3
+        if not unreachable:
+            return responder, None
+        return responder, "port" if code == port_code else "other"
+    return None
+
+
+def _reverse_dns(addresses, timeout=2.0):
+    """{address: hostname} for those with a PTR record, looked up in parallel."""
+    names = {}
+    if not addresses:
+        return names
+    pool = ThreadPoolExecutor(max_workers=min(16, len(addresses)),
+                              thread_name_prefix="GhostRDNS")
+    futures = {pool.submit(socket.gethostbyaddr, addr): addr for addr in addresses}
+    try:
+        for future in as_completed(futures, timeout=timeout):
+            try:
+                names[futures[future]] = future.result()[0]
+            except OSError:
+                pass
+    except FuturesTimeout:
+        pass                        # slow PTR lookups just go unnamed
+    finally:
+        pool.shutdown(wait=False)
+    return names
+
+
+# ─── traffic monitor ──────────────────────────────────────────────────────────
+
+class TrafficMonitor:
+    """
+    Fixed-size rings of /proc/net/dev counters, one per interface.
+    Everything is allocated up front: one timestamp array shared by all
+    interfaces, an array("Q") of capacity x TRAFFIC_FIELDS per interface,
+    and a read buffer the kept-open proc file is preadv()'d into - a sample
+    is one syscall plus a split per line, no subprocess, no growth.
+    """
+
+    PATH = "/proc/net/dev"
+
+    def __init__(self, capacity=TRAFFIC_SAMPLES, path=PATH):
+        self.capacity = capacity
+        self.path = path
+        self.interval = None
+        self._width = len(TRAFFIC_FIELDS)
+        self._times = array("d", bytes(8 * capacity))
+        self._rings = {}            # {iface: array("Q")}
+        self._first = {}            # {iface: sample number it first appeared in}
+        self._present = {}          # {iface: seen in the latest sample}
+        self._count = 0             # samples taken; the newest is in slot (count-1) % capacity
+        self._buf = bytearray(16384)
+        self._fd = None
+        self._lock = threading.Lock()
+
+    @classmethod
+    def supported(cls):
+        return os.path.exists(cls.PATH) and hasattr(os, "preadv")
+
+    def close(self):
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+    def _read(self):
+        """The current proc file contents (a bytes view), or None."""
+        try:
+            if self._fd is None:
+                self._fd = os.open(self.path, os.O_RDONLY)
+            while True:
+                n = os.preadv(self._fd, [self._buf], 0)
+                if n < len(self._buf):
+                    return bytes(memoryview(self._buf)[:n])
+                self._buf = bytearray(len(self._buf) * 2)   # many interfaces: grow once
+        except OSError:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            return None
+
+    def sample(self):
+        """Record one sample of every interface. Returns False if unreadable."""
+        with self._lock:
+            data = self._read()
+            if data is None:
+                return False
+            now = time.monotonic()
+            if self._count and now - self._times[(self._count - 1) % self.capacity] < TRAFFIC_MIN_GAP:
+                return True
+            slot = self._count % self.capacity
+            base = slot * self._width
+            prev = ((self._count - 1) % self.capacity) * self._width
+            self._times[slot] = now
+            seen = set()
+            for line in data.splitlines()[2:]:
+                name, _, rest = line.partition(b":")
+                fields = rest.split()
+                if len(fields) < 16:
+                    continue
+                name = name.strip().decode("ascii", errors="replace")
+                ring = self._rings.get(name)
+                if ring is None:
+                    ring = self._rings[name] = array("Q", bytes(8 * self.capacity * self._width))
+                    self._first[name] = self._count
+                for offset, column in enumerate(TRAFFIC_COLUMNS):
+                    ring[base + offset] = int(fields[column])
+                seen.add(name)
+            # Vanished interfaces hold their last counters (zero rate)
+            for name, ring in self._rings.items():
+                self._present[name] = name in seen
+                if name not in seen and self._count > self._first[name]:
+                    ring[base:base + self._width] = ring[prev:prev + self._width]
+            self._count += 1
+            return True
+
+    def rates(self, window=None, history=30):
+        with self._lock:
+            kept = min(self._count, self.capacity)
+            newest = self._count - 1
+            report = {"samples": kept, "span_s": 0, "interfaces": []}
+            if kept < 2:
+                return report
+            capacity, width, times = self.capacity, self._width, self._times
+
+            def t(n):
+                return times[n % capacity]
+
+            report["span_s"] = round(t(newest) - t(newest - kept + 1), 1)
+
+            for name, ring in self._rings.items():
+                oldest = max(self._first[name], newest - kept + 1)
+                if newest - oldest < 1:
+                    continue
+                start = oldest
+                if window:
+                    while start < newest - 1 and t(newest) - t(start) > window:
+                        start += 1
+                def value(n, f, ring=ring):
+                    return ring[(n % capacity) * width + f]
+
+                def per_second(a, b, f):
+                    dt = t(b) - t(a)
+                    delta = value(b, f) - value(a, f)
+                    return delta / dt if dt > 0 and delta > 0 else 0.0
+
+                rx_rates = [per_second(n - 1, n, 0) for n in range(start + 1, newest + 1)]
+                tx_rates = [per_second(n - 1, n, 4) for n in range(start + 1, newest + 1)]
+                errors = sum(max(0, value(newest, f) - value(start, f)) for f in (2, 6))
+                drops = sum(max(0, value(newest, f) - value(start, f)) for f in (3, 7))
+                report["interfaces"].append({
+                    "name": name,
+                    "present": self._present.get(name, False),
+                    "rx_bps": round(rx_rates[-1], 1),
+                    "tx_bps": round(tx_rates[-1], 1),
+                    "rx_pps": round(per_second(newest - 1, newest, 1), 1),
+                    "tx_pps": round(per_second(newest - 1, newest, 5), 1),
+                    "rx_avg_bps": round(per_second(start, newest, 0), 1),
+                    "tx_avg_bps": round(per_second(start, newest, 4), 1),
+                    "rx_peak_bps": round(max(rx_rates), 1),
+                    "tx_peak_bps": round(max(tx_rates), 1),
+                    "errors": errors,
+                    "drops": drops,
+                    "rx_total": value(newest, 0),
+                    "tx_total": value(newest, 4),
+                    "window_s": round(t(newest) - t(start), 1),
+                    "history_rx": [round(r, 1) for r in rx_rates[-history:]],
+                    "history_tx": [round(r, 1) for r in tx_rates[-history:]],
+                })
+            return report
+
+
+# ─── bench server ─────────────────────────────────────────────────────────────
+
+class _BenchServer(socketserver.ThreadingTCPServer):
+    daemon_threads = True
+    allow_reuse_address = True
+
+    def __init__(self, server_address, handler, family=socket.AF_INET):
+        self.address_family = family
+        self.active = 0
+        self._slots = threading.BoundedSemaphore(BENCH_MAX_STREAMS)
+        self._active_lock = threading.Lock()
+        super().__init__(server_address, handler)
+
+    def verify_request(self, request, client_address):
+        # Refuse (close) rather than queue once every slot is busy
+        return self._slots.acquire(blocking=False)
+
+    def process_request_thread(self, request, client_address):
+        with self._active_lock:
+            self.active += 1
+        try:
+            super().process_request_thread(request, client_address)
+        finally:
+            with self._active_lock:
+                self.active -= 1
+            self._slots.release()
+
+
+class _BenchHandler(socketserver.BaseRequestHandler):
+    """One bench connection: "GHOSTBENCH sink|source <s>|echo <size>\\n", then data."""
+
+    def handle(self):
+        conn = self.request
+        conn.settimeout(BENCH_IDLE_TIMEOUT)
+        try:
+            header = _read_line(conn).split()
+            if len(header) < 2 or header[0] != BENCH_MAGIC:
+                return
+            mode = header[1]
+            if mode == "sink":
+                # Count everything until the client half-closes, then report
+                total = 0
+                buf = bytearray(BENCH_CHUNK)
+                while True:
+                    n = conn.recv_into(buf)
+                    if not n:
+                        break
+                    total += n
+                conn.sendall(f"{total}\n".encode())
+            elif mode == "source" and len(header) > 2:
+                seconds = min(float(header[2]), BENCH_MAX_SECONDS)
+                chunk = bytes(BENCH_CHUNK)
+                deadline = time.perf_counter() + seconds
+                while time.perf_counter() < deadline:
+                    conn.sendall(chunk)
+                conn.shutdown(socket.SHUT_WR)
+            elif mode == "echo" and len(header) > 2:
+                size = max(1, min(int(header[2]), BENCH_CHUNK))
+                conn.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+                buf = bytearray(size)
+                while _recv_exact(conn, buf):
+                    conn.sendall(buf)
+        except (OSError, ValueError):
+            pass                    # client went away / bad header
+
+
+# ─── bench client ─────────────────────────────────────────────────────────────
+
+def _bench_connect(family, address, port, header):
+    sock = socket.socket(family, socket.SOCK_STREAM)
+    sock.settimeout(BENCH_IDLE_TIMEOUT)
+    try:
+        sock.connect((address, port))
+        sock.sendall(f"{BENCH_MAGIC} {header}\n".encode())
+    except OSError:
+        sock.close()
+        raise
+    return sock
+
+
+def _bench_rtt(family, address, port, count, size):
+    """Round-trip times (ms) of `count` echoed `size`-byte requests, max ~10 s."""
+    sock = _bench_connect(family, address, port, f"echo {size}")
+    times = []
+    try:
+        sock.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        payload = bytes(size)
+        reply = bytearray(size)
+        deadline = time.perf_counter() + 10
+        for _ in range(count):
+            start = time.perf_counter()
+            sock.sendall(payload)
+            if not _recv_exact(sock, reply):
+                raise ConnectionError("echo connection closed")
+            times.append((time.perf_counter() - start) * 1000)
+            if start > deadline:
+                break
+    finally:
+        sock.close()
+    return times
+
+
+def _bench_streams(family, address, port, count, seconds, reverse):
+    """`count` parallel streams for `seconds` -> {streams, bytes, seconds, mbps, per_stream_mbps}."""
+    header = f"source {seconds}" if reverse else "sink"
+    sockets = [_bench_connect(family, address, port, header) for _ in range(count)]
+    received = [0] * count
+    errors = []
+    barrier = threading.Barrier(count + 1)
+
+    def send(i, sock):
+        chunk = bytes(BENCH_CHUNK)
+        barrier.wait()
+        deadline = time.perf_counter() + seconds
+        while time.perf_counter() < deadline:
+            sock.sendall(chunk)
+        sock.shutdown(socket.SHUT_WR)
+        received[i] = int(_read_line(sock) or 0)   # the server's byte count
+
+    def receive(i, sock):
+        buf = bytearray(BENCH_CHUNK)
+        barrier.wait()
+        while True:
+            n = sock.recv_into(buf)
+            if not n:
+                break
+            received[i] += n
+
+    def run(i, sock):
+        try:
+            (receive if reverse else send)(i, sock)
+        except (OSError, ValueError, threading.BrokenBarrierError) as e:
+            errors.append(str(e))
+            barrier.abort()
+
+    threads = [threading.Thread(target=run, args=(i, sock), daemon=True,
+                                name=f"GhostBench-{i}")
+               for i, sock in enumerate(sockets)]
+    try:
+        for thread in threads:
+            thread.start()
+        try:
+            barrier.wait()
+        except threading.BrokenBarrierError:
+            pass                    # a stream failed to start; reported below
+        start = time.perf_counter()
+        for thread in threads:
+            thread.join()
+        elapsed = time.perf_counter() - start
+    finally:
+        for sock in sockets:
+            sock.close()
+    if errors:
+        raise OSError(errors[0])
+
+    total = sum(received)
+    mbps = total * 8 / elapsed / 1e6 if elapsed > 0 else 0.0
+    return {
+        "streams": count,
+        "bytes": total,
+        "seconds": round(elapsed, 2),
+        "mbps": round(mbps, 1),
+        "per_stream_mbps": round(mbps / count, 1),
+    }
+
+
+def _latency_percentiles(times):
+    """min/avg/max/jitter and p50/p90/p99 (ms) of a list of RTTs."""
+    if not times:
+        return {"count": 0}
+    if len(times) > 1:
+        cuts = statistics.quantiles(times, n=100, method="inclusive")
+        p50, p90, p99 = cuts[49], cuts[89], cuts[98]
+    else:
+        p50 = p90 = p99 = times[0]
+    return {
+        "count": len(times),
+        "min_ms": round(min(times), 3),
+        "avg_ms": round(statistics.mean(times), 3),
+        "max_ms": round(max(times), 3),
+        "jitter_ms": round(statistics.stdev(times), 3) if len(times) > 1 else 0.0,
+        "p50_ms": round(p50, 3),
+        "p90_ms": round(p90, 3),
+        "p99_ms": round(p99, 3),
+    }
+
+
+def _recv_exact(sock, buf):
+    """Fill `buf` from the socket. False on EOF before it's full."""
+    view = memoryview(buf)
+    while view:
+        n = sock.recv_into(view)
+        if not n:
+            return False
+        view = view[n:]
+    return True
+
+
+def _read_line(sock, limit=128):
+    """Read one short newline-terminated header/ack line (byte at a time)."""
+    data = bytearray()
+    while len(data) < limit:
+        byte = sock.recv(1)
+        if not byte or byte == b"\n":
+            break
+        data += byte
+    return data.decode("ascii", errors="replace").strip()
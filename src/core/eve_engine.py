@@ -33,6 +33,7 @@ class EveEngine:
 
     ENGINE_NAME = "eve"
     ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = ["ghost_core", "legion"]  # blackbox: optional, fetched lazily for open_url()
     OPERATIONAL = True
 
     # Tier configurations based on Gemini hardware discussion:
@@ -160,10 +161,21 @@ class EveEngine:
         self.active_tier = "offline"
 
     def _check_ollama(self, base_url):
-        """Check if an Ollama instance is reachable."""
+        """
+        Check if an Ollama instance is reachable.
+        The host is looked up through BlackBox's resolver cache, so repeated
+        probes (tier detection, status) skip DNS and a name that recently
+        failed to resolve is rejected without a request; every address of
+        the name is tried before giving up.
+        """
         try:
             import urllib.request
-            urllib.request.urlopen(base_url + "/api/tags", timeout=2)
+            url = base_url + "/api/tags"
+            blackbox = self.kernel.get_engine("blackbox")
+            if blackbox:
+                blackbox.open_url(url, timeout=2).close()
+            else:
+                urllib.request.urlopen(url, timeout=2).close()
             return True
         except Exception:
             return False
@@ -27,6 +27,7 @@ class GhostCoreEngine:
 
     ENGINE_NAME = "ghost_core"
     ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = []
 
     def __init__(self, kernel):
         self.kernel = kernel
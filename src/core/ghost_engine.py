@@ -4,13 +4,103 @@ Engine 03: Ghost Engine - The Shadow
 Stealth and anti-forensics. Cleans up temp files on shutdown.
 Maintains minimal process footprint.
 
+Bytecode policy ("bytecode_policy" in settings.json, applied by main.py
+before anything under src/ is imported):
+  shadow  (default) .pyc files go to a host-local shadow dir via
+          sys.pycache_prefix, reused across sessions on this machine and
+          only wiped by an explicit `cleanup`. Nothing is written to the stick.
+  wipe    Legacy: __pycache__ in the tree, removed on every shutdown.
+  none    Never write bytecode (sys.dont_write_bytecode).
+  keep    __pycache__ in the tree, never removed (dev machines).
+
 Compartmentalization:
 - Runs primarily during kernel shutdown
 - Does NOT interfere with running operations
 """
 
 import os
+import sys
+import json
+import stat
 import shutil
+import tempfile
+
+
+BYTECODE_POLICIES = ("shadow", "wipe", "none", "keep")
+DEFAULT_BYTECODE_POLICY = "shadow"
+SHADOW_PYCACHE_NAME = "ghost_pycache"
+
+
+def read_bytecode_policy(root_dir):
+    """Read bytecode_policy from settings.json (default: shadow)."""
+    settings_path = os.path.join(root_dir, "data", "config", "settings.json")
+    try:
+        with open(settings_path, 'r') as f:
+            policy = json.load(f).get("bytecode_policy", DEFAULT_BYTECODE_POLICY)
+    except Exception:
+        policy = DEFAULT_BYTECODE_POLICY
+    return policy if policy in BYTECODE_POLICIES else DEFAULT_BYTECODE_POLICY
+
+
+def shadow_pycache_dir():
+    """
+    Host-local directory that holds shadowed bytecode. Per user: the shared
+    temp dir gets the uid in the name (Windows temp dirs are already per user).
+    """
+    name = SHADOW_PYCACHE_NAME
+    if hasattr(os, "getuid"):
+        name = f"{name}-{os.getuid()}"
+    return os.path.join(tempfile.gettempdir(), name)
+
+
+def _private_dir(path):
+    """
+    Create `path` as a 0700 directory (or accept an existing one) and return
+    True only if it is safe to import bytecode from: a real directory, not a
+    symlink, owned by us and not writable by group or others. Anyone else
+    able to plant .pyc files there could run code inside the shell.
+    """
+    try:
+        os.mkdir(path, 0o700)
+    except FileExistsError:
+        pass
+    except OSError:
+        return False
+    if not hasattr(os, "getuid"):
+        return os.path.isdir(path)
+    try:
+        st = os.lstat(path)
+    except OSError:
+        return False
+    return (
+        stat.S_ISDIR(st.st_mode)
+        and st.st_uid == os.getuid()
+        and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+    )
+
+
+def apply_bytecode_policy(root_dir):
+    """
+    Configure where (and whether) Python writes bytecode for this process.
+    Must run before the kernel is imported. An explicit PYTHONPYCACHEPREFIX
+    from the environment always wins. Returns the policy applied.
+    """
+    policy = read_bytecode_policy(root_dir)
+
+    if policy == "none":
+        sys.dont_write_bytecode = True
+        return policy
+
+    sys.dont_write_bytecode = False
+    if policy == "shadow" and not sys.pycache_prefix:
+        shadow = shadow_pycache_dir()
+        if _private_dir(shadow):
+            sys.pycache_prefix = shadow
+        else:
+            # Host temp not writable, or the dir isn't ours alone - don't
+            # import bytecode from it, and don't fall back to writing on the stick
+            sys.dont_write_bytecode = True
+    return policy
 
 
 class GhostEngine:
@@ -18,6 +108,7 @@ class GhostEngine:
 
     ENGINE_NAME = "ghost"
     ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
@@ -28,14 +119,22 @@ class GhostEngine:
         self.cleanup_extensions = [
             ".pyc", ".pyo",
         ]
+        self.bytecode_policy = read_bytecode_policy(self.root_dir)
         # Register for shutdown event
         kernel.on("shutdown", lambda data: self.cleanup())
 
     def cleanup(self):
-        """Clean up temp files and caches. Called on shutdown."""
+        """
+        Clean up temp files and caches. Called on shutdown.
+        Only touches the tree; the shadow bytecode dir survives for the next
+        boot (see clear_bytecode_shadow).
+        """
         removed_dirs = 0
         removed_files = 0
 
+        if self.bytecode_policy == "keep":
+            return {"dirs_removed": 0, "files_removed": 0}
+
         for root, dirs, files in os.walk(self.root_dir):
             # Skip .git directory
             if ".git" in root:
@@ -66,6 +165,29 @@ class GhostEngine:
             "files_removed": removed_files,
         }
 
+    def clear_bytecode_shadow(self):
+        """
+        Wipe the host-local shadow bytecode dir (explicit `cleanup` only).
+        Returns number of .pyc files removed.
+        """
+        shadow = shadow_pycache_dir()
+        if not os.path.isdir(shadow) or not _private_dir(shadow):
+            return 0
+
+        removed = 0
+        for _, _, files in os.walk(shadow):
+            removed += sum(1 for f in files if f.endswith(".pyc"))
+        shutil.rmtree(shadow, ignore_errors=True)
+        return removed
+
+    def get_bytecode_status(self):
+        """Where bytecode currently goes, for status/cleanup reporting."""
+        return {
+            "policy": self.bytecode_policy,
+            "prefix": sys.pycache_prefix,
+            "writes_bytecode": not sys.dont_write_bytecode,
+        }
+
     def get_footprint(self):
         """Calculate current disk footprint of Ghost Shell."""
         total_size = 0
@@ -2,7 +2,10 @@
 Engine 11: Heartbeat Engine - The Immune System
 =================================================
 Memory usage, thread health, engine status, self-diagnostics.
-Boot diagnostics: py_compile checks, required directory verification.
+Boot diagnostics: syntax checks, required directory verification.
+Syntax checks are incremental: results are cached in data/cache/diagnostics.json
+keyed by path + mtime + size, so unchanged files are never re-compiled.
+Boot profiling: keeps the last BOOT_HISTORY_SIZE kernel boot profiles.
 
 Compartmentalization:
 - Read-only monitoring
@@ -12,6 +15,7 @@ Compartmentalization:
 import threading
 import sys
 import os
+import json
 import time
 import py_compile
 import glob as glob_module
@@ -32,18 +36,26 @@ REQUIRED_DIRS = [
     "src/commands/custom",
 ]
 
+# Syntax-check cache (path + mtime + size -> last result)
+DIAGNOSTICS_CACHE = os.path.join("data", "cache", "diagnostics.json")
+
+# How many boot profiles to keep in data/session/boot_history.json
+BOOT_HISTORY_SIZE = 20
+
 
 class HeartbeatEngine:
     """The Immune System - health monitoring and boot diagnostics."""
 
     ENGINE_NAME = "heartbeat"
     ENGINE_VERSION = "2.0.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
         self.root_dir = kernel.root_dir
         self.boot_time = time.time()
         self._last_diagnostics = None
+        self._last_scan = {"files": 0, "rechecked": 0}
 
     # =========================================================================
     # BOOT DIAGNOSTICS
@@ -60,6 +72,8 @@ class HeartbeatEngine:
             "timestamp": time.time(),
             "clean": True,
         }
+        report["files_checked"] = self._last_scan["files"]
+        report["files_rechecked"] = self._last_scan["rechecked"]
         report["clean"] = (
             len(report["syntax_errors"]) == 0 and
             len(report["missing_dirs"]) == 0
@@ -69,15 +83,25 @@ class HeartbeatEngine:
 
     def check_python_modules(self):
         """
-        py_compile all .py files under src/.
+        Syntax-check all .py files under src/, re-checking only files whose
+        mtime or size changed since the cached result.
+        By default compiles in memory (no .pyc written); set
+        "diagnostics_write_bytecode": true in settings.json to py_compile instead.
         Returns list of dicts: [{file, error}] for files with syntax errors.
         """
         errors = []
         src_dir = os.path.join(self.root_dir, "src")
+        self._last_scan = {"files": 0, "rechecked": 0}
 
         if not os.path.exists(src_dir):
             return errors
 
+        cache = self._load_diagnostics_cache()
+        cached_files = cache["files"]
+        seen = {}
+        dirty = False
+        write_bytecode = bool(self.kernel.settings.get("diagnostics_write_bytecode", False))
+
         # Walk src/ tree
         for dirpath, dirnames, filenames in os.walk(src_dir):
             # Skip __pycache__ dirs
@@ -86,21 +110,81 @@ class HeartbeatEngine:
                 if not filename.endswith(".py"):
                     continue
                 filepath = os.path.join(dirpath, filename)
+                # Make path relative for cleaner output
+                rel_path = os.path.relpath(filepath, self.root_dir)
                 try:
-                    py_compile.compile(filepath, doraise=True)
-                except py_compile.PyCompileError as e:
-                    # Make path relative for cleaner output
-                    rel_path = os.path.relpath(filepath, self.root_dir)
-                    errors.append({
-                        "file": rel_path,
-                        "error": str(e).split('\n')[0],  # First line only
-                    })
-                except Exception as e:
-                    rel_path = os.path.relpath(filepath, self.root_dir)
+                    st = os.stat(filepath)
+                except OSError as e:
                     errors.append({"file": rel_path, "error": str(e)})
+                    continue
+
+                entry = cached_files.get(rel_path)
+                if not entry or entry.get("mtime_ns") != st.st_mtime_ns or entry.get("size") != st.st_size:
+                    entry = {
+                        "mtime_ns": st.st_mtime_ns,
+                        "size": st.st_size,
+                        "error": self._syntax_check(filepath, write_bytecode),
+                    }
+                    dirty = True
+                    self._last_scan["rechecked"] += 1
+
+                seen[rel_path] = entry
+                self._last_scan["files"] += 1
+                if entry["error"]:
+                    errors.append({"file": rel_path, "error": entry["error"]})
+
+        # Deleted files drop out of the cache too
+        if dirty or len(seen) != len(cached_files):
+            cache["files"] = seen
+            self._save_diagnostics_cache(cache)
 
         return errors
 
+    def _syntax_check(self, filepath, write_bytecode=False):
+        """Compile one file. Returns None if clean, else a one-line error."""
+        if write_bytecode:
+            try:
+                py_compile.compile(filepath, doraise=True)
+                return None
+            except py_compile.PyCompileError as e:
+                return str(e).split('\n')[0]  # First line only
+            except Exception as e:
+                return str(e)
+
+        try:
+            with open(filepath, 'rb') as f:
+                source = f.read()
+            compile(source, filepath, "exec", dont_inherit=True)
+            return None
+        except SyntaxError as e:
+            return f"{type(e).__name__}: {e.msg} (line {e.lineno})"
+        except Exception as e:
+            return str(e)
+
+    def _load_diagnostics_cache(self):
+        """Load the syntax-check cache; discarded if written by another Python."""
+        cache_file = os.path.join(self.root_dir, DIAGNOSTICS_CACHE)
+        empty = {"python": sys.version, "files": {}}
+        if not os.path.exists(cache_file):
+            return empty
+        try:
+            with open(cache_file, 'r') as f:
+                cache = json.load(f)
+            if cache.get("python") != sys.version or not isinstance(cache.get("files"), dict):
+                return empty
+            return cache
+        except Exception:
+            return empty
+
+    def _save_diagnostics_cache(self, cache):
+        cache_file = os.path.join(self.root_dir, DIAGNOSTICS_CACHE)
+        try:
+            os.makedirs(os.path.dirname(cache_file), exist_ok=True)
+            with open(cache_file, 'w') as f:
+                json.dump(cache, f)
+        except Exception:
+            pass  # Cache is an optimisation only
+
     def check_required_dirs(self):
         """
         Verify all required directories exist.
@@ -136,6 +220,41 @@ class HeartbeatEngine:
         """Return the most recent boot diagnostics report, or None."""
         return self._last_diagnostics
 
+    # =========================================================================
+    # BOOT PROFILING
+    # =========================================================================
+
+    def _boot_history_file(self):
+        return os.path.join(self.root_dir, "data", "session", "boot_history.json")
+
+    def record_boot_profile(self, profile):
+        """Append a kernel boot profile to the rolling boot history."""
+        history = self.get_boot_history()
+        history.append(profile)
+        history = history[-BOOT_HISTORY_SIZE:]
+
+        history_file = self._boot_history_file()
+        try:
+            os.makedirs(os.path.dirname(history_file), exist_ok=True)
+            with open(history_file, 'w') as f:
+                json.dump(history, f, indent=2)
+        except Exception:
+            pass  # History is nice-to-have, never fatal
+
+    def get_boot_history(self, limit=None):
+        """Return stored boot profiles, oldest first (last `limit` if given)."""
+        history_file = self._boot_history_file()
+        if not os.path.exists(history_file):
+            return []
+        try:
+            with open(history_file, 'r') as f:
+                history = json.load(f)
+        except Exception:
+            return []
+        if not isinstance(history, list):
+            return []
+        return history[-limit:] if limit else history
+
     # =========================================================================
     # RUNTIME HEALTH
     # =========================================================================
@@ -180,17 +299,21 @@ class HeartbeatEngine:
             return {"rss_mb": "unknown", "source": "unavailable"}
 
     def _check_engines(self):
-        """Check which engines are loaded vs failed."""
+        """Check which engines are loaded vs failed vs deferred (lazy boot)."""
         loaded = []
         failed = []
+        deferred = []
         for name, engine in self.kernel.engines.items():
-            if engine is not None:
+            if self.kernel.is_lazy(name):
+                deferred.append(name)
+            elif engine is not None:
                 loaded.append(name)
             else:
                 failed.append(name)
         return {
             "loaded": loaded,
             "failed": failed,
+            "deferred": deferred,
             "total": len(self.kernel.engines),
         }
 
@@ -27,7 +27,8 @@ class InterfaceEngine:
     """The Face - visual presentation and theming."""
 
     ENGINE_NAME = "interface"
-    ENGINE_VERSION = "2.0.0"
+    ENGINE_VERSION = "2.1.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     # === ASCII BANNERS ===
     BANNER_GOD = r"""
@@ -131,6 +132,17 @@ class InterfaceEngine:
         ]
         return "\n".join(lines)
 
+    SPARK_CHARS = "▁▂▃▄▅▆▇█"
+
+    def format_sparkline(self, values, width=None):
+        """One-line trend of numbers (last `width` values), scaled to their max."""
+        values = list(values)[-width:] if width else list(values)
+        peak = max(values, default=0)
+        if peak <= 0:
+            return self.SPARK_CHARS[0] * len(values)
+        top = len(self.SPARK_CHARS) - 1
+        return "".join(self.SPARK_CHARS[min(top, int(v / peak * top + 0.5))] for v in values)
+
     def format_todo_list(self, items):
         """Format todo list for display."""
         if not items:
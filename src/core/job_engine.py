@@ -0,0 +1,283 @@
+"""
+Engine 15: Job Engine - The Foreman
+=====================================
+Background jobs. A command line ending in `&` runs on its own thread while
+the shell keeps accepting input; `jobs`, `fg`, `kill` and `wait` manage it.
+
+Job table:
+- Ghost commands and library scripts run on a job thread
+- Host commands run as a subprocess in their own process group (so Ctrl+C
+  at the prompt doesn't reach them), with no timeout
+- Output is spooled to data/session/jobs/<session>-<id>.log as it arrives
+
+Compartmentalization:
+- Executes only through the kernel (execute_captured), never directly
+- Can signal the subprocesses it started - nothing else
+- Ghost commands running on a job thread can't be interrupted
+"""
+
+import os
+import signal
+import threading
+import time
+from contextlib import nullcontext
+from datetime import datetime
+
+
+MAX_FINISHED = 20       # finished jobs kept in the table
+MAX_SPOOLS = 50         # spool files kept in data/session/jobs
+
+
+class JobEngine:
+    """The Foreman - background job control."""
+
+    ENGINE_NAME = "jobs"
+    ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = ["ghost_core"]
+
+    def __init__(self, kernel):
+        self.kernel = kernel
+        self.root_dir = kernel.root_dir
+        self.spool_dir = os.path.join(self.root_dir, "data", "session", "jobs")
+        os.makedirs(self.spool_dir, exist_ok=True)
+
+        self._jobs = {}             # {job_id: job dict}
+        self._next_id = 1
+        self._lock = threading.Lock()
+        self._local = threading.local()
+        self._notifications = []
+
+        self._prune_spools()
+        kernel.on("shutdown", lambda _data: self.kill_all())
+
+    # =========================================================================
+    # LAUNCH
+    # =========================================================================
+
+    def submit(self, command):
+        """Start `command` as a background job. Returns a job snapshot."""
+        with self._lock:
+            job_id = self._next_id
+            self._next_id += 1
+            job = {
+                "id": job_id,
+                "command": command,
+                "state": "running",
+                "started": time.time(),
+                "finished": None,
+                "returncode": None,
+                "error": None,
+                "pid": None,
+                "process": None,
+                "spool": os.path.join(
+                    self.spool_dir, f"{self.kernel.session_id}-{job_id}.log"
+                ),
+                "thread": None,
+                "done": threading.Event(),
+                # Submitter's effective role (an API caller's), kept for the job thread
+                "role": self._submitter_role(),
+            }
+            self._jobs[job_id] = job
+
+        thread = threading.Thread(
+            target=self._run, args=(job,), daemon=True, name=f"GhostJob-{job_id}"
+        )
+        job["thread"] = thread
+        thread.start()
+        return self._snapshot(job)
+
+    def _run(self, job):
+        """Job thread: execute with output spooled to the job's log."""
+        self._local.job = job
+        sec = self.kernel.get_engine("security") if job["role"] else None
+        acting = sec.acting_as(job["role"]) if sec is not None else nullcontext()
+        try:
+            with open(job["spool"], "w", encoding="utf-8", buffering=1) as spool, acting:
+                result = self.kernel.execute_captured(job["command"], spool=spool)
+            ok, error = result["ok"], result["error"]
+        except Exception as e:
+            ok, error = False, str(e)
+        finally:
+            self._local.job = None
+
+        with self._lock:
+            process = job["process"]
+            if process is not None:
+                job["returncode"] = process.returncode
+                ok = ok and process.returncode == 0
+            if job["state"] != "killed":
+                job["state"] = "done" if ok else "failed"
+            job["error"] = error
+            job["finished"] = time.time()
+            job["process"] = None
+            self._notifications.append(job["id"])
+            self._trim_finished()
+        job["done"].set()
+
+    def current_job(self):
+        """The job being executed by the calling thread, or None."""
+        return getattr(self._local, "job", None)
+
+    def attach_process(self, process):
+        """Record the subprocess started on behalf of the current job."""
+        job = self.current_job()
+        if job is not None:
+            with self._lock:
+                job["process"] = process
+                job["pid"] = process.pid
+
+    # =========================================================================
+    # CONTROL
+    # =========================================================================
+
+    def list_jobs(self):
+        """Snapshots of every job in the table, oldest first."""
+        with self._lock:
+            return [self._snapshot(job) for job in self._jobs.values()]
+
+    def get_job(self, spec=None):
+        """
+        Look up a job by "%N", "N", or None (most recent). Returns a
+        snapshot or None.
+        """
+        job = self._find(spec)
+        if job is None:
+            return None
+        with self._lock:
+            return self._snapshot(job)
+
+    def kill(self, spec, sig=None):
+        """Signal a job's subprocess (SIGTERM by default). Returns (ok, message)."""
+        job = self._find(spec)
+        if job is None:
+            return False, f"No such job: {spec}"
+
+        with self._lock:
+            if job["state"] != "running":
+                return False, f"[{job['id']}] already {job['state']}"
+            process = job["process"]
+            if process is None:
+                return False, (f"[{job['id']}] is a Ghost command on a job thread "
+                               "and can't be interrupted - it finishes on its own")
+            job["state"] = "killed"
+
+        _signal_process(process, sig or signal.SIGTERM)
+        return True, f"[{job['id']}] killed: {job['command']}"
+
+    def kill_all(self):
+        """Terminate every running subprocess job (kernel shutdown)."""
+        with self._lock:
+            running = [j for j in self._jobs.values()
+                       if j["state"] == "running" and j["process"] is not None]
+            for job in running:
+                job["state"] = "killed"
+        for job in running:
+            _signal_process(job["process"], signal.SIGTERM)
+        return len(running)
+
+    def wait(self, spec=None, timeout=None):
+        """
+        Block until one job (spec) or every running job finishes.
+        Returns the snapshots waited for; raises KeyError for an unknown spec.
+        """
+        if spec is not None:
+            job = self._find(spec)
+            if job is None:
+                raise KeyError(spec)
+            targets = [job]
+        else:
+            with self._lock:
+                targets = [j for j in self._jobs.values() if j["state"] == "running"]
+
+        deadline = time.monotonic() + timeout if timeout else None
+        for job in targets:
+            # Short waits keep Ctrl+C responsive in the main thread
+            while not job["done"].wait(0.2):
+                if deadline and time.monotonic() > deadline:
+                    break
+        with self._lock:
+            return [self._snapshot(job) for job in targets]
+
+    def read_output(self, spec, offset=0):
+        """Spooled output from byte `offset`. Returns (text, new_offset)."""
+        job = self._find(spec)
+        if job is None:
+            return "", offset
+        try:
+            with open(job["spool"], "rb") as f:
+                f.seek(offset)
+                data = f.read()
+        except OSError:
+            return "", offset
+        return data.decode("utf-8", errors="replace"), offset + len(data)
+
+    def pop_notifications(self):
+        """Jobs finished since the last call (shown before the next prompt)."""
+        with self._lock:
+            ids, self._notifications = self._notifications, []
+            return [self._snapshot(self._jobs[i]) for i in ids if i in self._jobs]
+
+    # =========================================================================
+    # INTERNALS
+    # =========================================================================
+
+    def _submitter_role(self):
+        """The submitting thread's effective role, or None without security."""
+        if not self.kernel.engine_available("security"):
+            return None
+        return self.kernel.engines["security"].effective_role
+
+    def _find(self, spec):
+        with self._lock:
+            if spec is None or spec in ("%", "%%", "%+"):
+                return self._jobs[max(self._jobs)] if self._jobs else None
+            try:
+                return self._jobs.get(int(str(spec).lstrip("%")))
+            except ValueError:
+                return None
+
+    def _snapshot(self, job):
+        """Public view of a job (call with the lock held)."""
+        end = job["finished"] or time.time()
+        return {
+            "id": job["id"],
+            "command": job["command"],
+            "state": job["state"],
+            "pid": job["pid"],
+            "returncode": job["returncode"],
+            "error": job["error"],
+            "started": datetime.fromtimestamp(job["started"]).isoformat(timespec="seconds"),
+            "elapsed": round(end - job["started"], 1),
+            "spool": job["spool"],
+        }
+
+    def _trim_finished(self):
+        finished = [i for i, j in self._jobs.items() if j["state"] != "running"]
+        for job_id in finished[:-MAX_FINISHED]:
+            del self._jobs[job_id]
+
+    def _prune_spools(self):
+        """Keep only the newest MAX_SPOOLS spool files."""
+        try:
+            spools = [
+                os.path.join(self.spool_dir, name)
+                for name in os.listdir(self.spool_dir) if name.endswith(".log")
+            ]
+            spools.sort(key=os.path.getmtime)
+            for path in spools[:-MAX_SPOOLS]:
+                os.remove(path)
+        except OSError:
+            pass
+
+
+# ─── helpers ──────────────────────────────────────────────────────────────────
+
+def _signal_process(process, sig):
+    """Signal a job subprocess and its children (own process group on POSIX)."""
+    try:
+        if os.name == "nt":
+            process.kill() if sig == getattr(signal, "SIGKILL", None) else process.terminate()
+        else:
+            os.killpg(process.pid, sig)
+    except (ProcessLookupError, PermissionError, OSError):
+        pass
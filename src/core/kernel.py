@@ -5,20 +5,92 @@ Orchestrates all engine lifecycle, boot sequence, inter-engine communication,
 and the main shell loop.
 
 Architecture Notes:
-- Engines are loaded in a specific order (dependencies flow downward)
+- Engines declare ENGINE_DEPS; the kernel builds a DAG and boots independent
+  engines concurrently on a thread pool (critical engines first, serially)
 - Each engine receives a kernel reference at init (for inter-engine comms)
 - Engine failures are isolated - one bad engine doesn't crash the system
+- Lazy boot: non-critical engines can be deferred behind a LazyEngine proxy
+  and only imported/initialised on first use (see LAZY_ENGINES)
 - Future: message bus for async inter-engine communication
 """
 
 import importlib
+import io
 import sys
 import os
 import json
+import threading
 import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+from contextlib import contextmanager
 from datetime import datetime
 
 
+class LazyEngine:
+    """
+    Placeholder for an engine deferred by lazy boot.
+
+    Nothing is imported until the engine is first requested. The kernel swaps
+    the proxy for the real instance on first get_engine()/engine_available(),
+    and any attribute access on a proxy held elsewhere does the same.
+    """
+
+    LAZY = True
+
+    def __init__(self, kernel, name, module_path, class_name):
+        self._kernel = kernel
+        self._engine_name = name
+        self._module_path = module_path
+        self._class_name = class_name
+
+    def __getattr__(self, attr):
+        engine = self._kernel._materialize(self._engine_name)
+        if engine is None:
+            raise AttributeError(f"engine '{self._engine_name}' failed to load")
+        return getattr(engine, attr)
+
+    def __repr__(self):
+        return f"<LazyEngine {self._engine_name} ({self._class_name})>"
+
+
+class OutputCapture:
+    """
+    sys.stdout stand-in that diverts writes made by threads which asked for
+    capture (see GhostKernel.execute_captured); everything else goes to the
+    real stream. Lets concurrent commands each collect their own output.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._local = threading.local()
+
+    def write(self, data):
+        buffer = getattr(self._local, "buffer", None)
+        return (buffer if buffer is not None else self._stream).write(data)
+
+    def flush(self):
+        buffer = getattr(self._local, "buffer", None)
+        (buffer if buffer is not None else self._stream).flush()
+
+    def __getattr__(self, attr):
+        return getattr(self._stream, attr)
+
+    @contextmanager
+    def capture(self, target=None):
+        """
+        Collect this thread's output for the block - into `target` (any
+        writable text stream, e.g. a job spool file) or a fresh StringIO.
+        """
+        previous = getattr(self._local, "buffer", None)
+        buffer = target if target is not None else io.StringIO()
+        self._local.buffer = buffer
+        try:
+            yield buffer
+        finally:
+            self._local.buffer = previous
+
+
 class GhostKernel:
     """
     The Ghost Kernel - Central orchestrator for all engines.
@@ -31,7 +103,9 @@ class GhostKernel:
     CODENAME = "Phoenix - Eve Update"
 
     # === BOOT SEQUENCE ===
-    # Order matters! Each engine may depend on engines loaded before it.
+    # Real ordering comes from each engine class's ENGINE_DEPS (a DAG); this
+    # list fixes listing order and is the serial order when parallel boot
+    # is off, so keep dependencies above their dependents.
     # Format: (name, module_path, class_name)
     BOOT_SEQUENCE = [
         ("ghost_core",  "src.core.ghost_core",        "GhostCoreEngine"),
@@ -48,9 +122,23 @@ class GhostKernel:
         # --- Legion is now Phase 1 operational, Eve replaces Cortex ---
         ("legion",      "src.core.legion_engine",       "LegionEngine"),
         ("eve",         "src.core.eve_engine",          "EveEngine"),
+        ("api",         "src.core.api_engine",          "ApiEngine"),
+        ("jobs",        "src.core.job_engine",          "JobEngine"),
     ]
 
-    def __init__(self, root_dir, debug=False):
+    # === LAZY BOOT ===
+    # Engines that may be deferred until first use when lazy boot is enabled
+    # (`--lazy` or "lazy_boot": true in settings.json). Everything else boots
+    # eagerly: ghost registers shutdown cleanup, pulse must start, etc.
+    # Prerequisites come from each engine class's ENGINE_DEPS.
+    LAZY_ENGINES = ("blackbox", "sync", "legion", "eve")
+
+    # Must load for the kernel to be usable. Booted serially before the
+    # thread pool starts (security may prompt for first-boot setup).
+    CRITICAL_ENGINES = ("ghost_core", "security")
+    BOOT_WORKERS = 6
+
+    def __init__(self, root_dir, debug=False, lazy=False):
         self.root_dir = root_dir
         self.debug = debug
         self.engines = {}
@@ -60,12 +148,26 @@ class GhostKernel:
         self.session_id = datetime.now().strftime("%Y%m%d_%H%M%S")
         self.running = False
 
+        # Guards lazy materialisation (pulse thread may request engines too)
+        self._engine_lock = threading.RLock()
+        self._materializing = set()
+
         # === EVENT BUS (Phase 1: Simple dict-based) ===
         # Future: Replace with async message queue for Legion/Cortex
         self._event_listeners = {}
 
-        # Load aliases from config
+        # Load aliases and settings from config
         self._load_aliases()
+        self.settings = self._load_settings()
+        self.lazy = lazy or bool(self.settings.get("lazy_boot", False))
+        self.parallel_boot = bool(self.settings.get("parallel_boot", True))
+        # Foreground host commands stream and stop on Ctrl+C, so no timeout
+        # by default; background jobs never time out
+        self.passthrough_timeout = self.settings.get("passthrough_timeout")
+        self.engine_timings = {}       # {engine_name: {"import_ms", "init_ms"}}
+        self.boot_profile = None       # Per-phase/per-engine breakdown of last boot
+        self._print_lock = threading.Lock()
+        self._exec_state = threading.local()   # per-thread exit status of the last host command
 
     def _load_aliases(self):
         """Load command aliases from config file."""
@@ -77,6 +179,17 @@ class GhostKernel:
             except Exception:
                 self.aliases = {}
 
+    def _load_settings(self):
+        """Load data/config/settings.json (empty dict if missing or broken)."""
+        settings_file = os.path.join(self.root_dir, "data", "config", "settings.json")
+        if os.path.exists(settings_file):
+            try:
+                with open(settings_file, 'r') as f:
+                    return json.load(f) or {}
+            except Exception:
+                pass
+        return {}
+
     # =========================================================================
     # BOOT SEQUENCE
     # =========================================================================
@@ -87,6 +200,8 @@ class GhostKernel:
         Returns True if minimum viable system is operational.
         """
         self.boot_time = time.time()
+        boot_start = time.perf_counter()
+        phases = {}
 
         print("\n📌 Connecting to Ghost Kernel Phoenix...")
         print(f"   Version: {self.VERSION} ({self.CODENAME})")
@@ -95,22 +210,42 @@ class GhostKernel:
         print()
 
         # Phase 1: Load all engines
-        loaded = 0
-        failed = 0
-        critical_ok = True
+        phase_start = time.perf_counter()
+        deferred = 0
+        eager = []
 
         for name, module_path, class_name in self.BOOT_SEQUENCE:
-            success = self._load_engine(name, module_path, class_name)
-            if success:
-                loaded += 1
-            else:
-                failed += 1
-                # ghost_core and security are critical - must succeed
-                if name in ("ghost_core", "security"):
-                    critical_ok = False
+            # Reserve the slot so listings keep boot order under parallel load
+            self.engines[name] = None
+            if self.lazy and name in self.LAZY_ENGINES:
+                self.engines[name] = LazyEngine(self, name, module_path, class_name)
+                deferred += 1
+                if self.debug:
+                    print(f"   [~] {name:<12} ({class_name}, deferred)")
+                else:
+                    print(f"   [~] {name.capitalize()} (lazy)")
+                continue
+            eager.append((name, module_path, class_name))
+
+        if self.parallel_boot:
+            results = self._load_engines_parallel(eager)
+        else:
+            results = {
+                name: self._load_engine(name, module_path, class_name)
+                for name, module_path, class_name in eager
+            }
+
+        loaded = sum(1 for ok in results.values() if ok)
+        failed = len(results) - loaded
+        # ghost_core and security are critical - must succeed
+        critical_ok = all(results.get(name, True) for name in self.CRITICAL_ENGINES)
+        phases["engines"] = _ms_since(phase_start)
 
         print()
-        print(f"   Engines: {loaded} loaded, {failed} failed")
+        if deferred:
+            print(f"   Engines: {loaded} loaded, {failed} failed, {deferred} deferred")
+        else:
+            print(f"   Engines: {loaded} loaded, {failed} failed")
 
         if not critical_ok:
             print("   [FATAL] Critical engines failed to load. Cannot continue.")
@@ -119,13 +254,18 @@ class GhostKernel:
         # Phase 2: Discover commands and library scripts
         if "loader" in self.engines and self.engines["loader"]:
             loader = self.engines["loader"]
+            phase_start = time.perf_counter()
             self.commands = loader.discover_commands()
+            phases["commands"] = _ms_since(phase_start)
+            phase_start = time.perf_counter()
             loader.discover_library_scripts()
+            phases["library"] = _ms_since(phase_start)
             lib_count = len(loader.library_scripts)
             print(f"   Commands: {len(self.commands)} discovered ({lib_count} library scripts)")
 
         # Phase 2b: Boot diagnostics
         if "heartbeat" in self.engines and self.engines["heartbeat"]:
+            phase_start = time.perf_counter()
             diag = self.engines["heartbeat"].run_boot_diagnostics()
             if not diag["clean"]:
                 if diag["syntax_errors"]:
@@ -138,51 +278,191 @@ class GhostKernel:
                     created = self.engines["heartbeat"].repair_missing_dirs(diag["missing_dirs"])
                     if created:
                         print(f"   [✓] Auto-created: {', '.join(created)}")
+            phases["diagnostics"] = _ms_since(phase_start)
 
         # Phase 3: Start background services
         if "pulse" in self.engines and self.engines["pulse"]:
+            phase_start = time.perf_counter()
             self.engines["pulse"].start()
+            phases["services"] = _ms_since(phase_start)
 
-        # Phase 4: Save session state
+        # Phase 3b: Watch commands/library for automatic hot reload
+        if self.engine_available("loader"):
+            phase_start = time.perf_counter()
+            backend = self.engines["loader"].start_watcher()
+            phases["watcher"] = _ms_since(phase_start)
+            if self.debug and backend:
+                print(f"   Hot reload: watching commands + library ({backend})")
+
+        # Phase 3c: Local command API (only if "api": {"enabled": true})
+        if self.engine_available("api") and self.engines["api"].autostart:
+            phase_start = time.perf_counter()
+            api = self.engines["api"].start()
+            phases["api"] = _ms_since(phase_start)
+            for endpoint in (api["http"], api["unix_socket"]):
+                if endpoint:
+                    print(f"   API: listening on {endpoint}")
+            for error in api["errors"]:
+                print(f"   [!] API {error}")
+
+        # Phase 3d: Interface traffic monitor (skipped while BlackBox is lazy;
+        # `net top` starts it then)
+        if not self.is_lazy("blackbox") and self.engine_available("blackbox"):
+            blackbox = self.engines["blackbox"]
+            if blackbox.traffic_interval > 0:
+                phase_start = time.perf_counter()
+                blackbox.traffic_start()
+                phases["traffic"] = _ms_since(phase_start)
+
+        # Phase 3e: Periodic vault WAL compaction
+        if self.engine_available("vault") and self.engines["vault"].compact_interval > 0:
+            phase_start = time.perf_counter()
+            self.engines["vault"].start_compaction()
+            phases["vault_compact"] = _ms_since(phase_start)
+
+        # Phase 4: Save session state (with the boot profile)
+        elapsed = time.perf_counter() - boot_start
+        self.boot_profile = self._build_boot_profile(phases, elapsed)
         self._save_session()
+        if self.engine_available("heartbeat"):
+            self.engines["heartbeat"].record_boot_profile(self.boot_profile)
 
-        elapsed = time.time() - self.boot_time
         print(f"   Boot time: {elapsed:.2f}s")
         print()
 
         self.running = True
         return True
 
-    def _load_engine(self, name, module_path, class_name):
+    def _load_engine(self, name, module_path, class_name, announce=True):
         """
         Load a single engine with full error isolation.
+        Prerequisites listed in the class's ENGINE_DEPS are requested first,
+        so a lazily created engine pulls in any deferred dependencies.
         Returns True on success, False on failure.
         """
         try:
-            module = importlib.import_module(module_path)
-            engine_class = getattr(module, class_name)
+            engine_class = self._import_engine_class(name, module_path, class_name)
+            for dep in getattr(engine_class, "ENGINE_DEPS", []):
+                self.get_engine(dep)
+            init_start = time.perf_counter()
             engine_instance = engine_class(self)
             self.engines[name] = engine_instance
-
-            if self.debug:
-                print(f"   [✓] {name:<12} ({class_name})")
-            else:
-                print(f"   [✓] {name.capitalize()}")
+            timing = self.engine_timings.setdefault(name, {"import_ms": 0.0})
+            timing["init_ms"] = _ms_since(init_start)
+
+            if announce:
+                if self.debug:
+                    self._boot_print(
+                        f"   [✓] {name:<12} ({class_name}) "
+                        f"import {timing['import_ms']:.1f}ms / init {timing['init_ms']:.1f}ms"
+                    )
+                else:
+                    self._boot_print(f"   [✓] {name.capitalize()}")
             return True
 
         except ImportError as e:
-            print(f"   [!] {name.capitalize()} - import error: {e}")
+            self._boot_print(f"   [!] {name.capitalize()} - import error: {e}")
             self.engines[name] = None
             return False
 
         except Exception as e:
-            print(f"   [!] {name.capitalize()} - init error: {e}")
+            self._boot_print(f"   [!] {name.capitalize()} - init error: {e}")
             if self.debug:
                 import traceback
                 traceback.print_exc()
             self.engines[name] = None
             return False
 
+    def _load_engines_parallel(self, entries):
+        """
+        Load engines concurrently, respecting each class's ENGINE_DEPS.
+        Critical engines go first and serially; every other engine is
+        submitted to the pool as soon as its dependencies have finished
+        (successfully or not - failures stay isolated as in serial boot).
+        Returns {name: success}.
+        """
+        results = {}
+        remaining = []
+        for name, module_path, class_name in entries:
+            if name in self.CRITICAL_ENGINES:
+                results[name] = self._load_engine(name, module_path, class_name)
+            else:
+                remaining.append((name, module_path, class_name))
+
+        # Import up front (serially) to read ENGINE_DEPS. A module that fails
+        # to import gets no deps; _load_engine re-raises and reports it.
+        names = {entry[0] for entry in remaining}
+        waiting_on = {}
+        for name, module_path, class_name in remaining:
+            try:
+                engine_class = self._import_engine_class(name, module_path, class_name)
+                deps = getattr(engine_class, "ENGINE_DEPS", [])
+            except Exception:
+                deps = []
+            waiting_on[name] = {d for d in deps if d in names and d != name}
+
+        pending = list(remaining)
+        finished = set()
+        futures = {}
+
+        with ThreadPoolExecutor(max_workers=self.BOOT_WORKERS,
+                                thread_name_prefix="GhostBoot") as pool:
+            while pending or futures:
+                ready = [e for e in pending if waiting_on[e[0]] <= finished]
+                if not ready and not futures:
+                    # Dependency cycle - fall back to serial boot order
+                    for name, module_path, class_name in pending:
+                        results[name] = self._load_engine(name, module_path, class_name)
+                    break
+
+                for entry in ready:
+                    pending.remove(entry)
+                    futures[pool.submit(self._load_engine, *entry)] = entry[0]
+
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    name = futures.pop(future)
+                    results[name] = future.result()
+                    finished.add(name)
+
+        return results
+
+    def _import_engine_class(self, name, module_path, class_name):
+        """Import an engine module and return its class, timing the import."""
+        start = time.perf_counter()
+        try:
+            module = importlib.import_module(module_path)
+        finally:
+            timing = self.engine_timings.setdefault(name, {"import_ms": 0.0})
+            timing["import_ms"] += _ms_since(start)
+        return getattr(module, class_name)
+
+    def _build_boot_profile(self, phases, elapsed):
+        """Assemble the boot profile persisted to session + boot history."""
+        engines = {}
+        for name, timing in self.engine_timings.items():
+            import_ms = round(timing.get("import_ms", 0.0), 2)
+            init_ms = round(timing.get("init_ms", 0.0), 2)
+            engines[name] = {
+                "import_ms": import_ms,
+                "init_ms": init_ms,
+                "total_ms": round(import_ms + init_ms, 2),
+            }
+        return {
+            "session_id": self.session_id,
+            "timestamp": datetime.now().isoformat(timespec="seconds"),
+            "total_ms": round(elapsed * 1000, 2),
+            "parallel": self.parallel_boot,
+            "lazy": self.lazy,
+            "phases": {k: round(v, 2) for k, v in phases.items()},
+            "engines": engines,
+        }
+
+    def _boot_print(self, line):
+        """Print a boot line without interleaving between boot threads."""
+        with self._print_lock:
+            print(line)
+
     # =========================================================================
     # ENGINE ACCESS
     # =========================================================================
@@ -190,13 +470,41 @@ class GhostKernel:
     def get_engine(self, name):
         """
         Safely get an engine reference.
+        Deferred (lazy) engines are imported and initialised on first request.
         Returns None if engine isn't loaded (callers must handle this).
         """
-        return self.engines.get(name)
+        engine = self.engines.get(name)
+        if isinstance(engine, LazyEngine):
+            engine = self._materialize(name)
+        return engine
 
     def engine_available(self, name):
         """Check if an engine is loaded and operational."""
-        return name in self.engines and self.engines[name] is not None
+        return self.get_engine(name) is not None
+
+    def is_lazy(self, name):
+        """True if the engine is still a deferred proxy (not yet initialised)."""
+        return isinstance(self.engines.get(name), LazyEngine)
+
+    def _materialize(self, name):
+        """Replace a LazyEngine proxy with the real engine. Returns it or None."""
+        with self._engine_lock:
+            proxy = self.engines.get(name)
+            if not isinstance(proxy, LazyEngine):
+                return proxy
+            if name in self._materializing:
+                # Dependency cycle - refuse rather than recurse forever
+                return None
+
+            self._materializing.add(name)
+            try:
+                self._load_engine(
+                    name, proxy._module_path, proxy._class_name,
+                    announce=self.debug,
+                )
+            finally:
+                self._materializing.discard(name)
+            return self.engines.get(name)
 
     # =========================================================================
     # EVENT BUS (Simple Phase 1 Implementation)
@@ -204,9 +512,8 @@ class GhostKernel:
 
     def on(self, event_name, callback):
         """Register an event listener."""
-        if event_name not in self._event_listeners:
-            self._event_listeners[event_name] = []
-        self._event_listeners[event_name].append(callback)
+        # setdefault keeps this safe when engines register during parallel boot
+        self._event_listeners.setdefault(event_name, []).append(callback)
 
     def emit(self, event_name, data=None):
         """Emit an event to all registered listeners."""
@@ -233,6 +540,14 @@ class GhostKernel:
         if not raw_input:
             return
 
+        # Trailing '&' (but not '&&'): run as a background job
+        if raw_input.endswith("&") and not raw_input.endswith("&&"):
+            command = raw_input[:-1].rstrip()
+            if command and self.engine_available("jobs"):
+                job = self.engines["jobs"].submit(command)
+                print(f"[{job['id']}] {command}")
+                return
+
         parts = raw_input.split(None, 1)
         cmd_name = parts[0].lower()
         args_str = parts[1] if len(parts) > 1 else ""
@@ -269,7 +584,7 @@ class GhostKernel:
             sec = self.engines["security"]
             if not sec.has_permission(required_role):
                 print(f"[!] Access Denied. Required role: {required_role}")
-                return
+                return False
 
         # Execute
         try:
@@ -281,6 +596,7 @@ class GhostKernel:
             if self.debug:
                 import traceback
                 traceback.print_exc()
+            return False
 
     def _execute_library_script(self, name, args_str):
         """Execute a library script with the appropriate interpreter."""
@@ -325,16 +641,30 @@ class GhostKernel:
             if args_str:
                 cmd += f" {args_str}"
 
-        self._execute_passthrough(cmd)
+        return self._execute_passthrough(cmd)
 
     def _execute_passthrough(self, cmd):
-        """Pass command to host OS shell."""
+        """
+        Pass command to host OS shell.
+        Output streams line by line as the command produces it (the last
+        lines stay retrievable via RootEngine.get_last_output()).
+        """
+        jobs = self.engines.get("jobs")
+        job = jobs.current_job() if jobs else None
         if self.engine_available("root"):
-            stdout, stderr = self.engines["root"].exec_silent(cmd)
-            if stdout:
-                print(stdout.rstrip())
-            if stderr:
-                print(stderr.rstrip())
+            # Background jobs: own process group, tracked pid, no timeout
+            result = self.engines["root"].exec_stream(
+                cmd, on_output=lambda _stream, text: print(text, flush=True),
+                timeout=None if job else self.passthrough_timeout,
+                capture=job is None, detach=job is not None,
+                on_start=jobs.attach_process if job else None,
+            )
+            self._exec_state.returncode = result["returncode"]
+            if result["error"]:
+                print(result["error"])
+                return False
+            if result["returncode"]:
+                return False
         else:
             # Fallback if RootEngine unavailable
             import subprocess
@@ -346,6 +676,46 @@ class GhostKernel:
                     print(result.stderr.rstrip())
             except Exception as e:
                 print(f"[!] Execution error: {e}")
+                return False
+            self._exec_state.returncode = result.returncode
+            if result.returncode:
+                return False
+
+    def execute_captured(self, raw_input, spool=None):
+        """
+        Run one command line and capture everything it prints.
+        Thread-safe: concurrent callers each get only their own output.
+        With `spool` (a writable text stream) output is written there as it
+        is produced and "output" is None. "returncode" is the host command's
+        exit status when the line ran one (passthrough or alias), else None;
+        a non-zero status makes "ok" false.
+        Returns {command, ok, returncode, output, error, elapsed_ms}.
+        """
+        self._install_output_capture()
+        start = time.perf_counter()
+        error = None
+        self._exec_state.returncode = None
+        with sys.stdout.capture(spool) as buffer:
+            try:
+                ok = self.resolve_and_execute(raw_input) is not False
+            except Exception as e:
+                ok = False
+                error = str(e)
+        returncode = self._exec_state.returncode
+        return {
+            "command": raw_input,
+            "ok": ok and not returncode,
+            "returncode": returncode,
+            "output": None if spool is not None else buffer.getvalue().rstrip("\n"),
+            "error": error,
+            "elapsed_ms": round(_ms_since(start), 2),
+        }
+
+    def _install_output_capture(self):
+        """Swap sys.stdout for an OutputCapture router (once)."""
+        with self._print_lock:
+            if not isinstance(sys.stdout, OutputCapture):
+                sys.stdout = OutputCapture(sys.stdout)
 
     # =========================================================================
     # SHELL LOOP
@@ -367,6 +737,7 @@ class GhostKernel:
         # Main loop
         while self.running:
             try:
+                self._report_finished_jobs()
                 user_input = input(prompt)
                 if not user_input.strip():
                     continue
@@ -386,6 +757,66 @@ class GhostKernel:
                 self.running = False
                 break
 
+    def _report_finished_jobs(self):
+        """Print background jobs that finished since the last prompt."""
+        jobs = self.engines.get("jobs")
+        if not jobs or self.is_lazy("jobs"):
+            return
+        for job in jobs.pop_notifications():
+            status = job["state"].capitalize()
+            if job["returncode"] not in (None, 0):
+                status += f" (exit {job['returncode']})"
+            print(f"[{job['id']}] {status:<16} {job['command']}")
+
+    def run_batch(self, lines, jobs=1, out=None):
+        """
+        Non-interactive batch mode (main.py --headless with piped input or
+        --script). Streams each command through resolve_and_execute and
+        writes one JSON object per line to `out`, in input order.
+        With jobs > 1, lines run concurrently on a thread pool (they must be
+        independent of each other). Blank lines and #comments are skipped;
+        exit/quit stops reading. Returns the number of failed commands.
+        """
+        out = out or sys.stdout
+        jobs = max(1, int(jobs))
+        failed = 0
+        inflight = deque()
+
+        def emit(line_no, result):
+            nonlocal failed
+            result["line"] = line_no
+            if not result["ok"]:
+                failed += 1
+            out.write(json.dumps(result, ensure_ascii=False) + "\n")
+            out.flush()
+
+        with ThreadPoolExecutor(max_workers=jobs, thread_name_prefix="GhostBatch") as pool:
+            for line_no, raw in enumerate(lines, start=1):
+                command = raw.strip()
+                if not command or command.startswith("#"):
+                    continue
+                if command.lower() in ("exit", "quit"):
+                    break
+
+                if jobs == 1:
+                    emit(line_no, self.execute_captured(command))
+                    continue
+
+                inflight.append((line_no, pool.submit(self.execute_captured, command)))
+                # Bounded window: stream finished results in order as we go
+                while len(inflight) >= jobs * 2:
+                    n, future = inflight.popleft()
+                    emit(n, future.result())
+
+            while inflight:
+                n, future = inflight.popleft()
+                emit(n, future.result())
+
+        # Let `cmd &` lines finish (their output is in the job spool files)
+        if self.engine_available("jobs"):
+            self.engines["jobs"].wait()
+        return failed
+
     def _get_prompt(self):
         """Generate the shell prompt based on current state."""
         role_tag = ""
@@ -413,9 +844,14 @@ class GhostKernel:
             "session_id": self.session_id,
             "boot_time": self.boot_time,
             "version": self.VERSION,
-            "engines_loaded": [k for k, v in self.engines.items() if v is not None],
+            "engines_loaded": [
+                k for k, v in self.engines.items()
+                if v is not None and not isinstance(v, LazyEngine)
+            ],
             "engines_failed": [k for k, v in self.engines.items() if v is None],
+            "engines_deferred": [k for k in self.engines if self.is_lazy(k)],
             "commands_loaded": list(self.commands.keys()),
+            "boot_profile": self.boot_profile,
             "os": os.name,
             "python": sys.version,
         }
@@ -451,3 +887,10 @@ class GhostKernel:
 
         # Save final session state
         self._save_session()
+
+
+# ─── helpers ──────────────────────────────────────────────────────────────────
+
+def _ms_since(start):
+    """Milliseconds elapsed since a time.perf_counter() reading."""
+    return (time.perf_counter() - start) * 1000
@@ -57,6 +57,7 @@ class LegionEngine:
 
     ENGINE_NAME = "legion"
     ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = ["ghost_core"]  # blackbox: optional, fetched lazily for open_url()
     OPERATIONAL = True  # Phase 1: HTTP messaging
 
     def __init__(self, kernel):
@@ -124,6 +125,23 @@ class LegionEngine:
             nodes.append(info_copy)
         return nodes
 
+    def find_node(self, name):
+        """Look up a node by node_id or label. Returns node info or None."""
+        for node in self.list_nodes():
+            if name in (node["node_id"], node.get("label")):
+                return node
+        return None
+
+    @staticmethod
+    def node_host(node):
+        """Bare host of a node's address ("http://h:8765/x", "h:8765", "[v6]:p" -> h)."""
+        address = (node.get("address") or "").split("://")[-1].split("/")[0]
+        if address.startswith("["):             # [IPv6]:port
+            return address[1:].split("]")[0]
+        if address.count(":") == 1:             # host:port (not bare IPv6)
+            return address.split(":")[0]
+        return address or None
+
     # =========================================================================
     # MESSAGE PROTOCOL (Placeholder)
     # =========================================================================
@@ -168,12 +186,18 @@ class LegionEngine:
             import json as _json
 
             url = f"http://{target_address}/ghost/message"
+            headers = {"Content-Type": "application/json"}
             data = _json.dumps(message).encode("utf-8")
-            req = urllib.request.Request(
-                url, data=data,
-                headers={"Content-Type": "application/json"},
-            )
-            with urllib.request.urlopen(req, timeout=10) as resp:
+            # Node names go through BlackBox's resolver cache (each address
+            # tried in turn); an unresolvable name is queued at once instead
+            # of waiting on the resolver again
+            blackbox = self.kernel.get_engine("blackbox")
+            if blackbox:
+                resp = blackbox.open_url(url, data=data, headers=headers, timeout=10)
+            else:
+                resp = urllib.request.urlopen(
+                    urllib.request.Request(url, data=data, headers=headers), timeout=10)
+            with resp:
                 return {"status": "delivered", "response": resp.read().decode()}
         except Exception as e:
             # Delivery failed - queue for retry
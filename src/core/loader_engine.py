@@ -10,14 +10,28 @@ The Drop-In Pattern:
 - Library script: drop any executable in library/ (any language)
 All are automatically discovered on next boot.
 
+Command Index:
+Command metadata (MANIFEST, tier, file mtime/size) is cached in
+data/cache/command_index.json. On boot, files whose mtime and size match the
+index are registered as LazyCommand stubs without importing them; the module
+is imported the first time the command actually runs. help/status read
+metadata straight from the index.
+
 Compartmentalization:
 - ONLY manages command loading/reloading
 - Does NOT execute commands (kernel does that)
 """
 
+import ctypes
+import ctypes.util
 import importlib
+import json
 import os
+import select
+import struct
 import sys
+import threading
+from types import SimpleNamespace
 
 
 # Supported library script extensions and their interpreters
@@ -31,12 +45,51 @@ LIBRARY_EXTENSIONS = {
     ".exe":  "native",
 }
 
+# Seconds between stat-polls when inotify is unavailable
+WATCH_POLL_INTERVAL = 10
+
+# Quiet period (seconds) before a burst of inotify events is applied
+WATCH_DEBOUNCE = 0.25
+
+# Bump when the index entry layout changes (forces a full rescan)
+COMMAND_INDEX_VERSION = 1
+
+# Module-level attributes mirrored into the index for MANIFEST-less commands
+COMMAND_ATTRS = ("DESCRIPTION", "USAGE", "REQUIRED_ROLE")
+
+
+class LazyCommand:
+    """
+    Stand-in for a command module that has not been imported yet.
+    Carries the indexed MANIFEST/DESCRIPTION/USAGE/REQUIRED_ROLE so permission
+    checks and help need no import; anything else (e.g. execute) imports the
+    real module and forwards to it.
+    """
+
+    def __init__(self, loader, cmd_name, entry):
+        self._loader = loader
+        self._cmd_name = cmd_name
+        if entry.get("manifest") is not None:
+            self.MANIFEST = entry["manifest"]
+        for attr, value in entry.get("attrs", {}).items():
+            setattr(self, attr, value)
+
+    def __getattr__(self, attr):
+        if attr.startswith("__"):
+            raise AttributeError(attr)
+        module = self._loader.resolve_command(self._cmd_name)
+        return getattr(module, attr)
+
+    def __repr__(self):
+        return f"<LazyCommand {self._cmd_name}>"
+
 
 class LoaderEngine:
     """The Nervous System - dynamic command management."""
 
     ENGINE_NAME = "loader"
     ENGINE_VERSION = "2.0.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
@@ -45,8 +98,18 @@ class LoaderEngine:
         self.custom_commands_dir = os.path.join(self.commands_dir, "custom")
         self.library_dir = os.path.join(self.root_dir, "library")
 
-        self._loaded_modules = {}       # {cmd_name: module}
+        self._loaded_modules = {}       # {cmd_name: module} (imported only)
         self._command_tier = {}         # {cmd_name: "system" | "custom"}
+        self._command_source = {}       # {cmd_name: module_path}
+        self.index_file = os.path.join(self.root_dir, "data", "cache", "command_index.json")
+        self._index = self._load_index()  # {module_path: entry}
+        self._index_dirty = False
+
+        # File watcher state (see start_watcher)
+        self._reload_lock = threading.RLock()
+        self._watch_backend = None
+        self._inotify = None
+        self._poll_snapshot = {}
         self.library_scripts = {}       # {script_name: {path, extension, interpreter}}
         self.unregistered = set()       # commands without MANIFEST dict
 
@@ -61,24 +124,36 @@ class LoaderEngine:
     def discover_commands(self):
         """
         Scan src/commands/ AND src/commands/custom/ for cmd_*.py files.
-        Returns dict of {command_name: module}.
+        Returns dict of {command_name: module or LazyCommand}.
         Custom commands are loaded after system commands; name conflicts
         favour the custom command (override behaviour).
         """
         commands = {}
+        seen = set()
 
         # System commands
-        system_cmds = self._scan_directory(self.commands_dir, tier="system")
+        system_cmds = self._scan_directory(self.commands_dir, tier="system", seen=seen)
         commands.update(system_cmds)
 
         # Custom commands (override system if same name)
-        custom_cmds = self._scan_directory(self.custom_commands_dir, tier="custom")
+        custom_cmds = self._scan_directory(self.custom_commands_dir, tier="custom", seen=seen)
         commands.update(custom_cmds)
 
+        # Forget index entries for files that no longer exist
+        for module_path in list(self._index):
+            if module_path not in seen:
+                del self._index[module_path]
+                self._index_dirty = True
+        self._save_index()
+
         return commands
 
-    def _scan_directory(self, directory, tier="system"):
-        """Scan a single directory for cmd_*.py files."""
+    def _scan_directory(self, directory, tier="system", seen=None):
+        """
+        Scan a single directory for cmd_*.py files.
+        Unchanged files (same mtime + size as the index) become LazyCommand
+        stubs; new or changed files are imported and re-indexed.
+        """
         commands = {}
         if not os.path.exists(directory):
             return commands
@@ -95,14 +170,27 @@ class LoaderEngine:
                     module_path = f"src.commands.custom.{filename[:-3]}"
                 else:
                     module_path = f"src.commands.{filename[:-3]}"
+                if seen is not None:
+                    seen.add(module_path)
+
+                st = os.stat(os.path.join(directory, filename))
+                entry = self._index.get(module_path)
+                if entry and entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size:
+                    commands[cmd_name] = LazyCommand(self, cmd_name, entry)
+                    self._loaded_modules.pop(cmd_name, None)
+                    has_manifest = entry.get("manifest") is not None
+                else:
+                    module = importlib.import_module(module_path)
+                    commands[cmd_name] = module
+                    self._loaded_modules[cmd_name] = module
+                    self._index_module(module_path, module, tier, st)
+                    has_manifest = hasattr(module, "MANIFEST")
 
-                module = importlib.import_module(module_path)
-                commands[cmd_name] = module
-                self._loaded_modules[cmd_name] = module
                 self._command_tier[cmd_name] = tier
+                self._command_source[cmd_name] = module_path
 
                 # Check for MANIFEST — flag commands without one
-                if not hasattr(module, "MANIFEST"):
+                if not has_manifest:
                     self.unregistered.add(cmd_name)
                 else:
                     self.unregistered.discard(cmd_name)
@@ -113,6 +201,84 @@ class LoaderEngine:
 
         return commands
 
+    def resolve_command(self, cmd_name):
+        """
+        Import the real module behind a LazyCommand (first execution).
+        Replaces the stub in kernel.commands. Returns the module.
+        """
+        module = self._loaded_modules.get(cmd_name)
+        if module is not None:
+            return module
+
+        module_path = self._command_source.get(cmd_name)
+        if module_path is None:
+            raise ImportError(f"Command '{cmd_name}' is not indexed")
+
+        module = importlib.import_module(module_path)
+        self._loaded_modules[cmd_name] = module
+        self.kernel.commands[cmd_name] = module
+        return module
+
+    def is_resolved(self, cmd_name):
+        """True once a command's module has actually been imported."""
+        return cmd_name in self._loaded_modules
+
+    # =========================================================================
+    # COMMAND INDEX
+    # =========================================================================
+
+    def _load_index(self):
+        """Load the command index; empty (full rescan) if missing or stale."""
+        try:
+            with open(self.index_file, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            if data.get("version") == COMMAND_INDEX_VERSION:
+                return data.get("commands", {})
+        except Exception:
+            pass
+        return {}
+
+    def _save_index(self):
+        """Write the index back if anything changed."""
+        if not self._index_dirty:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.index_file), exist_ok=True)
+            with open(self.index_file, 'w', encoding='utf-8') as f:
+                json.dump({"version": COMMAND_INDEX_VERSION, "commands": self._index}, f)
+            self._index_dirty = False
+        except Exception:
+            pass  # Index is an optimisation only
+
+    def _index_module(self, module_path, module, tier, st=None):
+        """Record a freshly imported command module in the index."""
+        if st is None:
+            try:
+                st = os.stat(module.__file__)
+            except Exception:
+                self._index.pop(module_path, None)
+                self._index_dirty = True
+                return
+
+        manifest = getattr(module, "MANIFEST", None)
+        attrs = {a: getattr(module, a) for a in COMMAND_ATTRS if hasattr(module, a)}
+        entry = {
+            "tier": tier,
+            "file": getattr(module, "__file__", "unknown"),
+            "mtime_ns": st.st_mtime_ns,
+            "size": st.st_size,
+            "manifest": manifest,
+            "attrs": attrs,
+        }
+        try:
+            json.dumps(entry)
+        except (TypeError, ValueError):
+            # Metadata we can't serialise - never stub this command
+            self._index.pop(module_path, None)
+        else:
+            self._index[module_path] = entry
+        self._index_dirty = True
+
     # =========================================================================
     # LIBRARY SCRIPT DISCOVERY
     # =========================================================================
@@ -129,26 +295,31 @@ class LoaderEngine:
             return self.library_scripts
 
         for filename in os.listdir(self.library_dir):
-            base, ext = os.path.splitext(filename)
-            ext_lower = ext.lower()
+            info = self._library_entry(filename)
+            if info:
+                self.library_scripts[info["name"].lower()] = info
 
-            if ext_lower not in LIBRARY_EXTENSIONS:
-                continue
+        return self.library_scripts
 
-            full_path = os.path.join(self.library_dir, filename)
-            if not os.path.isfile(full_path):
-                continue
+    def _library_entry(self, filename):
+        """Build the info dict for one library file, or None if not a script."""
+        base, ext = os.path.splitext(filename)
+        ext_lower = ext.lower()
 
-            interpreter = LIBRARY_EXTENSIONS[ext_lower]
-            self.library_scripts[base.lower()] = {
-                "name": base,
-                "filename": filename,
-                "path": full_path,
-                "extension": ext_lower,
-                "interpreter": interpreter,
-            }
+        if ext_lower not in LIBRARY_EXTENSIONS:
+            return None
 
-        return self.library_scripts
+        full_path = os.path.join(self.library_dir, filename)
+        if not os.path.isfile(full_path):
+            return None
+
+        return {
+            "name": base,
+            "filename": filename,
+            "path": full_path,
+            "extension": ext_lower,
+            "interpreter": LIBRARY_EXTENSIONS[ext_lower],
+        }
 
     def get_library_info(self, name):
         """Get info about a library script by name."""
@@ -167,13 +338,22 @@ class LoaderEngine:
         Hot reload a single command module.
         Edit cmd_ping.py and run `reload ping` — no restart needed!
         """
-        if cmd_name not in self._loaded_modules:
+        if cmd_name not in self._command_source:
             return False, f"Command '{cmd_name}' not loaded"
 
         try:
-            module = self._loaded_modules[cmd_name]
-            importlib.reload(module)
+            if cmd_name in self._loaded_modules:
+                module = self._loaded_modules[cmd_name]
+                importlib.reload(module)
+            else:
+                # Never imported: a fresh import already picks up the edits
+                module = self.resolve_command(cmd_name)
             self.kernel.commands[cmd_name] = module
+            self._index_module(
+                self._command_source[cmd_name], module,
+                self._command_tier.get(cmd_name, "system"),
+            )
+            self._save_index()
 
             # Re-check MANIFEST after reload
             if not hasattr(module, "MANIFEST"):
@@ -192,6 +372,13 @@ class LoaderEngine:
             success, msg = self.reload_command(cmd_name)
             results[cmd_name] = {"success": success, "message": msg}
 
+        # Not-yet-imported commands: only re-import files that changed
+        for cmd_name in sorted(set(self._command_source) - set(self._loaded_modules)):
+            if self._index_current(cmd_name):
+                continue
+            success, msg = self.reload_command(cmd_name)
+            results[cmd_name] = {"success": success, "message": msg}
+
         # Re-scan library
         self.discover_library_scripts()
         results["__library__"] = {
@@ -200,16 +387,225 @@ class LoaderEngine:
         }
         return results
 
+    # =========================================================================
+    # AUTO HOT RELOAD (file watcher)
+    # =========================================================================
+
+    def start_watcher(self):
+        """
+        Start watching command and library dirs. Called by the kernel once
+        boot is complete. Returns the backend in use ("inotify", "poll", None).
+        """
+        mode = str(self.kernel.settings.get("hot_reload", "auto")).lower()
+        if mode == "off" or self._watch_backend:
+            return self._watch_backend
+
+        if mode in ("auto", "inotify"):
+            try:
+                self._inotify = _InotifyWatcher(self._watch_dirs(), self.handle_file_changes)
+                self._inotify.start()
+                self._watch_backend = "inotify"
+            except OSError:
+                self._inotify = None
+
+        if not self._watch_backend and mode in ("auto", "poll", "inotify"):
+            pulse = self.kernel.get_engine("pulse")
+            if pulse:
+                self._poll_snapshot = self._snapshot_watched()
+                pulse.register_task("command_watch", WATCH_POLL_INTERVAL, self._poll_changes)
+                self._watch_backend = "poll"
+
+        if self._watch_backend:
+            self.kernel.on("shutdown", lambda data: self.stop_watcher())
+        return self._watch_backend
+
+    def stop_watcher(self):
+        """Stop the watcher (pulse poll task becomes a no-op)."""
+        if self._inotify:
+            self._inotify.stop()
+            self._inotify = None
+        self._watch_backend = None
+
+    def get_watcher_status(self):
+        return {"backend": self._watch_backend, "dirs": self._watch_dirs()}
+
+    def _watch_dirs(self):
+        return [self.commands_dir, self.custom_commands_dir, self.library_dir]
+
+    def _is_watched_file(self, path):
+        directory, filename = os.path.split(path)
+        if directory in (self.commands_dir, self.custom_commands_dir):
+            return filename.startswith("cmd_") and filename.endswith(".py")
+        if directory == self.library_dir:
+            return os.path.splitext(filename)[1].lower() in LIBRARY_EXTENSIONS
+        return False
+
+    def _snapshot_watched(self):
+        """{path: (mtime_ns, size)} for every watched file."""
+        snapshot = {}
+        for directory in self._watch_dirs():
+            try:
+                names = os.listdir(directory)
+            except OSError:
+                continue
+            for filename in names:
+                path = os.path.join(directory, filename)
+                if not self._is_watched_file(path):
+                    continue
+                try:
+                    st = os.stat(path)
+                except OSError:
+                    continue
+                snapshot[path] = (st.st_mtime_ns, st.st_size)
+        return snapshot
+
+    def _poll_changes(self):
+        """PulseEngine task: stat-diff the watched dirs."""
+        if self._watch_backend != "poll":
+            return
+        snapshot = self._snapshot_watched()
+        previous = self._poll_snapshot
+        self._poll_snapshot = snapshot
+        changed = [p for p in snapshot if previous.get(p) != snapshot[p]]
+        changed += [p for p in previous if p not in snapshot]
+        if changed:
+            self.handle_file_changes(changed)
+
+    def handle_file_changes(self, paths):
+        """
+        Apply a batch of changed/added/deleted paths. Only the affected
+        command or library entry is touched. Emits "commands_changed" with
+        a list of (action, name) tuples. Returns that list.
+        """
+        changes = []
+        with self._reload_lock:
+            for path in sorted(set(paths)):
+                if not self._is_watched_file(path):
+                    continue
+                directory, filename = os.path.split(path)
+                try:
+                    if directory == self.library_dir:
+                        change = self._apply_library_change(filename)
+                    else:
+                        tier = "custom" if directory == self.custom_commands_dir else "system"
+                        change = self._apply_command_change(filename, tier)
+                except Exception as e:
+                    change = ("error", f"{filename}: {e}")
+                if change:
+                    changes.append(change)
+
+        if changes:
+            if self.kernel.debug:
+                for action, name in changes:
+                    print(f"\n  [↻] {action}: {name}")
+            self.kernel.emit("commands_changed", changes)
+        return changes
+
+    def _apply_command_change(self, filename, tier):
+        """Reload, add or remove one cmd_*.py file."""
+        cmd_name = filename[4:-3]
+        package = "src.commands.custom" if tier == "custom" else "src.commands"
+        module_path = f"{package}.{filename[:-3]}"
+        directory = self.custom_commands_dir if tier == "custom" else self.commands_dir
+        path = os.path.join(directory, filename)
+
+        if not os.path.exists(path):
+            # Deleted
+            sys.modules.pop(module_path, None)
+            if self._index.pop(module_path, None) is not None:
+                self._index_dirty = True
+            if self._command_source.get(cmd_name) != module_path:
+                self._save_index()
+                return None  # Shadowed file removed - active command unchanged
+            self.kernel.commands.pop(cmd_name, None)
+            self._loaded_modules.pop(cmd_name, None)
+            self._command_source.pop(cmd_name, None)
+            self._command_tier.pop(cmd_name, None)
+            self.unregistered.discard(cmd_name)
+            self._save_index()
+
+            # A removed custom override falls back to the system command
+            system_file = f"cmd_{cmd_name}.py"
+            if tier == "custom" and os.path.exists(os.path.join(self.commands_dir, system_file)):
+                self._apply_command_change(system_file, "system")
+                return ("restored", cmd_name)
+            return ("removed", cmd_name)
+
+        active = self._command_source.get(cmd_name)
+        if active and active != module_path and tier == "system":
+            return None  # A custom override is active; system file is shadowed
+
+        if active == module_path:
+            if self._index_current(cmd_name):
+                return None  # Touched but unchanged
+            success, msg = self.reload_command(cmd_name)
+            return ("reloaded" if success else "error", cmd_name if success else msg)
+
+        # New command (or new custom override of a system command). The path
+        # finder caches directory listings keyed on the dir's mtime, which can
+        # miss a file created within the same timestamp tick
+        importlib.invalidate_caches()
+        module = importlib.import_module(module_path)
+        if active:
+            self._loaded_modules.pop(cmd_name, None)
+        self.kernel.commands[cmd_name] = module
+        self._loaded_modules[cmd_name] = module
+        self._command_tier[cmd_name] = tier
+        self._command_source[cmd_name] = module_path
+        self._index_module(module_path, module, tier)
+        self._save_index()
+        if not hasattr(module, "MANIFEST"):
+            self.unregistered.add(cmd_name)
+        else:
+            self.unregistered.discard(cmd_name)
+        return ("overridden" if active else "added", cmd_name)
+
+    def _apply_library_change(self, filename):
+        """Update a single library entry."""
+        key = os.path.splitext(filename)[0].lower()
+        info = self._library_entry(filename)
+        if info:
+            existed = key in self.library_scripts
+            self.library_scripts[key] = info
+            return ("library updated" if existed else "library added", key)
+        if self.library_scripts.get(key, {}).get("filename") == filename:
+            del self.library_scripts[key]
+            return ("library removed", key)
+        return None
+
+    def _index_current(self, cmd_name):
+        """True if the command's file still matches its index entry."""
+        entry = self._index.get(self._command_source.get(cmd_name))
+        if not entry:
+            return False
+        try:
+            st = os.stat(entry["file"])
+        except OSError:
+            return False
+        return entry["mtime_ns"] == st.st_mtime_ns and entry["size"] == st.st_size
+
     # =========================================================================
     # METADATA
     # =========================================================================
 
     def get_command_info(self, cmd_name):
-        """Get metadata about a command. Prefers MANIFEST over module-level attrs."""
-        if cmd_name not in self._loaded_modules:
+        """
+        Get metadata about a command. Prefers MANIFEST over module-level attrs.
+        Commands that haven't been imported are answered from the index.
+        """
+        if cmd_name in self._loaded_modules:
+            module = self._loaded_modules[cmd_name]
+        elif cmd_name in self._command_source:
+            entry = self._index.get(self._command_source[cmd_name])
+            if not entry:
+                return None
+            # Plain namespace: missing attrs fall back to defaults, no import
+            module = SimpleNamespace(__file__=entry["file"], **entry.get("attrs", {}))
+            if entry.get("manifest") is not None:
+                module.MANIFEST = entry["manifest"]
+        else:
             return None
 
-        module = self._loaded_modules[cmd_name]
         manifest = getattr(module, "MANIFEST", None)
 
         if manifest:
@@ -244,14 +640,14 @@ class LoaderEngine:
         """List all discovered commands with metadata."""
         return {
             name: self.get_command_info(name)
-            for name in sorted(self._loaded_modules.keys())
+            for name in sorted(self._command_source.keys())
         }
 
     def get_commands_by_tier(self):
         """Return commands grouped by tier: system, custom."""
         system = {}
         custom = {}
-        for name in sorted(self._loaded_modules.keys()):
+        for name in sorted(self._command_source.keys()):
             tier = self._command_tier.get(name, "system")
             info = self.get_command_info(name)
             if tier == "custom":
@@ -259,3 +655,94 @@ class LoaderEngine:
             else:
                 system[name] = info
         return {"system": system, "custom": custom}
+
+
+# ─── inotify backend ──────────────────────────────────────────────────────────
+
+class _InotifyWatcher:
+    """
+    Minimal inotify(7) watcher over ctypes. Collects paths touched in the
+    watched directories and hands them to `callback` in debounced batches
+    from a daemon thread. Raises OSError if inotify isn't available.
+    """
+
+    IN_ATTRIB = 0x00000004
+    IN_CLOSE_WRITE = 0x00000008
+    IN_MOVED_FROM = 0x00000040
+    IN_MOVED_TO = 0x00000080
+    IN_CREATE = 0x00000100
+    IN_DELETE = 0x00000200
+    IN_CLOEXEC = 0o2000000
+    MASK = IN_ATTRIB | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+    EVENT_HEADER = struct.Struct("iIII")
+
+    def __init__(self, directories, callback):
+        if not sys.platform.startswith("linux"):
+            raise OSError("inotify requires Linux")
+        libc_name = ctypes.util.find_library("c") or "libc.so.6"
+        libc = ctypes.CDLL(libc_name, use_errno=True)
+        if not hasattr(libc, "inotify_init1"):
+            raise OSError("libc has no inotify")
+
+        self._fd = libc.inotify_init1(self.IN_CLOEXEC)
+        if self._fd < 0:
+            raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+
+        self._wd_dirs = {}
+        for directory in directories:
+            if not os.path.isdir(directory):
+                continue
+            wd = libc.inotify_add_watch(self._fd, os.fsencode(directory), self.MASK)
+            if wd >= 0:
+                self._wd_dirs[wd] = directory
+        if not self._wd_dirs:
+            os.close(self._fd)
+            raise OSError("no directories could be watched")
+
+        self._callback = callback
+        self._running = False
+        self._thread = None
+
+    def start(self):
+        self._running = True
+        self._thread = threading.Thread(target=self._run, daemon=True, name="GhostWatcher")
+        self._thread.start()
+
+    def stop(self):
+        self._running = False
+
+    def _run(self):
+        pending = set()
+        try:
+            while self._running:
+                # Block up to 1s; once events arrive, wait for a quiet period
+                timeout = WATCH_DEBOUNCE if pending else 1.0
+                readable, _, _ = select.select([self._fd], [], [], timeout)
+                if readable:
+                    pending.update(self._read_events())
+                elif pending:
+                    batch, pending = pending, set()
+                    try:
+                        self._callback(sorted(batch))
+                    except Exception:
+                        pass
+        finally:
+            try:
+                os.close(self._fd)
+            except OSError:
+                pass
+
+    def _read_events(self):
+        data = os.read(self._fd, 64 * 1024)
+        paths = []
+        offset = 0
+        header = self.EVENT_HEADER
+        while offset + header.size <= len(data):
+            wd, _mask, _cookie, length = header.unpack_from(data, offset)
+            offset += header.size
+            name = data[offset:offset + length].rstrip(b"\0")
+            offset += length
+            directory = self._wd_dirs.get(wd)
+            if directory and name:
+                paths.append(os.path.join(directory, os.fsdecode(name)))
+        return paths
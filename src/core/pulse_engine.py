@@ -23,7 +23,8 @@ class PulseEngine:
     """The Heartbeat - time and scheduling."""
 
     ENGINE_NAME = "pulse"
-    ENGINE_VERSION = "2.0.0"
+    ENGINE_VERSION = "2.1.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
@@ -33,6 +34,7 @@ class PulseEngine:
         self._tasks = []  # List of task dicts
         self._reminders = []  # List of reminder dicts
         self._lock = threading.Lock()
+        self._wake = threading.Event()  # set to re-plan the loop's sleep
         self._os_type = platform.system().upper()
 
         # Register built-in periodic tasks
@@ -62,6 +64,7 @@ class PulseEngine:
     def stop(self):
         """Stop the pulse loop."""
         self.running = False
+        self._wake.set()
 
     def register_task(self, name, interval_seconds, callback):
         """Register a periodic task."""
@@ -72,26 +75,39 @@ class PulseEngine:
                 "callback": callback,
                 "last_run": 0,
             })
+        self._wake.set()
+
+    def unregister_task(self, name):
+        """Remove a periodic task by name. Returns True if one was removed."""
+        with self._lock:
+            before = len(self._tasks)
+            self._tasks = [t for t in self._tasks if t["name"] != name]
+            return len(self._tasks) != before
 
     def _pulse_loop(self):
         """Main pulse loop - runs in background thread."""
         while self.running:
             now = time.time()
 
+            # Snapshot due tasks, then run them WITHOUT holding the lock:
+            # callbacks (e.g. _check_reminders) take the lock themselves.
+            with self._lock:
+                due = [t for t in self._tasks if now - t["last_run"] >= t["interval"]]
+
+            for task in due:
+                # A failing task waits its interval too, not one loop
+                task["last_run"] = now
+                try:
+                    task["callback"]()
+                except Exception:
+                    pass
+
+            # Sleep until the next task is due; register_task/stop wake us early
             with self._lock:
-                for task in self._tasks:
-                    if now - task["last_run"] >= task["interval"]:
-                        try:
-                            task["callback"]()
-                            task["last_run"] = now
-                        except Exception:
-                            pass
-
-            # Sleep in small increments so we can stop quickly
-            for _ in range(10):
-                if not self.running:
-                    break
-                time.sleep(1)
+                next_due = min((t["last_run"] + t["interval"] for t in self._tasks),
+                               default=now + 10)
+            self._wake.wait(max(0.05, next_due - time.time()))
+            self._wake.clear()
 
     def _autosave_session(self):
         """Periodic session state save."""
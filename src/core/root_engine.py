@@ -4,6 +4,9 @@ Engine 05: Root Engine - God Mode
 Silent subprocess execution, system commands, hardware control.
 
 The key innovation: Silent execution on Windows (no popup CMD windows).
+Optional shell coprocess ("shell_coprocess": true in settings.json): one
+long-lived POSIX shell per session runs shell commands piped to it, so
+cd/export persist and no process is spawned per call (Termux, slow hosts).
 
 Compartmentalization:
 - MUST check SecurityEngine permissions before dangerous commands
@@ -14,6 +17,34 @@ import subprocess
 import platform
 import os
 import socket
+import codecs
+import queue
+import secrets
+import shlex
+import shutil
+import signal
+import statistics
+import struct
+import sys
+import threading
+import time
+from collections import deque
+
+
+# Streaming execution limits (see exec_stream)
+STREAM_CHUNK = 64 * 1024        # bytes per pipe read
+STREAM_MAX_LINE = 64 * 1024     # longer lines are forwarded in pieces
+STREAM_QUEUE = 64               # pending chunks before readers block the child
+STREAM_RING_LINES = 1000        # lines kept for get_last_output()
+
+# Network info (get_network_info)
+NETINFO_PROBE_TARGET = ("8.8.8.8", 53)
+NETINFO_PROBE_TIMEOUT = 3       # seconds the background connectivity probe may take
+NETINFO_PROBE_TTL = 30          # seconds a connectivity answer is reused
+NETINFO_PROBE_WAIT = 0.3        # how long netinfo waits on a running probe
+SIOCGIFADDR = 0x8915            # Linux ioctls: interface IPv4 address / netmask
+SIOCGIFNETMASK = 0x891B
+RTF_GATEWAY = 0x2
 
 
 class RootEngine:
@@ -21,15 +52,37 @@ class RootEngine:
 
     ENGINE_NAME = "root"
     ENGINE_VERSION = "2.0.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
         self.os_type = platform.system().upper()
+        ring_lines = kernel.settings.get("passthrough_ring_lines", STREAM_RING_LINES)
+        self._last_output = deque(maxlen=max(1, int(ring_lines)))
+        self._last_output_lock = threading.Lock()
 
-    def exec_silent(self, cmd, shell=True, timeout=30):
+        self.coprocess_enabled = (
+            bool(kernel.settings.get("shell_coprocess", False))
+            and ShellCoprocess.supported()
+        )
+        self._coprocess = None
+        kernel.on("shutdown", lambda _data: self.close_coprocess())
+
+        # Cached connectivity probe (internet_status)
+        self._probe_lock = threading.Lock()
+        self._probe_thread = None
+        self._probe_connected = None
+        self._probe_checked = None      # time.monotonic() of the last answer
+
+    # =========================================================================
+    # EXECUTION
+    # =========================================================================
+
+    def _popen_kwargs(self, shell, detach=False):
         """
-        Execute a command silently (no popup window on Windows).
-        Returns (stdout, stderr) as strings.
+        Popen kwargs shared by exec_silent/exec_stream.
+        detach=True starts a new process group (background jobs: terminal
+        Ctrl+C doesn't reach it and the whole group can be signalled).
         """
         kwargs = {
             "stdout": subprocess.PIPE,
@@ -43,6 +96,32 @@ class RootEngine:
             startupinfo.dwFlags |= subprocess.STARTF_USESHOWWINDOW
             startupinfo.wShowWindow = 0  # SW_HIDE
             kwargs["startupinfo"] = startupinfo
+            if detach:
+                kwargs["creationflags"] = subprocess.CREATE_NEW_PROCESS_GROUP
+        elif detach:
+            kwargs["start_new_session"] = True
+        return kwargs
+
+    def exec_silent(self, cmd, shell=True, timeout=30):
+        """
+        Execute a command silently (no popup window on Windows).
+        Returns (stdout, stderr) as strings.
+        Buffers everything - use exec_stream for long-running or chatty commands.
+        """
+        coproc = self._coprocess_for(shell)
+        if coproc:
+            out = {"stdout": [], "stderr": []}
+            result = coproc.run(cmd, lambda stream, lines: out[stream].extend(lines),
+                                timeout=timeout, blocking=False)
+            if result is not None:
+                stdout_str = "".join(line + "\n" for line in out["stdout"])
+                stderr_str = "".join(line + "\n" for line in out["stderr"])
+                if result["error"]:
+                    stderr_str += result["error"]
+                return stdout_str, stderr_str
+            # Coprocess busy (another thread) - fall through to a fresh Popen
+
+        kwargs = self._popen_kwargs(shell)
 
         try:
             process = subprocess.Popen(cmd, **kwargs)
@@ -60,6 +139,212 @@ class RootEngine:
         except Exception as e:
             return "", f"[!] Execution error: {e}"
 
+    def exec_stream(self, cmd, on_output=None, shell=True, timeout=30, capture=True,
+                    detach=False, on_start=None):
+        """
+        Execute a command, forwarding output as it arrives.
+
+        on_output(stream, text) is called from the calling thread for every
+        line ("stdout" or "stderr", newline stripped). Lines longer than
+        STREAM_MAX_LINE arrive in pieces. Pipes are drained by two reader
+        threads into a bounded queue, so memory stays flat however much the
+        command prints; a slow consumer simply back-pressures the child.
+
+        With capture=True the last lines are also kept in a ring buffer
+        (see get_last_output). timeout=None waits indefinitely. Ctrl+C kills
+        the child and re-raises KeyboardInterrupt. on_start(process) is called
+        right after launch; detach=True runs it in its own process group.
+        Runs on the shell coprocess when enabled (not for detached runs).
+
+        Returns {returncode, lines, bytes, timed_out, elapsed_ms, error}.
+        """
+        start = time.perf_counter()
+        if capture:
+            with self._last_output_lock:
+                self._last_output.clear()
+
+        def deliver(stream, lines):
+            if capture:
+                with self._last_output_lock:
+                    self._last_output.extend((stream, text) for text in lines)
+            if on_output:
+                for text in lines:
+                    on_output(stream, text)
+
+        coproc = None if detach else self._coprocess_for(shell)
+        if coproc:
+            result = coproc.run(cmd, deliver, timeout=timeout, blocking=False)
+            if result is not None:
+                return result
+
+        result = {
+            "returncode": None, "lines": 0, "bytes": 0,
+            "timed_out": False, "elapsed_ms": 0.0, "error": None,
+        }
+        try:
+            process = subprocess.Popen(cmd, **self._popen_kwargs(shell, detach))
+        except FileNotFoundError:
+            result["error"] = f"[!] Command not found: {cmd}"
+            return result
+        except Exception as e:
+            result["error"] = f"[!] Execution error: {e}"
+            return result
+
+        if on_start:
+            on_start(process)
+
+        pieces = queue.Queue(maxsize=STREAM_QUEUE)
+        byte_counts = {}    # one key per reader thread
+        readers = [
+            threading.Thread(target=_pump_pipe, args=(pipe, name, pieces, byte_counts),
+                             daemon=True, name=f"GhostStream-{name}")
+            for pipe, name in ((process.stdout, "stdout"), (process.stderr, "stderr"))
+        ]
+        for reader in readers:
+            reader.start()
+
+        deadline = time.monotonic() + timeout if timeout else None
+        killed_at = None
+        open_pipes = len(readers)
+        try:
+            while open_pipes:
+                now = time.monotonic()
+                if deadline and now > deadline:
+                    result["timed_out"] = True
+                    process.kill()
+                    deadline, killed_at = None, now     # keep draining what is left
+                elif killed_at and now - killed_at > 2:
+                    break   # grandchildren still hold the pipes; readers are daemons
+                try:
+                    item = pieces.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                if item is None:
+                    open_pipes -= 1
+                    continue
+                stream, lines = item
+                result["lines"] += len(lines)
+                deliver(stream, lines)
+        except KeyboardInterrupt:
+            process.kill()
+            raise
+        finally:
+            try:
+                result["returncode"] = process.wait(timeout=5)
+            except subprocess.TimeoutExpired:
+                process.kill()
+            result["bytes"] = sum(byte_counts.values())
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+
+        if result["timed_out"]:
+            result["error"] = f"[!] Command timed out after {timeout}s"
+        return result
+
+    def get_last_output(self, lines=None, stream=None):
+        """
+        Tail of the last exec_stream run (ring buffer, oldest first).
+        Returns a list of (stream, text); filter with stream="stdout"/"stderr".
+        """
+        with self._last_output_lock:
+            entries = list(self._last_output)
+        if stream:
+            entries = [e for e in entries if e[0] == stream]
+        if lines:
+            entries = entries[-lines:]
+        return entries
+
+    # =========================================================================
+    # SHELL COPROCESS
+    # =========================================================================
+
+    def _coprocess_for(self, shell):
+        """The session coprocess if it should handle this call, else None."""
+        if not (shell and self.coprocess_enabled):
+            return None
+        if self._coprocess is None:
+            self._coprocess = ShellCoprocess()
+        return self._coprocess
+
+    def set_coprocess(self, enabled):
+        """Turn the shell coprocess on/off for this session. Returns the new state."""
+        if enabled and not ShellCoprocess.supported():
+            return False
+        self.coprocess_enabled = bool(enabled)
+        if not enabled:
+            self.close_coprocess()
+        return self.coprocess_enabled
+
+    def close_coprocess(self):
+        if self._coprocess is not None:
+            self._coprocess.close()
+            self._coprocess = None
+
+    def get_coprocess_status(self):
+        coproc = self._coprocess
+        return {
+            "supported": ShellCoprocess.supported(),
+            "enabled": self.coprocess_enabled,
+            "alive": bool(coproc and coproc.alive),
+            "shell": coproc.shell_path if coproc else _default_shell(),
+            "pid": coproc.pid if coproc else None,
+            "commands": coproc.commands_run if coproc else 0,
+            "restarts": coproc.restarts if coproc else 0,
+        }
+
+    def benchmark_exec(self, runs=50, cmd="true", timeout=10):
+        """
+        Per-call latency of `cmd`: fresh Popen(shell=True) per call vs the
+        shell coprocess (a private one, so session state isn't touched).
+        A call running past `timeout` seconds is killed and ends the bench.
+        Returns {runs, cmd, popen: stats, coprocess: stats, speedup, error}.
+        """
+        runs = max(1, int(runs))
+        error = None
+
+        popen_ms = []
+        for _ in range(runs):
+            start = time.perf_counter()
+            # Own process group: a timeout kills the command's children too,
+            # which would otherwise hold the pipes open
+            process = subprocess.Popen(cmd, **self._popen_kwargs(True, detach=True))
+            try:
+                process.communicate(timeout=timeout)
+            except subprocess.TimeoutExpired:
+                _kill_group(process)
+                process.communicate()
+                error = f"[!] Command timed out after {timeout}s"
+                break
+            popen_ms.append((time.perf_counter() - start) * 1000)
+
+        coproc_ms = []
+        if error is None and ShellCoprocess.supported():
+            coproc = ShellCoprocess()
+            try:
+                coproc.run("true", timeout=timeout)  # startup is paid once per session
+                for _ in range(runs):
+                    start = time.perf_counter()
+                    result = coproc.run(cmd, timeout=timeout)
+                    if result["timed_out"] or result["error"]:
+                        error = result["error"]
+                        break
+                    coproc_ms.append((time.perf_counter() - start) * 1000)
+            finally:
+                coproc.close()
+
+        if error:
+            return {"runs": runs, "cmd": cmd, "popen": None, "coprocess": None,
+                    "speedup": None, "error": error}
+        popen_stats = _latency_stats(popen_ms)
+        coproc_stats = _latency_stats(coproc_ms) if coproc_ms else None
+        speedup = None
+        if coproc_stats and coproc_stats["median_ms"]:
+            speedup = round(popen_stats["median_ms"] / coproc_stats["median_ms"], 1)
+        return {
+            "runs": runs, "cmd": cmd,
+            "popen": popen_stats, "coprocess": coproc_stats, "speedup": speedup,
+            "error": None,
+        }
+
     def exec_elevated(self, cmd):
         """
         Execute with elevated privileges (requires SecurityEngine GOD check).
@@ -171,33 +456,168 @@ class RootEngine:
     # NETWORK INFO
     # =========================================================================
 
-    def get_network_info(self):
+    def get_network_info(self, probe=True, probe_wait=NETINFO_PROBE_WAIT):
         """
         Return dict with local IPs, default gateway, DNS servers, connectivity.
-        Cross-platform: ipconfig (Windows) / ip addr (Linux).
+        Linux reads /proc/net, /sys/class/net and interface ioctls directly
+        (no subprocess; falls back to `ip addr` if those are unreadable),
+        Windows parses ipconfig.
+
+        internet comes from internet_status(): True/False, or None when
+        probe=False or the first background probe hasn't answered within
+        probe_wait seconds. With no default route it is False at once.
         """
         info = {
             "interfaces": [],
             "gateway": None,
+            "gateway_iface": None,
             "dns_servers": [],
-            "internet": False,
+            "internet": None,
+            "internet_age_s": None,
         }
 
+        native = False
         if self.os_type == "WINDOWS":
             self._parse_windows_network(info)
         else:
-            self._parse_linux_network(info)
+            native = self.os_type == "LINUX" and self._read_linux_network(info)
+            if not native:
+                self._parse_linux_network(info)
 
-        # Quick connectivity check
-        try:
-            s = socket.create_connection(("8.8.8.8", 53), timeout=3)
-            s.close()
-            info["internet"] = True
-        except Exception:
-            info["internet"] = False
+        if native and info["gateway"] is None:
+            info["internet"] = False        # no default route: nothing to probe
+        elif probe:
+            status = self.internet_status(wait=probe_wait)
+            info["internet"] = status["connected"]
+            info["internet_age_s"] = status["age_s"]
 
         return info
 
+    def internet_status(self, wait=0):
+        """
+        Cached connectivity check (TCP connect to NETINFO_PROBE_TARGET).
+        The probe runs on a background thread and its answer is reused for
+        NETINFO_PROBE_TTL seconds; a stale answer triggers a refresh but is
+        returned immediately. Waits up to `wait` seconds for a running probe.
+        Returns {"connected": True/False/None, "age_s", "pending"}.
+        """
+        with self._probe_lock:
+            thread = self._probe_thread
+            stale = (self._probe_checked is None
+                     or time.monotonic() - self._probe_checked > NETINFO_PROBE_TTL)
+            if stale and (thread is None or not thread.is_alive()):
+                thread = self._probe_thread = threading.Thread(
+                    target=self._probe_internet, daemon=True, name="GhostNetProbe")
+                thread.start()
+        if stale and wait:
+            thread.join(wait)
+        with self._probe_lock:
+            checked = self._probe_checked
+            return {
+                "connected": self._probe_connected,
+                "age_s": round(time.monotonic() - checked, 1) if checked else None,
+                "pending": self._probe_thread is not None and self._probe_thread.is_alive(),
+            }
+
+    def _probe_internet(self):
+        try:
+            socket.create_connection(NETINFO_PROBE_TARGET, timeout=NETINFO_PROBE_TIMEOUT).close()
+            connected = True
+        except OSError:
+            connected = False
+        with self._probe_lock:
+            self._probe_connected = connected
+            self._probe_checked = time.monotonic()
+
+    def interface_counters(self):
+        """
+        Per-interface traffic counters from /proc/net/dev:
+        {name: {rx_bytes, rx_packets, rx_errors, rx_dropped, tx_...}}.
+        Empty where /proc isn't available.
+        """
+        counters = {}
+        try:
+            with open("/proc/net/dev", "r") as f:
+                lines = f.readlines()[2:]
+        except OSError:
+            return counters
+        for line in lines:
+            name, _, data = line.partition(":")
+            fields = data.split()
+            if len(fields) < 12:
+                continue
+            rx, tx = fields[0:4], fields[8:12]
+            counters[name.strip()] = {
+                "rx_bytes": int(rx[0]), "rx_packets": int(rx[1]),
+                "rx_errors": int(rx[2]), "rx_dropped": int(rx[3]),
+                "tx_bytes": int(tx[0]), "tx_packets": int(tx[1]),
+                "tx_errors": int(tx[2]), "tx_dropped": int(tx[3]),
+            }
+        return counters
+
+    def _read_linux_network(self, info):
+        """
+        Fill info natively: interface names from if_nameindex (or
+        /sys/class/net), state/MAC/MTU from /sys, every IPv4 address from
+        getifaddrs(3) (secondaries and aliases included; SIOCGIFADDR, which
+        only sees the primary, if libc's can't be loaded), IPv6 from
+        /proc/net/if_inet6, counters from /proc/net/dev and the default
+        route from /proc/net/route. False if none of it is readable.
+        """
+        try:
+            names = [name for _index, name in socket.if_nameindex()]
+        except OSError:
+            try:
+                names = sorted(os.listdir("/sys/class/net"))
+            except OSError:
+                return False
+        if not names:
+            return False
+
+        counters = self.interface_counters()
+        ipv6 = _proc_if_inet6()
+        ipv4 = _getifaddrs_ipv4()
+        fcntl = ioctl_sock = None
+        if ipv4 is None:
+            try:
+                import fcntl
+                ioctl_sock = socket.socket(socket.AF_INET, socket.SOCK_DGRAM)
+            except (ImportError, OSError):
+                fcntl = ioctl_sock = None
+
+        try:
+            for name in names:
+                sys_dir = os.path.join("/sys/class/net", name)
+                mtu = _read_sys(sys_dir, "mtu")
+                iface = {
+                    "name": name,
+                    "ips": [],
+                    "ipv6": ipv6.get(name, []),
+                    "state": _read_sys(sys_dir, "operstate"),
+                    "mac": _read_sys(sys_dir, "address"),
+                    "mtu": int(mtu) if mtu and mtu.isdigit() else None,
+                    "netmask": None,
+                }
+                iface.update(counters.get(name, {}))
+                if ipv4 is not None:
+                    addresses = ipv4.get(name, [])
+                    iface["ips"] = [ip for ip, _mask in addresses]
+                    if addresses:
+                        iface["netmask"] = addresses[0][1]
+                elif ioctl_sock is not None:
+                    ip = _ifreq_ipv4(fcntl, ioctl_sock, name, SIOCGIFADDR)
+                    if ip:
+                        iface["ips"].append(ip)
+                        iface["netmask"] = _ifreq_ipv4(fcntl, ioctl_sock, name, SIOCGIFNETMASK)
+                info["interfaces"].append(iface)
+        finally:
+            if ioctl_sock is not None:
+                ioctl_sock.close()
+
+        info["gateway_iface"], info["gateway"] = _proc_default_route()
+        _read_resolv_conf(info)
+        return True
+
     def _parse_windows_network(self, info):
         """Parse ipconfig /all output into info dict.
         ipconfig fields use '. . . :' dot-padding notation.
@@ -257,7 +677,7 @@ class RootEngine:
                 prev_key = None
 
     def _parse_linux_network(self, info):
-        """Parse ip addr + route for Linux/Android."""
+        """Parse ip addr + route (fallback when /proc and /sys aren't readable)."""
         stdout, _ = self.exec_silent("ip addr show", timeout=10)
         current_iface = None
 
@@ -284,16 +704,7 @@ class RootEngine:
                     info["gateway"] = parts[idx + 1]
                     break
 
-        # DNS
-        try:
-            with open("/etc/resolv.conf", 'r') as f:
-                for line in f:
-                    if line.startswith("nameserver"):
-                        parts = line.split()
-                        if len(parts) >= 2:
-                            info["dns_servers"].append(parts[1])
-        except Exception:
-            pass
+        _read_resolv_conf(info)
 
     def flush_dns(self):
         """
@@ -455,3 +866,385 @@ class RootEngine:
             procs.sort(key=lambda x: x["cpu_pct"], reverse=True)
 
         return procs[:limit]
+
+
+class ShellCoprocess:
+    """
+    A long-lived POSIX shell that runs commands piped into its stdin.
+
+    Each command is sent as `command eval '<cmd>' </dev/null` (`command`
+    keeps a syntax error from exiting the shell) followed by printf
+    sentinels on stdout (carrying $?) and stderr, so output is delimited
+    without a process spawn per call, and cd/export/variables persist.
+    One command at a time. A command that exits the shell, times out or is
+    interrupted costs a restart, which resets that state.
+    """
+
+    def __init__(self, shell_path=None):
+        self.shell_path = shell_path or _default_shell()
+        self.commands_run = 0
+        self.restarts = 0
+        self._lock = threading.Lock()
+        self._process = None
+        self._events = None
+        self._token = secrets.token_hex(8)
+        self._seq = 0
+
+    @staticmethod
+    def supported():
+        return os.name != "nt" and _default_shell() is not None
+
+    @property
+    def alive(self):
+        return self._process is not None and self._process.poll() is None
+
+    @property
+    def pid(self):
+        return self._process.pid if self.alive else None
+
+    def run(self, cmd, on_lines=None, timeout=None, blocking=True):
+        """
+        Run one command. on_lines(stream, [lines]) receives output as it
+        arrives. Returns the same dict as RootEngine.exec_stream, or None
+        when blocking=False and another command is in flight.
+        """
+        if not self._lock.acquire(blocking):
+            return None
+        try:
+            return self._run_locked(cmd, on_lines, timeout)
+        finally:
+            self._lock.release()
+
+    def _run_locked(self, cmd, on_lines, timeout):
+        result = {
+            "returncode": None, "lines": 0, "bytes": 0,
+            "timed_out": False, "elapsed_ms": 0.0, "error": None,
+        }
+        start = time.perf_counter()
+        if not self.alive:
+            try:
+                self._start()
+            except OSError as e:
+                result["error"] = f"[!] Shell coprocess failed to start: {e}"
+                return result
+
+        self._seq += 1
+        marker = f"__ghost_{self._token}_{self._seq}__"
+        script = (
+            f"command eval {shlex.quote(cmd)} </dev/null\n"
+            f"printf '{marker}:%d\\n' \"$?\"\n"
+            f"printf '{marker}\\n' >&2\n"
+        )
+        try:
+            self._process.stdin.write(script.encode("utf-8"))
+            self._process.stdin.flush()
+        except (OSError, ValueError):
+            self._kill()
+            result["error"] = "[!] Shell coprocess died"
+            return result
+
+        pending = {"stdout", "stderr"}
+        deadline = time.monotonic() + timeout if timeout else None
+        try:
+            while pending:
+                if deadline and time.monotonic() > deadline:
+                    result["timed_out"] = True
+                    result["error"] = f"[!] Command timed out after {timeout}s"
+                    self._kill()
+                    break
+                try:
+                    stream, lines, nbytes, end = self._events.get(timeout=0.1)
+                except queue.Empty:
+                    continue
+                result["bytes"] += nbytes
+                if lines:
+                    result["lines"] += len(lines)
+                    if on_lines:
+                        on_lines(stream, lines)
+                if end == "eof":
+                    # The command exited the shell (or it crashed)
+                    self._kill()
+                    result["error"] = result["error"] or "[!] Shell exited; restarting on next command"
+                    break
+                if end is not None and end[0] == self._seq:
+                    pending.discard(stream)
+                    if stream == "stdout":
+                        result["returncode"] = end[1]
+        except KeyboardInterrupt:
+            self._kill()
+            raise
+        finally:
+            self.commands_run += 1
+            result["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return result
+
+    def close(self):
+        with self._lock:
+            if self.alive:
+                try:
+                    self._process.stdin.write(b"exit\n")
+                    self._process.stdin.flush()
+                    self._process.wait(timeout=1)
+                except (OSError, ValueError, subprocess.TimeoutExpired):
+                    pass
+            self._kill()
+
+    def _start(self):
+        if self._seq:   # a command ran before: this is a restart
+            self.restarts += 1
+        self._process = subprocess.Popen(
+            [self.shell_path],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE,
+            start_new_session=True,   # terminal Ctrl+C is handled by run()
+        )
+        self._events = queue.Queue(maxsize=STREAM_QUEUE)
+        prefix = f"__ghost_{self._token}_"
+        for pipe, name in ((self._process.stdout, "stdout"), (self._process.stderr, "stderr")):
+            threading.Thread(
+                target=_pump_coprocess, args=(pipe, name, self._events, prefix),
+                daemon=True, name=f"GhostCoproc-{name}",
+            ).start()
+
+    def _kill(self):
+        process, self._process = self._process, None
+        if process is None:
+            return
+        try:
+            os.killpg(process.pid, 9)
+        except OSError:
+            pass
+        try:
+            process.wait(timeout=2)
+        except subprocess.TimeoutExpired:
+            pass
+        for pipe in (process.stdin, process.stdout, process.stderr):
+            try:
+                pipe.close()
+            except OSError:
+                pass
+
+
+# ─── helpers ──────────────────────────────────────────────────────────────────
+
+def _read_sys(directory, name):
+    """One /sys attribute, stripped, or None."""
+    try:
+        with open(os.path.join(directory, name), "r") as f:
+            return f.read().strip() or None
+    except OSError:
+        return None
+
+
+def _ifreq_ipv4(fcntl, sock, name, request):
+    """IPv4 address-type ifreq ioctl (SIOCGIFADDR/NETMASK) -> dotted quad or None."""
+    try:
+        ifreq = struct.pack("256s", name.encode()[:15])
+        return socket.inet_ntoa(fcntl.ioctl(sock.fileno(), request, ifreq)[20:24])
+    except OSError:
+        return None                     # no IPv4 address on this interface
+
+
+def _getifaddrs_ipv4():
+    """
+    {iface: [(ip, netmask), ...]} for every IPv4 address, from libc's
+    getifaddrs(3) via ctypes. Alias labels ("eth0:1") are folded into
+    their interface. None if getifaddrs isn't available.
+    """
+    try:
+        import ctypes
+        import ctypes.util
+        libc = ctypes.CDLL(ctypes.util.find_library("c") or "libc.so.6", use_errno=True)
+        getifaddrs, freeifaddrs = libc.getifaddrs, libc.freeifaddrs
+    except (ImportError, OSError, AttributeError):
+        return None
+
+    class Ifaddrs(ctypes.Structure):
+        pass
+    Ifaddrs._fields_ = [
+        ("ifa_next", ctypes.POINTER(Ifaddrs)), ("ifa_name", ctypes.c_char_p),
+        ("ifa_flags", ctypes.c_uint), ("ifa_addr", ctypes.c_void_p),
+        ("ifa_netmask", ctypes.c_void_p), ("ifa_ifu", ctypes.c_void_p),
+        ("ifa_data", ctypes.c_void_p),
+    ]
+
+    def ipv4(sockaddr):
+        # Linux struct sockaddr_in: sa_family (u16), port (u16), addr (4 bytes)
+        if not sockaddr:
+            return None
+        raw = ctypes.string_at(sockaddr, 8)
+        if struct.unpack("=H", raw[:2])[0] != socket.AF_INET:
+            return None
+        return socket.inet_ntoa(raw[4:8])
+
+    head = ctypes.POINTER(Ifaddrs)()
+    if getifaddrs(ctypes.byref(head)) != 0:
+        return None
+    addresses = {}
+    try:
+        node = head
+        while node:
+            entry = node.contents
+            ip = ipv4(entry.ifa_addr)
+            if ip:
+                name = entry.ifa_name.decode(errors="replace").split(":")[0]
+                addresses.setdefault(name, []).append((ip, ipv4(entry.ifa_netmask)))
+            node = entry.ifa_next
+    finally:
+        freeifaddrs(head)
+    return addresses
+
+
+def _proc_if_inet6():
+    """{iface: ["addr/prefix", ...]} from /proc/net/if_inet6."""
+    addresses = {}
+    try:
+        with open("/proc/net/if_inet6", "r") as f:
+            for line in f:
+                fields = line.split()
+                if len(fields) < 6:
+                    continue
+                address = socket.inet_ntop(socket.AF_INET6, bytes.fromhex(fields[0]))
+                addresses.setdefault(fields[5], []).append(f"{address}/{int(fields[2], 16)}")
+    except (OSError, ValueError):
+        pass
+    return addresses
+
+
+def _proc_default_route():
+    """(iface, gateway) of the lowest-metric IPv4 default route, or (None, None)."""
+    best = None
+    try:
+        with open("/proc/net/route", "r") as f:
+            next(f, None)
+            for line in f:
+                fields = line.split()
+                if len(fields) < 8 or fields[1] != "00000000":
+                    continue
+                if not int(fields[3], 16) & RTF_GATEWAY:
+                    continue
+                metric = int(fields[6])
+                if best is None or metric < best[0]:
+                    # Addresses are the kernel's u32 printed in host byte order
+                    gateway = socket.inet_ntoa(struct.pack("=L", int(fields[2], 16)))
+                    best = (metric, fields[0], gateway)
+    except (OSError, ValueError):
+        pass
+    return (best[1], best[2]) if best else (None, None)
+
+
+def _read_resolv_conf(info):
+    try:
+        with open("/etc/resolv.conf", 'r') as f:
+            for line in f:
+                if line.startswith("nameserver"):
+                    parts = line.split()
+                    if len(parts) >= 2:
+                        info["dns_servers"].append(parts[1])
+    except Exception:
+        pass
+
+
+def _default_shell():
+    """The shell Popen(shell=True) would use, or None."""
+    if hasattr(sys, "getandroidapilevel"):
+        return "/system/bin/sh"
+    return "/bin/sh" if os.path.exists("/bin/sh") else shutil.which("sh")
+
+
+def _kill_group(process):
+    """SIGKILL a process started with detach=True, and everything in its group."""
+    try:
+        if os.name == "nt":
+            process.kill()
+        else:
+            os.killpg(process.pid, signal.SIGKILL)
+    except OSError:
+        pass
+
+
+def _latency_stats(samples):
+    ordered = sorted(samples)
+    return {
+        "median_ms": round(statistics.median(ordered), 3),
+        "mean_ms": round(statistics.fmean(ordered), 3),
+        "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 3),
+        "min_ms": round(ordered[0], 3),
+    }
+
+
+def _pump_coprocess(pipe, name, events, prefix):
+    """
+    Reader thread for ShellCoprocess: like _pump_pipe, but watches for the
+    sentinel `<prefix><seq>__[:rc]` and queues (name, lines, nbytes, end)
+    where end is (seq, rc), "eof" or None.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    try:
+        while True:
+            chunk = pipe.read1(STREAM_CHUNK)
+            if not chunk:
+                break
+            pending += decoder.decode(chunk)
+            *complete, pending = pending.split("\n")
+            lines = []
+            for line in complete:
+                idx = line.find(prefix)
+                if idx < 0:
+                    lines.append(line.rstrip("\r"))
+                    continue
+                if idx:
+                    lines.append(line[:idx])    # output without a final newline
+                seq, _, rc = line[idx + len(prefix):].partition("__")
+                try:
+                    end = (int(seq), int(rc.lstrip(":") or 0))
+                except ValueError:
+                    lines.append(line)
+                    continue
+                events.put((name, lines, len(chunk), end))
+                lines, chunk = [], b""
+            while len(pending) > STREAM_MAX_LINE:
+                lines.append(pending[:STREAM_MAX_LINE])
+                pending = pending[STREAM_MAX_LINE:]
+            if lines:
+                events.put((name, lines, len(chunk), None))
+    except (OSError, ValueError):
+        pass
+    finally:
+        events.put((name, [pending] if pending else [], 0, "eof"))
+
+
+def _pump_pipe(pipe, name, pieces, byte_counts):
+    """
+    Reader thread for exec_stream: split each read into lines and queue
+    them as (name, [lines]); queue None at EOF. Decodes incrementally so
+    multi-byte characters split across reads survive.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+    pending = ""
+    byte_counts[name] = 0
+    try:
+        while True:
+            chunk = pipe.read1(STREAM_CHUNK) if hasattr(pipe, "read1") else pipe.read(STREAM_CHUNK)
+            if not chunk:
+                break
+            byte_counts[name] += len(chunk)
+            pending += decoder.decode(chunk)
+            *lines, pending = pending.split("\n")
+            lines = [line.rstrip("\r") for line in lines]
+            while len(pending) > STREAM_MAX_LINE:
+                lines.append(pending[:STREAM_MAX_LINE])
+                pending = pending[STREAM_MAX_LINE:]
+            if lines:
+                pieces.put((name, lines))
+        pending += decoder.decode(b"", final=True)
+        if pending:
+            pieces.put((name, [pending.rstrip("\r")]))
+    except (OSError, ValueError):
+        pass
+    finally:
+        try:
+            pipe.close()
+        except OSError:
+            pass
+        pieces.put(None)
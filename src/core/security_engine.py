@@ -24,8 +24,11 @@ Compartmentalization:
 import os
 import json
 import hashlib
+import hmac
 import secrets
 import getpass
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
 
@@ -57,6 +60,7 @@ class SecurityEngine:
 
     ENGINE_NAME = "security"
     ENGINE_VERSION = "1.0.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
@@ -65,6 +69,7 @@ class SecurityEngine:
         self.current_role = Role.GUEST  # Default until authenticated
         self.current_key_id = None
         self.authenticated = False
+        self._acting = threading.local()    # per-thread role override (acting_as)
 
         os.makedirs(self.keys_dir, exist_ok=True)
 
@@ -221,7 +226,7 @@ class SecurityEngine:
         Issue a new key (wrapper for generate_key with file creation).
         Only God can issue keys.
         """
-        if self.current_role != Role.GOD:
+        if self.effective_role != Role.GOD:
             return None, "Only God role can issue keys"
 
         if role == Role.GOD:
@@ -242,7 +247,7 @@ class SecurityEngine:
 
     def revoke_key(self, key_id):
         """Revoke a key by ID."""
-        if self.current_role != Role.GOD:
+        if self.effective_role != Role.GOD:
             return False, "Only God role can revoke keys"
 
         if key_id == "god-master":
@@ -301,17 +306,83 @@ class SecurityEngine:
     # AUTHORIZATION
     # =========================================================================
 
-    def has_permission(self, required_role):
-        """Check if current session has the required role."""
+    @property
+    def effective_role(self):
+        """
+        The role checks run against on this thread: the one set by
+        acting_as() (an API caller's request), else the session's.
+        """
+        return getattr(self._acting, "role", None) or self.current_role
+
+    @contextmanager
+    def acting_as(self, role):
+        """
+        Run the block with `role` as this thread's effective role, so checks
+        made anywhere inside a command (not only its REQUIRED_ROLE) apply
+        to the caller rather than the interactive session.
+        """
+        previous = getattr(self._acting, "role", None)
+        self._acting.role = role
+        try:
+            yield
+        finally:
+            self._acting.role = previous
+
+    def has_permission(self, required_role, role=None):
+        """
+        Check if the effective role (see acting_as) has the required role.
+        Pass `role` to check a remote caller instead (e.g. an API client
+        authenticated with role_for_secret); the session must still be
+        authenticated for anyone to be granted anything.
+        """
         if not self.authenticated:
             return False
-        return Role.has_permission(self.current_role, required_role)
+        return Role.has_permission(role or self.effective_role, required_role)
+
+    def role_for_secret(self, secret):
+        """
+        Map a presented key secret to its role.
+        Only the God Key and active, unexpired keys whose key file is
+        present qualify. Returns the role string, or None if no match.
+        """
+        if not secret:
+            return None
+
+        god_key_path = os.path.join(self.keys_dir, "god.key")
+        candidates = [god_key_path]
+        keyring = self._load_keyring()
+        for key_id, info in keyring.items():
+            if not info.get("active", True):
+                continue
+            if info.get("expires"):
+                try:
+                    if datetime.now() > datetime.fromisoformat(info["expires"]):
+                        continue
+                except ValueError:
+                    continue
+            candidates.append(os.path.join(self.keys_dir, f"{key_id}.key"))
+
+        for key_file in candidates:
+            if not os.path.exists(key_file):
+                continue
+            try:
+                with open(key_file, 'r') as f:
+                    key_data = json.load(f)
+            except Exception:
+                continue
+            stored = key_data.get("secret")
+            if stored and hmac.compare_digest(str(stored), str(secret)):
+                if key_file == god_key_path:
+                    return Role.GOD
+                return keyring.get(key_data.get("key_id"), {}).get(
+                    "role", key_data.get("role", Role.GUEST))
+        return None
 
     def require_role(self, role):
         """Decorator-style check. Returns (allowed, message)."""
         if self.has_permission(role):
             return True, None
-        return False, f"Access Denied. Required: {role}, Current: {self.current_role}"
+        return False, f"Access Denied. Required: {role}, Current: {self.effective_role}"
 
     # =========================================================================
     # KEYRING PERSISTENCE
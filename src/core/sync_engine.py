@@ -21,6 +21,7 @@ class SyncEngine:
 
     ENGINE_NAME = "sync"
     ENGINE_VERSION = "2.0.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
@@ -106,6 +107,10 @@ class SyncEngine:
         output_path = str(output_path)
         os.makedirs(os.path.dirname(output_path), exist_ok=True)
 
+        # Fold any SQLite WAL into its database so the copied file is complete
+        if vault:
+            vault.flush()
+
         with zipfile.ZipFile(output_path, 'w', zipfile.ZIP_DEFLATED) as zf:
             for root, dirs, files in os.walk(vault_dir):
                 for file in files:
@@ -134,6 +139,11 @@ class SyncEngine:
         if os.path.exists(vault_dir):
             self.export_vault(output_path=pre_backup_path)
 
+        # Database handles must not outlive the files being replaced;
+        # the vault reopens them on next use
+        if vault:
+            vault.close_storage()
+
         # Extract new vault
         restored_count = 0
         with zipfile.ZipFile(zip_path, 'r') as zf:
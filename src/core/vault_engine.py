@@ -4,6 +4,17 @@ Engine 07: Vault Engine - The Archive
 Data persistence: journals, todos, encrypted storage, exports.
 All data lives in data/vault/ using simple files (no database dependency).
 Vault path is configurable via data/config/settings.json.
+Journal search runs on an inverted index kept in vault/index/, updated as
+entries are added (JournalIndex below); a per-day sidecar of entry offsets
+(JournalOffsets) lets paging, tail, tag filters and search previews seek
+straight to entries.
+
+Todo storage is pluggable ("vault_todo_backend" in settings.json):
+- "json" (default): todos/active.json snapshot + active.wal, an append-only
+  log of mutations compacted into the snapshot by a PulseEngine task
+- "sqlite": todos/todos.db (stdlib sqlite3, WAL), indexed point updates;
+  the JSON list is migrated into it once on first use, and exported back
+  (todos.db kept as todos.db.exported) when json is selected again
 
 Compartmentalization:
 - ONLY handles file operations
@@ -12,15 +23,49 @@ Compartmentalization:
 """
 
 import os
+import re
 import json
+import math
+import time
+import mmap
+import zlib
+import bisect
+import struct
+import threading
+from collections import deque
 from datetime import datetime
 
+# sqlite3 is stdlib but optional in some minimal builds (graceful degradation)
+try:
+    import sqlite3
+except ImportError:
+    sqlite3 = None
+
+
+INDEX_LOG_MAX_BYTES = 256 * 1024    # journal index delta log folded into the snapshot past this
+INDEX_LOG_BATCH = 32                # a refresh touching more files than this saves a snapshot instead
+SEARCH_PREVIEW_LINES = 3            # preview lines per matching day
+JOURNAL_PAGE_SIZE = 10              # entries per `journal show` page
+JOURNAL_TAIL = 20                   # entries shown by `journal tail`
+TODO_BACKENDS = ("json", "sqlite")  # "vault_todo_backend" values
+TODO_PRIORITIES = ("critical", "high", "normal", "low")
+FSYNC_MODES = ("always", "batch", "off")   # "vault_fsync"
+WAL_FSYNC_WINDOW = 0.5              # "batch": appends within this many seconds share one fsync
+WAL_COMPACT_INTERVAL = 300          # seconds between WAL compactions ("vault_compact_interval", 0 = shutdown only)
+
+_WORD = re.compile(r"[^\W_]+")
+_TAG = re.compile(r"(?<![\w#])#([^\W_][\w-]*)")
+_ENTRY_HEADER = re.compile(r"^## (\d{2}:\d{2}:\d{2})(.*)$")
+_QUERY_TERM = re.compile(r'"([^"]*)"|(\S+)')
+_JOURNAL_FILE = re.compile(r"^(\d{4}-\d{2}-\d{2})\.md$")
+
 
 class VaultEngine:
     """The Archive - data persistence and management."""
 
     ENGINE_NAME = "vault"
-    ENGINE_VERSION = "2.0.0"
+    ENGINE_VERSION = "2.3.0"
+    ENGINE_DEPS = ["ghost_core"]
 
     def __init__(self, kernel):
         self.kernel = kernel
@@ -33,6 +78,21 @@ class VaultEngine:
         self.todos_dir = os.path.join(self.vault_dir, "todos")
         self.encrypted_dir = os.path.join(self.vault_dir, "encrypted")
 
+        # Search index over the journal (derived data - `journal reindex` rebuilds it)
+        self.index_dir = os.path.join(self.vault_dir, "index")
+        self._offsets = JournalOffsets(self.journal_dir, self.index_dir)
+        self._index = JournalIndex(self.journal_dir, self.index_dir, offsets=self._offsets)
+        self._journal_lock = threading.Lock()
+
+        # Todo storage backend
+        self.todo_backend = self._select_todo_backend(kernel)
+        self.fsync_mode = str(kernel.settings.get("vault_fsync", "batch")).lower()
+        if self.fsync_mode not in FSYNC_MODES:
+            self.fsync_mode = "batch"
+        self.compact_interval = float(kernel.settings.get("vault_compact_interval", WAL_COMPACT_INTERVAL))
+        self._todos = _open_todo_store(self.todo_backend, self.todos_dir, self.fsync_mode)
+        kernel.on("shutdown", lambda _data: self.close_storage())
+
         # Keys path NEVER follows vault_path — always machine-local
         self.keys_dir = os.path.join(self.root_dir, "data", "keys")
 
@@ -94,13 +154,29 @@ class VaultEngine:
 
         content = f"\n## {timestamp}{tag_str}\n{entry}\n"
 
-        # Create file with header if new
-        if not os.path.exists(journal_file):
-            header = f"# Ghost Journal - {today}\n"
-            content = header + content
+        with self._journal_lock:
+            try:
+                prev_size = os.path.getsize(journal_file)
+            except OSError:
+                prev_size = 0
+            # Create file with header if new
+            if not prev_size:
+                header = f"# Ghost Journal - {today}\n"
+                content = header + content
+
+            # Binary append: text mode would write \r\n on Windows, and the
+            # sidecar offsets and index sizes below count the bytes of `content`
+            with open(journal_file, 'ab') as f:
+                f.write(content.encode('utf-8'))
 
-        with open(journal_file, 'a', encoding='utf-8') as f:
-            f.write(content)
+            try:
+                self._offsets.note_append(today, journal_file, prev_size, content)
+            except OSError:
+                pass    # the sidecar no longer covers the file; it's rebuilt on next read
+            try:
+                self._index.note_append(today, journal_file, prev_size, content)
+            except OSError:
+                pass    # the next search notices the size change and reindexes the day
 
         return {
             "file": journal_file,
@@ -141,108 +217,229 @@ class VaultEngine:
         total = len(os.listdir(self.journal_dir)) if os.path.exists(self.journal_dir) else 0
         return {"entries": entries, "total_files": total}
 
-    def journal_search(self, query):
-        """Search across all journal entries."""
-        results = []
-        query_lower = query.lower()
+    # ----- streaming reads -----
 
-        if not os.path.exists(self.journal_dir):
-            return {"query": query, "results": [], "total_matches": 0}
+    def journal_dates(self, since=None, until=None, reverse=False):
+        """Journal days (YYYY-MM-DD) within since/until, from file names alone."""
+        try:
+            names = os.listdir(self.journal_dir)
+        except FileNotFoundError:
+            return []
+        dates = []
+        for name in names:
+            match = _JOURNAL_FILE.match(name)
+            if match:
+                date = match.group(1)
+                if (not since or date >= since) and (not until or date <= until):
+                    dates.append(date)
+        return sorted(dates, reverse=reverse)
 
-        for f in sorted(os.listdir(self.journal_dir), reverse=True):
-            if not f.endswith('.md'):
-                continue
-            filepath = os.path.join(self.journal_dir, f)
-            with open(filepath, 'r', encoding='utf-8') as fh:
-                content = fh.read()
-                if query_lower in content.lower():
-                    results.append({
-                        "date": f.replace('.md', ''),
-                        "file": f,
-                        "preview": self._extract_matching_lines(content, query_lower),
-                    })
-
-        return {"query": query, "results": results, "total_matches": len(results)}
-
-    def _extract_matching_lines(self, content, query):
-        """Extract lines containing the search query."""
-        lines = content.split('\n')
-        matches = [l.strip() for l in lines if query in l.lower()]
-        return matches[:3]
+    def iter_journal(self, since=None, until=None, reverse=False, tag=None):
+        """
+        Yield journal entries lazily: {date, time, tags, text}. Days are
+        opened one at a time, only when reached, and parsed line by line.
+        reverse=True walks newest day first (entries within a day newest
+        first too, which holds one day in memory). With a tag, candidates
+        come from the offset sidecar and only they are read.
+        """
+        for date in self.journal_dates(since, until, reverse=reverse):
+            entries = self._iter_tagged(date, tag) if tag else self._iter_day(date)
+            if reverse:
+                entries = reversed(list(entries))
+            yield from entries
 
-    # =========================================================================
-    # TODOS
-    # =========================================================================
+    def journal_page(self, date=None, page=1, per_page=JOURNAL_PAGE_SIZE, since=None,
+                     until=None, tag=None):
+        """
+        One page of entries, oldest first, for a day (default today) or a
+        since/until range. Untagged pages skip whole days and leading
+        entries by their offset-sidecar counts and read only the page (plus
+        one entry, to know whether another page follows).
+        """
+        if date:
+            since = until = date
+        elif not since and not until:
+            since = until = datetime.now().strftime("%Y-%m-%d")
+        page = max(1, page)
+        skip = (page - 1) * per_page
+        wanted = per_page + 1
+        entries = []
 
-    def todo_add(self, text, priority="normal"):
-        """Add a todo item."""
-        todos = self._load_todos()
-
-        todo_id = len(todos["items"]) + 1
-        item = {
-            "id": todo_id,
-            "text": text,
-            "priority": priority,
-            "created": datetime.now().isoformat(),
-            "completed": None,
-            "done": False,
+        if tag:
+            for n, entry in enumerate(self.iter_journal(since, until, tag=tag)):
+                if n >= skip:
+                    entries.append(entry)
+                    if len(entries) == wanted:
+                        break
+        else:
+            for day in self.journal_dates(since, until):
+                count = self._offsets.count(day)
+                if skip >= count:
+                    skip -= count
+                    continue
+                chosen = self._offsets.records(day)[skip:skip + wanted - len(entries)]
+                skip = 0
+                entries.extend(self._offsets.read_entries(day, chosen))
+                if len(entries) == wanted:
+                    break
+
+        return {
+            "since": since,
+            "until": until,
+            "page": page,
+            "per_page": per_page,
+            "tag": tag,
+            "entries": entries[:per_page],
+            "has_more": len(entries) > per_page,
         }
-        todos["items"].append(item)
-        self._save_todos(todos)
 
-        return item
+    def journal_tail(self, n=JOURNAL_TAIL, since=None, until=None, tag=None):
+        """
+        The last `n` entries (oldest first) across days, newest day back.
+        Each day's last records come from its offset sidecar and are read
+        directly; stops opening days once it has `n`.
+        """
+        collected = []      # newest day first, each day's run oldest first
+        wanted = n
+        for date in self.journal_dates(since, until, reverse=True):
+            if wanted <= 0:
+                break
+            if tag:
+                last = list(deque(self._iter_tagged(date, tag), maxlen=wanted))
+            else:
+                records = self._offsets.records(date)
+                last = list(self._offsets.read_entries(date, records[max(0, len(records) - wanted):]))
+            collected.append(last)
+            wanted -= len(last)
+        entries = [entry for day in reversed(collected) for entry in day]
+        return {"entries": entries, "count": len(entries), "since": since,
+                "until": until, "tag": tag}
 
-    def todo_list(self, show_done=False):
-        """List todo items."""
-        todos = self._load_todos()
-        items = todos["items"]
+    def _iter_day(self, date):
+        path = os.path.join(self.journal_dir, f"{date}.md")
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                yield from _parse_entries(f, date)
+        except FileNotFoundError:
+            return
 
-        if not show_done:
-            items = [i for i in items if not i["done"]]
+    def _iter_tagged(self, date, tag):
+        """Entries of one day carrying `tag`: sidecar mask first, header confirms."""
+        tag = tag.lstrip("#").lower()
+        records = self._offsets.records(date, tag_mask=_tag_bit(tag))
+        for entry in self._offsets.read_entries(date, records):
+            if tag in (t.lower() for t in entry["tags"]):
+                yield entry
 
-        return {"items": items, "total": len(todos["items"])}
+    def journal_search(self, query, since=None, until=None, limit=None):
+        """
+        Search the journal through the inverted index.
 
-    def todo_complete(self, todo_id):
-        """Mark a todo as complete."""
-        todos = self._load_todos()
+        Query syntax: plain words (all must appear in the same entry),
+        "quoted phrases", #tags and word* prefixes. since/until are
+        YYYY-MM-DD bounds (inclusive). Days are ranked by their best entry:
+        matching lines weighted by how rare each term is across the journal.
+        """
+        start = time.perf_counter()
+        terms = _parse_journal_query(query)
+        if not terms:
+            return {"query": query, "results": [], "total_matches": 0,
+                    "error": "Empty query"}
 
-        for item in todos["items"]:
-            if item["id"] == todo_id:
-                item["done"] = True
-                item["completed"] = datetime.now().isoformat()
-                self._save_todos(todos)
-                return item
+        with self._index.lock:
+            self._index.refresh()
+            results = self._index.search(terms, since=since, until=until)
+
+        if limit:
+            results = results[:limit]
+        return {
+            "query": query,
+            "results": results,
+            "total_matches": len(results),
+            "total_entries": sum(r["entries"] for r in results),
+            "elapsed_ms": round((time.perf_counter() - start) * 1000, 2),
+        }
 
-        return None
+    def journal_reindex(self):
+        """Rebuild the journal search index and entry offsets from the journal files."""
+        start = time.perf_counter()
+        for date in self.journal_dates():
+            self._offsets.rebuild(date)
+        with self._index.lock:
+            self._index.rebuild()
+            stats = self._index.stats()
+        stats["elapsed_ms"] = round((time.perf_counter() - start) * 1000, 2)
+        return stats
+
+    def journal_index_stats(self):
+        """Size of the journal search index."""
+        with self._index.lock:
+            self._index.refresh()
+            return self._index.stats()
+
+    # =========================================================================
+    # TODOS
+    # =========================================================================
+
+    def todo_add(self, text, priority="normal"):
+        """Add a todo item. IDs are never reused, even after removals."""
+        return self._todos.add(text, priority, datetime.now().isoformat())
+
+    def todo_list(self, show_done=False, priority=None):
+        """List todo items (optionally one priority only)."""
+        items, total = self._todos.list(show_done=show_done, priority=priority)
+        return {"items": items, "total": total}
+
+    def todo_complete(self, todo_id):
+        """Mark a todo as complete."""
+        return self._todos.complete(todo_id, datetime.now().isoformat())
 
     def todo_remove(self, todo_id):
         """Remove a todo item."""
-        todos = self._load_todos()
-        original_count = len(todos["items"])
-        todos["items"] = [i for i in todos["items"] if i["id"] != todo_id]
+        return self._todos.remove(todo_id)
 
-        if len(todos["items"]) < original_count:
-            self._save_todos(todos)
-            return True
-        return False
+    def todo_backend_info(self):
+        """Which todo backend is active, where it stores, and its counts."""
+        info = {"backend": self._todos.name, "path": self._todos.path}
+        info.update(self._todos.counts())
+        info.update(self._todos.describe())
+        return info
 
-    def _load_todos(self):
-        """Load todos from file."""
-        todo_file = os.path.join(self.todos_dir, "active.json")
-        if os.path.exists(todo_file):
-            try:
-                with open(todo_file, 'r', encoding='utf-8') as f:
-                    return json.load(f)
-            except Exception:
-                pass
-        return {"items": []}
+    def _select_todo_backend(self, kernel):
+        backend = str(kernel.settings.get("vault_todo_backend", "json")).lower()
+        if backend not in TODO_BACKENDS:
+            print(f"   [!] Vault: unknown todo backend '{backend}', using json")
+            return "json"
+        if backend == "sqlite" and sqlite3 is None:
+            print("   [!] Vault: sqlite3 unavailable in this Python, using json todos")
+            return "json"
+        return backend
 
-    def _save_todos(self, todos):
-        """Save todos to file."""
-        os.makedirs(self.todos_dir, exist_ok=True)
-        todo_file = os.path.join(self.todos_dir, "active.json")
-        with open(todo_file, 'w', encoding='utf-8') as f:
-            json.dump(todos, f, indent=2)
+    # =========================================================================
+    # STORAGE LIFECYCLE
+    # =========================================================================
+
+    def start_compaction(self, interval=None):
+        """Fold the todo WAL into its snapshot every `interval` seconds (PulseEngine task)."""
+        interval = self.compact_interval if interval is None else interval
+        pulse = self.kernel.get_engine("pulse")
+        if not pulse or interval <= 0:
+            return False
+        pulse.unregister_task("vault_compact")
+        pulse.register_task("vault_compact", interval, self.compact)
+        return True
+
+    def compact(self):
+        """Fold logged mutations into the snapshot now. Returns records (or pages) folded."""
+        return self._todos.compact()
+
+    def flush(self):
+        """Make the on-disk files self-contained (before copying the vault)."""
+        self._todos.flush()
+
+    def close_storage(self):
+        """Release open database handles (shutdown, or before a restore overwrites them)."""
+        self._todos.close()
 
     # =========================================================================
     # GENERAL DATA
@@ -261,13 +458,1260 @@ class VaultEngine:
         except FileNotFoundError:
             journal_count = 0
 
-        todos = self._load_todos()
-        active_todos = len([i for i in todos["items"] if not i["done"]])
-        done_todos = len([i for i in todos["items"] if i["done"]])
+        counts = self._todos.counts()
 
         return {
             "journal_entries": journal_count,
-            "active_todos": active_todos,
-            "completed_todos": done_todos,
+            "active_todos": counts["active"],
+            "completed_todos": counts["completed"],
+            "todo_backend": self._todos.name,
             "vault_dir": self.vault_dir,
         }
+
+
+# ─── helpers ──────────────────────────────────────────────────────────────────
+
+def _parse_journal_query(query):
+    """
+    Split a search query into term groups. Each term is a dict:
+    {"kind": "word"|"prefix"|"tag"|"phrase", "tokens": [...], "text": raw}.
+    A bare term that tokenizes to several words ("ping-pong", "8.8.8.8")
+    becomes a phrase, so it means what it looks like.
+    """
+    terms = []
+    for match in _QUERY_TERM.finditer(query or ""):
+        quoted, bare = match.groups()
+        raw = quoted if quoted is not None else bare
+        if bare and bare.startswith("#") and len(bare) > 1:
+            tag = bare[1:].lower()
+            if tag.endswith("*"):
+                terms.append({"kind": "prefix", "tokens": ["#" + tag.rstrip("*")], "text": raw})
+            else:
+                terms.append({"kind": "tag", "tokens": ["#" + tag], "text": raw})
+            continue
+        prefix = bare is not None and bare.endswith("*")
+        tokens = _WORD.findall(raw.lower())
+        if not tokens:
+            continue
+        if len(tokens) > 1:
+            terms.append({"kind": "phrase", "tokens": tokens, "text": raw})
+        elif prefix:
+            terms.append({"kind": "prefix", "tokens": tokens, "text": raw})
+        else:
+            terms.append({"kind": "word", "tokens": tokens, "text": raw})
+    return terms
+
+
+def _index_lines(lines, start=0):
+    """
+    Postings for a run of journal lines numbered from `start`.
+    Returns ({token: [line, ...]}, [entry header line, ...]). Entry headers
+    contribute only their tags; the file title line is skipped.
+    """
+    postings = {}
+    entries = []
+    for n, line in enumerate(lines, start):
+        header = _ENTRY_HEADER.match(line)
+        if header:
+            entries.append(n)
+            tokens = {"#" + t.lower() for t in _TAG.findall(header.group(2))}
+        elif n == 0 and line.startswith("# "):
+            continue
+        else:
+            lower = line.lower()
+            tokens = set(_WORD.findall(lower))
+            tokens.update("#" + t for t in _TAG.findall(lower))
+        for token in tokens:
+            postings.setdefault(token, []).append(n)
+    return postings, entries
+
+
+def _parse_entries(lines, date):
+    """
+    Entries from an iterable of journal lines, one at a time. Text before
+    the first "## HH:MM:SS" header (other than the file title) becomes an
+    entry with no time.
+    """
+    entry = {"date": date, "time": None, "tags": [], "lines": []}
+    for n, line in enumerate(lines):
+        line = line.rstrip("\r\n")
+        header = _ENTRY_HEADER.match(line)
+        if header:
+            if entry["time"] or any(entry["lines"]):
+                yield _finish_entry(entry)
+            entry = {"date": date, "time": header.group(1),
+                     "tags": _TAG.findall(header.group(2)), "lines": []}
+        elif not (n == 0 and line.startswith("# ")):
+            entry["lines"].append(line)
+    if entry["time"] or any(entry["lines"]):
+        yield _finish_entry(entry)
+
+
+def _tag_bit(tag):
+    """This tag's bit in an offset record's 64-bit tag mask."""
+    return 1 << (zlib.crc32(tag.lower().encode("utf-8")) & 63)
+
+
+def _finish_entry(entry):
+    lines = entry.pop("lines")
+    entry["text"] = "\n".join(lines).strip("\n")
+    return entry
+
+
+def _contains_sequence(words, phrase):
+    """True if `phrase` occurs as a contiguous run in `words`."""
+    n = len(phrase)
+    first = phrase[0]
+    for i, word in enumerate(words):
+        if word == first and words[i:i + n] == phrase:
+            return True
+    return False
+
+
+# ─── journal index ────────────────────────────────────────────────────────────
+
+class JournalIndex:
+    """
+    Inverted index over the journal: token -> {date: [line numbers]}.
+    Tokens are lowercased words plus "#tag" for tags (entry headers and
+    inline). Each day also records its file's size, mtime and the lines of
+    its "## HH:MM:SS" entry headers, so postings resolve to entries and a
+    file edited outside Ghost is caught by a stat and reindexed on its own.
+
+    On disk (vault/index/): a snapshot, journal.json, plus journal.log - one
+    JSON line per change. journal_add appends a line instead of rewriting
+    the index, and doesn't even load it; the log is folded into the
+    snapshot once it passes INDEX_LOG_MAX_BYTES.
+    """
+
+    VERSION = 1
+
+    def __init__(self, journal_dir, index_dir, offsets=None):
+        self.journal_dir = journal_dir
+        self.index_dir = index_dir
+        self.offsets = offsets      # JournalOffsets: read matching entries only
+        self.snapshot_path = os.path.join(index_dir, "journal.json")
+        self.log_path = os.path.join(index_dir, "journal.log")
+        self.postings = {}          # {token: {date: [line, ...]}}
+        self.files = {}             # {date: {"size", "mtime_ns", "lines", "entries"}}
+        self.lock = threading.RLock()
+        self._loaded = False
+
+    # ── persistence ──
+
+    def load(self):
+        """Read the snapshot and replay the log (once per process)."""
+        if self._loaded:
+            return
+        try:
+            with open(self.snapshot_path, 'r', encoding='utf-8') as f:
+                snapshot = json.load(f)
+            if snapshot.get("version") == self.VERSION:
+                self.postings = snapshot["postings"]
+                self.files = snapshot["files"]
+        except (OSError, ValueError, KeyError):
+            pass
+        try:
+            with open(self.log_path, 'r', encoding='utf-8') as f:
+                for line in f:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue    # torn last line from a crash; refresh repairs the day
+                    self._apply(record)
+        except OSError:
+            pass
+        self._loaded = True
+        self._maybe_compact()
+
+    def save(self):
+        """Write a snapshot (atomically) and empty the log."""
+        os.makedirs(self.index_dir, exist_ok=True)
+        tmp = self.snapshot_path + ".tmp"
+        # dumps() rather than dump(): only the former uses the C encoder
+        data = json.dumps({"version": self.VERSION, "files": self.files,
+                           "postings": self.postings}, separators=(",", ":"))
+        with open(tmp, 'w', encoding='utf-8') as f:
+            f.write(data)
+        os.replace(tmp, self.snapshot_path)
+        # A crash before this truncate replays records the snapshot already
+        # holds; their prev_size no longer matches, so those days get reindexed
+        with open(self.log_path, 'w', encoding='utf-8'):
+            pass
+
+    def _append_log(self, record):
+        os.makedirs(self.index_dir, exist_ok=True)
+        with open(self.log_path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps(record, separators=(",", ":")) + "\n")
+
+    def _maybe_compact(self):
+        try:
+            if os.path.getsize(self.log_path) > INDEX_LOG_MAX_BYTES:
+                self.save()
+        except OSError:
+            pass
+
+    # ── updates ──
+
+    def note_append(self, date, path, prev_size, text):
+        """Index `text` just appended to `path` (which was prev_size bytes)."""
+        with self.lock:
+            meta = self.files.get(date) if self._loaded else None
+            if meta and meta["size"] == prev_size:
+                start = meta["lines"]
+            elif prev_size:
+                with open(path, 'rb') as f:
+                    start = f.read(prev_size).count(b"\n")
+            else:
+                start = 0
+            postings, entries = _index_lines(text.split("\n"), start)
+            st = os.stat(path)
+            record = {
+                "op": "add", "date": date, "prev_size": prev_size,
+                "size": st.st_size, "mtime_ns": st.st_mtime_ns,
+                "lines": start + text.count("\n"), "entries": entries,
+                "postings": postings,
+            }
+            self._append_log(record)
+            if self._loaded:
+                self._apply(record)
+                self._maybe_compact()
+
+    def refresh(self):
+        """Bring the index in line with the journal directory. Returns days reindexed."""
+        self.load()
+        try:
+            names = [n for n in os.listdir(self.journal_dir) if n.endswith(".md")]
+        except FileNotFoundError:
+            names = []
+
+        records = []
+        seen = set()
+        for name in names:
+            date = name[:-3]
+            path = os.path.join(self.journal_dir, name)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            seen.add(date)
+            meta = self.files.get(date)
+            if meta and meta["size"] == st.st_size and meta["mtime_ns"] == st.st_mtime_ns:
+                continue
+            records.append(self._index_file(date, path))
+        for date in set(self.files) - seen:
+            records.append({"op": "drop", "date": date})
+
+        if not records:
+            return 0
+        for record in records:
+            self._apply(record)
+        if len(records) > INDEX_LOG_BATCH:
+            self.save()
+        else:
+            for record in records:
+                self._append_log(record)
+            self._maybe_compact()
+        return len(records)
+
+    def rebuild(self):
+        """Drop everything and index every journal file from scratch."""
+        self.postings = {}
+        self.files = {}
+        self._loaded = True
+        if self.refresh() <= INDEX_LOG_BATCH:
+            self.save()     # a bigger refresh has already saved
+
+    def _index_file(self, date, path):
+        """A "file" record replacing everything indexed for `date`."""
+        with open(path, 'rb') as f:
+            data = f.read()
+            st = os.fstat(f.fileno())
+        text = data.decode('utf-8', errors='replace')
+        postings, entries = _index_lines(text.split("\n"))
+        return {
+            "op": "file", "date": date, "size": len(data),
+            "mtime_ns": st.st_mtime_ns, "lines": text.count("\n"),
+            "entries": entries, "postings": postings,
+        }
+
+    def _apply(self, record):
+        op = record.get("op")
+        date = record.get("date")
+        if op == "drop":
+            self._drop(date)
+            self.files.pop(date, None)
+            return
+        if op == "file":
+            self._drop(date)
+            self.files[date] = {"size": record["size"], "mtime_ns": record["mtime_ns"],
+                                "lines": record["lines"], "entries": record["entries"]}
+        elif op == "add":
+            meta = self.files.get(date)
+            if (meta["size"] if meta else 0) != record["prev_size"]:
+                # The file changed outside Ghost before this append: index what we
+                # have, but leave the day marked stale so refresh re-reads it whole
+                self._drop(date)
+                meta = {"size": -1, "mtime_ns": 0, "lines": 0, "entries": []}
+                self.files[date] = meta
+                stale = True
+            else:
+                if meta is None:
+                    meta = self.files[date] = {"size": 0, "mtime_ns": 0, "lines": 0, "entries": []}
+                stale = False
+            meta["entries"] = meta["entries"] + record["entries"]
+            meta["lines"] = record["lines"]
+            if not stale:
+                meta["size"] = record["size"]
+                meta["mtime_ns"] = record["mtime_ns"]
+        else:
+            return
+        for token, lines in record["postings"].items():
+            self.postings.setdefault(token, {}).setdefault(date, []).extend(lines)
+
+    def _drop(self, date):
+        if date not in self.files:
+            return
+        for token in [t for t, days in self.postings.items() if date in days]:
+            days = self.postings[token]
+            del days[date]
+            if not days:
+                del self.postings[token]
+
+    # ── queries ──
+
+    def search(self, terms, since=None, until=None):
+        """
+        Days with at least one entry matching every term, best first.
+        Each result: {date, file, preview, score, entries, times}.
+        """
+        groups = []
+        for term in terms:
+            if term["kind"] == "prefix":
+                prefix = term["tokens"][0]
+                tag = prefix.startswith("#")
+                tokens = [t for t in self.postings
+                          if t.startswith(prefix) and t.startswith("#") == tag]
+            else:
+                tokens = list(dict.fromkeys(term["tokens"]))
+            postings = [self.postings[t] for t in tokens if t in self.postings]
+            if not postings:
+                return []
+            if term["kind"] == "phrase":
+                # Every word of a phrase must be present; order is checked on the text
+                groups.extend([p] for p in postings)
+                if len(postings) < len(tokens):
+                    return []
+            else:
+                groups.append(postings)
+
+        # Days containing every group, within the date range
+        days = None
+        for group in groups:
+            group_days = set().union(*group)
+            days = group_days if days is None else days & group_days
+        days = {d for d in days
+                if (not since or d >= since) and (not until or d <= until)}
+
+        total_days = max(1, len(self.files))
+        idf = [math.log(1 + total_days / len(set().union(*group))) for group in groups]
+        phrases = [t["tokens"] for t in terms if t["kind"] == "phrase"]
+
+        results = []
+        for date in days:
+            entries = self.files.get(date, {}).get("entries", [])
+            scores = None
+            matched = set()
+            for group, weight in zip(groups, idf):
+                hits = {}
+                for postings in group:
+                    for line in postings.get(date, ()):
+                        entry = bisect.bisect_right(entries, line) - 1
+                        hits[entry] = hits.get(entry, 0) + weight
+                        matched.add(line)
+                if scores is None:
+                    scores = hits
+                else:
+                    scores = {e: scores[e] + s for e, s in hits.items() if e in scores}
+                if not scores:
+                    break
+            if not scores:
+                continue
+
+            day = _DayEntries(self, date, entries)
+            if phrases:
+                for entry in list(scores):
+                    lo, lines = day.entry(entry)
+                    words = _WORD.findall(" ".join(lines).lower())
+                    if not all(_contains_sequence(words, p) for p in phrases):
+                        del scores[entry]
+                if not scores:
+                    continue
+
+            ranked = sorted(scores, key=lambda e: (-scores[e], -e))
+            times = [day.time(entry) for entry in ranked]
+            preview = []
+            for entry, stamp in zip(ranked, times):
+                if len(preview) >= SEARCH_PREVIEW_LINES:
+                    break
+                lo, lines = day.entry(entry)
+                first = 1 if entry >= 0 else 0
+                body = [lo + i for i in range(first, len(lines)) if lines[i].strip()]
+                shown = [n for n in body if n in matched] or body[:1]
+                for n in shown[:SEARCH_PREVIEW_LINES - len(preview)]:
+                    preview.append(f"{stamp}  {lines[n - lo].strip()}".strip())
+
+            results.append({
+                "date": date,
+                "file": f"{date}.md",
+                "preview": preview,
+                "score": round(scores[ranked[0]], 2),
+                "entries": len(ranked),
+                "times": times,
+            })
+
+        results.sort(key=lambda r: (r["score"], r["date"]), reverse=True)
+        return results
+
+    def _read_lines(self, date):
+        path = os.path.join(self.journal_dir, f"{date}.md")
+        try:
+            with open(path, 'r', encoding='utf-8', errors='replace') as f:
+                return f.read().split("\n")
+        except OSError:
+            return None
+
+    def stats(self):
+        def size(path):
+            try:
+                return os.path.getsize(path)
+            except OSError:
+                return 0
+        return {
+            "files": len(self.files),
+            "entries": sum(len(m["entries"]) for m in self.files.values()),
+            "tokens": len(self.postings),
+            "postings": sum(len(lines) for days in self.postings.values()
+                            for lines in days.values()),
+            "snapshot_bytes": size(self.snapshot_path),
+            "log_bytes": size(self.log_path),
+            "index_dir": self.index_dir,
+        }
+
+
+class _DayEntries:
+    """
+    Entry text for one day's search results. Entries are read one by one
+    through the offset sidecar when its records line up with the indexed
+    entry headers; otherwise (or for text before the first header) the
+    whole file is read once.
+    """
+
+    def __init__(self, index, date, entries):
+        self.index = index
+        self.date = date
+        self.entries = entries
+        self.records = None
+        self.base = 0
+        self._lines = None
+        if index.offsets is not None:
+            records = index.offsets.records(date)
+            base = 1 if records and records[0][0] == JournalOffsets.NO_TIME else 0
+            if len(records) - base == len(entries):
+                self.records, self.base = records, base
+
+    def entry(self, k):
+        """(first line number, lines) of entry k; k = -1 is text before the first header."""
+        if self.records is not None and k >= 0:
+            lines = self.index.offsets.read_lines(self.date, self.records[k + self.base])
+            return self.entries[k], lines
+        if self._lines is None:
+            self._lines = self.index._read_lines(self.date) or []
+        lo = self.entries[k] if k >= 0 else 0
+        hi = self.entries[k + 1] if k + 1 < len(self.entries) else len(self._lines)
+        return lo, self._lines[lo:hi]
+
+    def time(self, k):
+        if k < 0:
+            return ""
+        if self.records is not None:
+            seconds = self.records[k + self.base][0]
+            return f"{seconds // 3600:02d}:{seconds // 60 % 60:02d}:{seconds % 60:02d}"
+        header = _ENTRY_HEADER.match(self.entry(k)[1][0])
+        return header.group(1) if header else ""
+
+
+# ─── journal entry offsets ────────────────────────────────────────────────────
+
+class JournalOffsets:
+    """
+    Sidecar offset index per journal day: vault/index/entries/<date>.idx.
+    A 16-byte header (magic, journal bytes covered) is followed by one
+    fixed 24-byte record per entry, in file order:
+    (seconds since midnight, byte offset, byte length, tag mask).
+    Fixed width makes entry N a single unpack_from() on an mmap, so paging,
+    tail and search previews seek straight to the entries they need.
+
+    The tag mask is Bloom-style - one bit per tag (_tag_bit) - so a tag
+    filter skips entries whose bit is clear and confirms the rest from
+    their header line. journal_add appends a record; when the covered size
+    no longer matches the journal file (edited by hand, or a crash between
+    the two appends) the day's sidecar is rebuilt from the file.
+    """
+
+    MAGIC = b"GJOFF1\0\0"
+    HEADER = struct.Struct("<8sQ")
+    RECORD = struct.Struct("<IQIQ")
+    NO_TIME = 0xFFFFFFFF        # text before the first "## HH:MM:SS" header
+
+    def __init__(self, journal_dir, index_dir):
+        self.journal_dir = journal_dir
+        self.dir = os.path.join(index_dir, "entries")
+        self._lock = threading.Lock()
+
+    def sidecar_path(self, date):
+        return os.path.join(self.dir, f"{date}.idx")
+
+    def journal_path(self, date):
+        return os.path.join(self.journal_dir, f"{date}.md")
+
+    # ── updates ──
+
+    def note_append(self, date, journal_path, prev_size, content):
+        """
+        Record what journal_add just appended (`content`, at prev_size).
+        Scanned like _rebuild, so entry text containing a "## HH:MM:SS"
+        line yields the same entries a rebuild (and _parse_entries) sees.
+        """
+        data = content.encode("utf-8")
+        records, end = self._scan(data.splitlines(keepends=True), prev_size,
+                                  title=not prev_size)
+        with self._lock:
+            if self._covered(date) != prev_size:
+                self._rebuild(date)
+                return
+            with open(self.sidecar_path(date), 'r+b') as f:
+                f.seek(0, os.SEEK_END)
+                f.write(b"".join(self.RECORD.pack(*record) for record in records))
+                f.seek(0)
+                f.write(self.HEADER.pack(self.MAGIC, end))
+
+    def rebuild(self, date):
+        """Rewrite a day's sidecar from its journal file."""
+        with self._lock:
+            self._rebuild(date)
+
+    def _covered(self, date):
+        """Journal bytes the sidecar describes, or None if missing/foreign."""
+        try:
+            with open(self.sidecar_path(date), 'rb') as f:
+                magic, covered = self.HEADER.unpack(f.read(self.HEADER.size))
+        except (OSError, struct.error):
+            return None
+        return covered if magic == self.MAGIC else None
+
+    def _rebuild(self, date):
+        """Rewrite a day's sidecar from its journal file (call with the lock held)."""
+        try:
+            with open(self.journal_path(date), 'rb') as f:
+                records, offset = self._scan(f, 0, title=True)
+        except FileNotFoundError:
+            try:
+                os.remove(self.sidecar_path(date))
+            except OSError:
+                pass
+            return
+
+        os.makedirs(self.dir, exist_ok=True)
+        tmp = self.sidecar_path(date) + ".tmp"
+        with open(tmp, 'wb') as f:
+            f.write(self.HEADER.pack(self.MAGIC, offset))
+            for record in records:
+                f.write(self.RECORD.pack(*record))
+        os.replace(tmp, self.sidecar_path(date))
+
+    def _scan(self, lines, offset, title):
+        """
+        Entry records (seconds, offset, length, tag mask) in raw journal
+        lines starting at byte `offset`, plus the offset they end at. With
+        `title`, a leading "# " line is the file's title, not text.
+        """
+        records = []
+        current = None          # [seconds, offset, mask, has_text]
+        for n, raw in enumerate(lines):
+            line = raw.decode("utf-8", errors="replace").rstrip("\r\n")
+            header = _ENTRY_HEADER.match(line)
+            if header:
+                if current and (current[0] != self.NO_TIME or current[3]):
+                    records.append((current[0], current[1], offset - current[1], current[2]))
+                current = [_seconds(header.group(1)), offset,
+                           _tag_mask(_TAG.findall(header.group(2))), True]
+            elif title and n == 0 and line.startswith("# "):
+                pass
+            elif current is None:
+                current = [self.NO_TIME, offset, 0, bool(line.strip())]
+            elif line.strip():
+                current[3] = True
+            offset += len(raw)
+        if current and (current[0] != self.NO_TIME or current[3]):
+            records.append((current[0], current[1], offset - current[1], current[2]))
+        return records, offset
+
+    # ── reads ──
+
+    def records(self, date, tag_mask=0):
+        """
+        A day's records as (seconds, offset, length, mask) tuples, rebuilt
+        first if the sidecar doesn't cover the journal file. With a tag
+        mask, only records whose mask has those bits.
+        """
+        try:
+            size = os.path.getsize(self.journal_path(date))
+        except OSError:
+            return []
+        with self._lock:
+            if self._covered(date) != size:
+                self._rebuild(date)
+            try:
+                with open(self.sidecar_path(date), 'rb') as f:
+                    length = os.fstat(f.fileno()).st_size
+                    if length <= self.HEADER.size:
+                        return []
+                    with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                        count = (length - self.HEADER.size) // self.RECORD.size
+                        end = self.HEADER.size + count * self.RECORD.size
+                        records = list(self.RECORD.iter_unpack(mm[self.HEADER.size:end]))
+            except (OSError, ValueError):
+                return []
+        if tag_mask:
+            records = [r for r in records if r[3] & tag_mask == tag_mask]
+        return records
+
+    def count(self, date):
+        """Entries in a day, from the sidecar's size alone (rebuilt first if stale)."""
+        try:
+            size = os.path.getsize(self.journal_path(date))
+        except OSError:
+            return 0
+        with self._lock:
+            if self._covered(date) != size:
+                self._rebuild(date)
+            try:
+                length = os.path.getsize(self.sidecar_path(date))
+            except OSError:
+                return 0
+        return max(0, length - self.HEADER.size) // self.RECORD.size
+
+    def read_entries(self, date, records):
+        """Parse the entries at `records` (one open of the journal file)."""
+        if not records:
+            return []
+        entries = []
+        with open(self.journal_path(date), 'rb') as f:
+            for record in records:
+                text = self._read(f, record)
+                entries.extend(_parse_entries(text.split("\n"), date))
+        return entries
+
+    def read_lines(self, date, record):
+        """One entry's raw lines, header first."""
+        with open(self.journal_path(date), 'rb') as f:
+            return self._read(f, record).split("\n")
+
+    def _read(self, f, record):
+        f.seek(record[1])
+        return f.read(record[2]).decode("utf-8", errors="replace")
+
+
+def _seconds(stamp):
+    """"HH:MM:SS" -> seconds since midnight."""
+    h, m, s = stamp.split(":")
+    return int(h) * 3600 + int(m) * 60 + int(s)
+
+
+def _tag_mask(tags):
+    mask = 0
+    for tag in tags:
+        mask |= _tag_bit(tag)
+    return mask
+
+
+# ─── todo storage ─────────────────────────────────────────────────────────────
+#
+# Both stores take and return todo dicts shaped
+# {id, text, priority, created, completed, done} and share one interface:
+# add / list / complete / remove / counts / describe / flush / close.
+
+def _open_todo_store(backend, todos_dir, fsync="batch"):
+    if backend == "sqlite":
+        return SqliteTodoStore(todos_dir, migrate_from=JsonTodoStore(todos_dir, fsync), fsync=fsync)
+    store = JsonTodoStore(todos_dir, fsync)
+    if os.path.exists(os.path.join(todos_dir, "todos.db")):
+        # Switched back from sqlite: its rows are the current list, not active.json
+        if sqlite3 is None:
+            print("   [!] Vault: todos/todos.db holds your todos but sqlite3 is unavailable; "
+                  "the json list may be out of date")
+        else:
+            try:
+                exported = SqliteTodoStore(todos_dir, fsync=fsync).export_to(store)
+                print(f"   Vault: {exported} todos exported from todos.db back to active.json")
+            except (OSError, sqlite3.Error) as e:
+                print(f"   [!] Vault: could not export todos/todos.db to json ({e}); "
+                      "set \"vault_todo_backend\": \"sqlite\" to keep using it")
+    return store
+
+
+def _normalize_todos(todos):
+    """
+    Give a loaded JSON todo list a next_id and unique ids. Lists written
+    before next_id existed numbered items len(items) + 1, so a removal
+    followed by an add could hand out an id already in use; the later
+    duplicate gets a fresh id.
+    """
+    items = todos.setdefault("items", [])
+    next_id = max([todos.get("next_id") or 1] + [i["id"] + 1 for i in items])
+    seen = set()
+    for item in items:
+        if item["id"] in seen:
+            item["id"] = next_id
+            next_id += 1
+        seen.add(item["id"])
+    todos["next_id"] = next_id
+    return todos
+
+
+class JsonTodoStore:
+    """
+    todos/active.json plus todos/active.wal. A mutation is one appended
+    WAL record, applied to the in-memory list; compaction folds the log
+    into a fresh snapshot (written to a temp file, fsynced, renamed over
+    the old one - which is kept as active.json.bak, with the log it
+    absorbed kept as active.wal.prev). Loading reads the snapshot (or the
+    .bak if it's missing or unreadable) and replays the logs. Files
+    changed by another process are noticed by a stat and re-read.
+    """
+
+    name = "json"
+
+    def __init__(self, todos_dir, fsync="batch"):
+        self.todos_dir = todos_dir
+        self.path = os.path.join(todos_dir, "active.json")
+        self.backup_path = self.path + ".bak"
+        self.wal = VaultWAL(os.path.join(todos_dir, "active.wal"), fsync=fsync)
+        self._todos = None          # in-memory list: {"items", "next_id", "seq"}
+        self._signature = None      # (snapshot stat, wal size) it reflects
+        self._lock = threading.RLock()
+
+    def exists(self):
+        return os.path.exists(self.path) or os.path.exists(self.wal.path)
+
+    def load(self):
+        """A copy of the current list as {"items": [...], "next_id": N, "seq": S}."""
+        with self._lock:
+            return json.loads(json.dumps(self._state()))
+
+    # ── state ──
+
+    def _files_signature(self):
+        def stat(path):
+            try:
+                st = os.stat(path)
+                return (st.st_size, st.st_mtime_ns)
+            except OSError:
+                return None
+        return (stat(self.path), stat(self.wal.path))
+
+    def _state(self):
+        """The in-memory list, re-read if the files changed underneath us."""
+        signature = self._files_signature()
+        if self._todos is None or signature != self._signature:
+            self._todos = self._read()
+            self._signature = self._files_signature()
+        return self._todos
+
+    def _read(self):
+        todos = self._read_snapshot()
+        for record in self.wal.replay(after_seq=todos["seq"]):
+            _apply_todo_record(todos, record)
+        return todos
+
+    def _read_snapshot(self):
+        for path in (self.path, self.backup_path):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, 'r', encoding='utf-8') as f:
+                    todos = json.load(f)
+            except (OSError, ValueError) as e:
+                # Never let a torn file read as "no todos" - set it aside and fall back
+                aside = f"{path}.corrupt-{datetime.now():%Y%m%d_%H%M%S}"
+                print(f"   [!] Vault: {os.path.basename(path)} unreadable ({e}); kept as {os.path.basename(aside)}")
+                try:
+                    os.replace(path, aside)
+                except OSError:
+                    pass
+                continue
+            todos.setdefault("seq", 0)
+            return _normalize_todos(todos)
+        return _normalize_todos({"items": [], "seq": 0})
+
+    def _commit(self, record):
+        """Log one mutation (write-ahead), then apply it in memory."""
+        todos = self._state()
+        record["seq"] = todos["seq"] + 1
+        self.wal.append(record)
+        _apply_todo_record(todos, record)
+        self._signature = self._files_signature()
+
+    # ── operations ──
+
+    def add(self, text, priority, created):
+        with self._lock:
+            item = {
+                "id": self._state()["next_id"],
+                "text": text,
+                "priority": priority,
+                "created": created,
+                "completed": None,
+                "done": False,
+            }
+            self._commit({"op": "add", "item": item})
+            return dict(item)
+
+    def list(self, show_done=False, priority=None):
+        with self._lock:
+            items = self._state()["items"]
+            shown = [dict(i) for i in items
+                     if (show_done or not i["done"]) and (not priority or i.get("priority") == priority)]
+            return shown, len(items)
+
+    def complete(self, todo_id, when):
+        with self._lock:
+            if not any(i["id"] == todo_id for i in self._state()["items"]):
+                return None
+            self._commit({"op": "complete", "id": todo_id, "when": when})
+            return next(dict(i) for i in self._todos["items"] if i["id"] == todo_id)
+
+    def remove(self, todo_id):
+        with self._lock:
+            if not any(i["id"] == todo_id for i in self._state()["items"]):
+                return False
+            self._commit({"op": "remove", "id": todo_id})
+            return True
+
+    def counts(self):
+        with self._lock:
+            items = self._state()["items"]
+            done = sum(1 for i in items if i["done"])
+            return {"active": len(items) - done, "completed": done}
+
+    def describe(self):
+        return {"wal_records": self.wal.records, "wal_bytes": self.wal.size}
+
+    # ── compaction ──
+
+    def compact(self):
+        """
+        Fold the WAL into a new snapshot. Returns the number of records
+        folded (0 = nothing to do).
+        """
+        with self._lock:
+            todos = self._state()
+            folded = self.wal.records
+            if not folded and os.path.exists(self.path):
+                return 0
+            self._write_snapshot(todos)
+            return folded
+
+    def _write_snapshot(self, todos):
+        """Snapshot `todos` to active.json and rotate the WAL (call with the lock held)."""
+        self.wal.sync()
+        os.makedirs(self.todos_dir, exist_ok=True)
+        tmp = self.path + ".tmp"
+        with open(tmp, 'w', encoding='utf-8') as f:
+            json.dump(todos, f, indent=2)
+            f.flush()
+            os.fsync(f.fileno())
+        if os.path.exists(self.path):
+            os.replace(self.path, self.backup_path)
+        os.replace(tmp, self.path)
+        _fsync_dir(self.todos_dir)
+        # A crash before the rotation is harmless: replay skips seq <= snapshot seq
+        self.wal.rotate()
+        self._signature = self._files_signature()
+
+    def flush(self):
+        self.compact()
+
+    def close(self):
+        with self._lock:
+            if self._todos is not None:
+                self.compact()
+            self.wal.close()
+
+    def replace_all(self, items, next_id):
+        """Swap in a whole list (imported from another backend) and snapshot it."""
+        with self._lock:
+            seq = self._state()["seq"]
+            self._todos = _normalize_todos({"items": items, "next_id": next_id, "seq": seq})
+            self._write_snapshot(self._todos)
+
+    def retire(self, suffix=".migrated"):
+        """Compact, then set the files aside (after migrating to another backend)."""
+        with self._lock:
+            self.compact()
+            self.wal.close()
+            os.replace(self.path, self.path + suffix)
+            for path in (self.wal.path, self.wal.prev_path, self.backup_path):
+                try:
+                    os.remove(path)
+                except OSError:
+                    pass
+            self._todos = None
+
+
+def _apply_todo_record(todos, record):
+    """Apply one WAL record to an in-memory todo list."""
+    op = record.get("op")
+    if op == "add":
+        item = record["item"]
+        todos["items"].append(dict(item))
+        todos["next_id"] = max(todos["next_id"], item["id"] + 1)
+    elif op == "complete":
+        for item in todos["items"]:
+            if item["id"] == record["id"]:
+                item["done"] = True
+                item["completed"] = record["when"]
+    elif op == "remove":
+        todos["items"] = [i for i in todos["items"] if i["id"] != record["id"]]
+    todos["seq"] = max(todos["seq"], record.get("seq", 0))
+
+
+def _parse_wal(data):
+    """Complete records in WAL bytes. Returns (records, bytes up to the last good one)."""
+    records = []
+    good = 0
+    for line in data.splitlines(keepends=True):
+        if not line.endswith(b"\n"):
+            break
+        try:
+            records.append(json.loads(line))
+        except ValueError:
+            break
+        good += len(line)
+    return records, good
+
+
+def _fsync_dir(path):
+    """Persist a rename (POSIX); a no-op where directories can't be opened."""
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(fd)
+    except OSError:
+        pass
+    finally:
+        os.close(fd)
+
+
+# ─── write-ahead log ──────────────────────────────────────────────────────────
+
+class VaultWAL:
+    """
+    Append-only JSON-lines log. Each record is written with a single
+    O_APPEND write(), so a crash leaves whole records plus at most one torn
+    tail, which replay() drops and truncates. Records carry a "seq"; the
+    snapshot a log belongs to stores the last seq it already contains.
+    Compaction rotates the log to <name>.prev rather than truncating it.
+
+    fsync: "always" (every append), "batch" (appends within
+    WAL_FSYNC_WINDOW share one fsync, issued from a timer - a yanked
+    stick loses at most that window, never the file), "off" (the OS decides).
+    """
+
+    def __init__(self, path, fsync="batch", window=WAL_FSYNC_WINDOW):
+        self.path = path
+        self.prev_path = path + ".prev"
+        self.fsync = fsync
+        self.window = window
+        self.records = 0            # records in the log since the last reset
+        self.size = 0
+        self._fd = None
+        self._dirty = False
+        self._timer = None
+        self._lock = threading.Lock()
+
+    def replay(self, after_seq=0):
+        """
+        Records with seq > after_seq, in order: the previous log (kept by
+        rotate()) first, then the current one, whose torn tail is cut off.
+        """
+        records = []
+        try:
+            with open(self.prev_path, 'rb') as f:
+                records.extend(r for r in _parse_wal(f.read())[0] if r.get("seq", 0) > after_seq)
+        except OSError:
+            pass
+        try:
+            with open(self.path, 'rb') as f:
+                data = f.read()
+        except OSError:
+            data = b""
+        current, good = _parse_wal(data)
+        records.extend(r for r in current if r.get("seq", 0) > after_seq)
+        with self._lock:
+            if good < len(data):
+                print(f"   [!] Vault: dropped a torn record at the end of {os.path.basename(self.path)}")
+                with open(self.path, 'r+b') as f:
+                    f.truncate(good)
+            # Count already-folded lines too, so the next compaction clears them
+            self.records = len(current)
+            self.size = good
+        return records
+
+    def append(self, record):
+        line = (json.dumps(record, separators=(",", ":")) + "\n").encode("utf-8")
+        with self._lock:
+            if self._fd is None:
+                os.makedirs(os.path.dirname(self.path), exist_ok=True)
+                self._fd = os.open(self.path, os.O_WRONLY | os.O_APPEND | os.O_CREAT, 0o644)
+            os.write(self._fd, line)
+            self.records += 1
+            self.size += len(line)
+            if self.fsync == "always":
+                os.fsync(self._fd)
+            elif self.fsync == "batch":
+                self._dirty = True
+                if self._timer is None:
+                    self._timer = threading.Timer(self.window, self.sync)
+                    self._timer.daemon = True
+                    self._timer.start()
+
+    def sync(self):
+        """fsync pending appends now."""
+        with self._lock:
+            self._timer = None
+            if self._dirty and self._fd is not None:
+                os.fsync(self._fd)
+            self._dirty = False
+
+    def rotate(self):
+        """
+        Start an empty log; the current one becomes the previous log. Its
+        records are in the new snapshot, but together with the snapshot's
+        .bak they rebuild the state should the new snapshot be lost.
+        """
+        with self._lock:
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            try:
+                os.replace(self.path, self.prev_path)
+            except FileNotFoundError:
+                pass
+            self._dirty = False
+            self.records = 0
+            self.size = 0
+
+    def close(self):
+        self.sync()
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+            if self._fd is not None:
+                os.close(self._fd)
+                self._fd = None
+
+
+class SqliteTodoStore:
+    """
+    todos/todos.db - one row per todo, WAL journal. Adds, completions and
+    removals are single indexed statements; ids come from AUTOINCREMENT
+    and are never reused. The connection opens on first use, and the
+    first open imports active.json (kept as active.json.migrated).
+    """
+
+    name = "sqlite"
+    SCHEMA = """
+        CREATE TABLE IF NOT EXISTS todos (
+            id        INTEGER PRIMARY KEY AUTOINCREMENT,
+            text      TEXT NOT NULL,
+            priority  TEXT NOT NULL DEFAULT 'normal',
+            created   TEXT NOT NULL,
+            completed TEXT,
+            done      INTEGER NOT NULL DEFAULT 0
+        );
+        CREATE INDEX IF NOT EXISTS todos_done_priority ON todos (done, priority);
+        CREATE INDEX IF NOT EXISTS todos_priority ON todos (priority);
+        CREATE TABLE IF NOT EXISTS meta (key TEXT PRIMARY KEY, value TEXT);
+    """
+    COLUMNS = "id, text, priority, created, completed, done"
+
+    # "vault_fsync" mode -> PRAGMA synchronous
+    SYNCHRONOUS = {"always": "FULL", "batch": "NORMAL", "off": "OFF"}
+
+    def __init__(self, todos_dir, migrate_from=None, fsync="batch"):
+        self.todos_dir = todos_dir
+        self.path = os.path.join(todos_dir, "todos.db")
+        self.synchronous = self.SYNCHRONOUS.get(fsync, "NORMAL")
+        self._migrate_from = migrate_from
+        self._conn = None
+        self._lock = threading.Lock()
+
+    def _db(self):
+        """The open connection (call with the lock held)."""
+        if self._conn is None:
+            os.makedirs(self.todos_dir, exist_ok=True)
+            # Autocommit: each statement is its own transaction unless BEGIN is issued
+            conn = sqlite3.connect(self.path, check_same_thread=False, isolation_level=None)
+            conn.row_factory = sqlite3.Row
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(f"PRAGMA synchronous={self.synchronous}")
+            conn.executescript(self.SCHEMA)
+            self._conn = conn
+            self._migrate()
+        return self._conn
+
+    def _migrate(self):
+        """One-time import of the JSON todo list, ids preserved."""
+        conn = self._conn
+        if conn.execute("SELECT 1 FROM meta WHERE key = 'migrated_from_json'").fetchone():
+            return
+        source = self._migrate_from
+        todos = source.load() if source is not None and source.exists() else {"items": [], "next_id": 1}
+
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            for item in todos["items"]:
+                conn.execute(
+                    f"INSERT INTO todos ({self.COLUMNS}) VALUES (?, ?, ?, ?, ?, ?)",
+                    (item["id"], item["text"], item.get("priority", "normal"),
+                     item.get("created") or datetime.now().isoformat(),
+                     item.get("completed"), int(bool(item.get("done")))),
+                )
+            # Ids the JSON list already handed out (and removed) stay retired
+            retired = todos["next_id"] - 1
+            if retired > 0:
+                # sqlite_sequence has no unique key on name - update, insert only if absent
+                if not conn.execute("UPDATE sqlite_sequence SET seq = MAX(seq, ?) WHERE name = 'todos'",
+                                    (retired,)).rowcount:
+                    conn.execute("INSERT INTO sqlite_sequence (name, seq) VALUES ('todos', ?)", (retired,))
+            conn.execute(
+                "INSERT INTO meta (key, value) VALUES ('migrated_from_json', ?)",
+                (json.dumps({"items": len(todos["items"]), "at": datetime.now().isoformat()}),),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+
+        if todos["items"] and source is not None:
+            try:
+                source.retire(".migrated")
+            except OSError:
+                pass
+
+    @staticmethod
+    def _item(row):
+        item = dict(row)
+        item["done"] = bool(item["done"])
+        return item
+
+    def add(self, text, priority, created):
+        with self._lock:
+            cur = self._db().execute(
+                "INSERT INTO todos (text, priority, created) VALUES (?, ?, ?)",
+                (text, priority, created),
+            )
+            return {"id": cur.lastrowid, "text": text, "priority": priority,
+                    "created": created, "completed": None, "done": False}
+
+    def list(self, show_done=False, priority=None):
+        where, params = [], []
+        if not show_done:
+            where.append("done = 0")
+        if priority:
+            where.append("priority = ?")
+            params.append(priority)
+        sql = f"SELECT {self.COLUMNS} FROM todos"
+        if where:
+            sql += " WHERE " + " AND ".join(where)
+        with self._lock:
+            db = self._db()
+            items = [self._item(r) for r in db.execute(sql + " ORDER BY id", params)]
+            total = db.execute("SELECT COUNT(*) FROM todos").fetchone()[0]
+        return items, total
+
+    def complete(self, todo_id, when):
+        with self._lock:
+            db = self._db()
+            if not db.execute("UPDATE todos SET done = 1, completed = ? WHERE id = ?",
+                              (when, todo_id)).rowcount:
+                return None
+            row = db.execute(f"SELECT {self.COLUMNS} FROM todos WHERE id = ?", (todo_id,)).fetchone()
+            return self._item(row)
+
+    def remove(self, todo_id):
+        with self._lock:
+            return self._db().execute("DELETE FROM todos WHERE id = ?", (todo_id,)).rowcount > 0
+
+    def counts(self):
+        with self._lock:
+            rows = dict(self._db().execute(
+                "SELECT done, COUNT(*) FROM todos GROUP BY done").fetchall())
+        return {"active": rows.get(0, 0), "completed": rows.get(1, 0)}
+
+    def describe(self):
+        with self._lock:
+            row = self._db().execute(
+                "SELECT value FROM meta WHERE key = 'migrated_from_json'").fetchone()
+        return {"migrated": json.loads(row[0]) if row else None}
+
+    def export_to(self, store, suffix=".exported"):
+        """
+        Copy every row into `store` (a JsonTodoStore), ids and the id
+        sequence preserved, then close and set todos.db aside so the next
+        switch to sqlite migrates the JSON list afresh. Returns the count.
+        """
+        with self._lock:
+            db = self._db()
+            items = [self._item(r) for r in db.execute(f"SELECT {self.COLUMNS} FROM todos ORDER BY id")]
+            row = db.execute("SELECT seq FROM sqlite_sequence WHERE name = 'todos'").fetchone()
+            next_id = max([(row[0] if row else 0) + 1] + [i["id"] + 1 for i in items])
+        store.replace_all(items, next_id)
+        self.close()
+        os.replace(self.path, self.path + suffix)
+        for side in ("-wal", "-shm"):
+            try:
+                os.remove(self.path + side)
+            except OSError:
+                pass
+        return len(items)
+
+    def compact(self):
+        """SQLite's own WAL: checkpoint what no reader still needs. Returns pages moved."""
+        with self._lock:
+            if self._conn is None:
+                return 0
+            return self._conn.execute("PRAGMA wal_checkpoint(PASSIVE)").fetchone()[2]
+
+    def flush(self):
+        """Fold the WAL into todos.db so the file alone is a complete copy."""
+        with self._lock:
+            if self._conn is not None:
+                self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                try:
+                    self._conn.execute("PRAGMA wal_checkpoint(TRUNCATE)")
+                finally:
+                    self._conn.close()
+                    self._conn = None
@@ -6,7 +6,10 @@ Ghost Shell Phoenix - Main Entry Point
 Usage:
     python src/main.py
     python src/main.py --headless    (no banner, no shell - for automation)
+    python src/main.py --headless < cmds.txt           (batch: JSON result per line)
+    python src/main.py --headless --script cmds.txt --jobs 4
     python src/main.py --debug       (verbose boot logging)
+    python src/main.py --lazy        (defer non-critical engines until first use)
 """
 
 import sys
@@ -27,25 +30,63 @@ if hasattr(sys.stderr, "reconfigure"):
 ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
 sys.path.insert(0, ROOT_DIR)
 
+# === BYTECODE POLICY ===
+# Decide where .pyc files go before anything under src/ is imported.
+# Default: host-local shadow dir, so repeat boots skip compilation and the
+# stick stays clean. Nothing is written until the policy is applied.
+sys.dont_write_bytecode = True
+from src.core.ghost_engine import apply_bytecode_policy
+apply_bytecode_policy(ROOT_DIR)
+
 from src.core.kernel import GhostKernel
 
 
+def _arg_value(flag, default=None):
+    """Return the value following `flag` in argv (e.g. --jobs 4)."""
+    if flag in sys.argv:
+        idx = sys.argv.index(flag)
+        if idx + 1 < len(sys.argv):
+            return sys.argv[idx + 1]
+    return default
+
+
 def main():
     """Boot Ghost Shell Phoenix."""
     headless = "--headless" in sys.argv
     debug = "--debug" in sys.argv
+    lazy = "--lazy" in sys.argv
+    script = _arg_value("--script")
+    batch = headless and (script is not None or not sys.stdin.isatty())
 
     try:
-        kernel = GhostKernel(root_dir=ROOT_DIR, debug=debug)
-        boot_success = kernel.boot()
+        kernel = GhostKernel(root_dir=ROOT_DIR, debug=debug, lazy=lazy)
+        if batch:
+            # Keep stdout clean for JSON results - boot chatter goes to stderr
+            import contextlib
+            with contextlib.redirect_stdout(sys.stderr):
+                boot_success = kernel.boot()
+        else:
+            boot_success = kernel.boot()
 
         if not boot_success:
             print("\n[!] Kernel boot failed. Check errors above.")
             sys.exit(1)
 
-        if headless:
-            # Headless mode - kernel is up, engines are loaded
-            # Future: accept commands via stdin pipe or API
+        if batch:
+            # Batch mode - one JSON result per command line
+            try:
+                jobs = int(_arg_value("--jobs", "1"))
+            except ValueError:
+                jobs = 1
+            if script:
+                with open(script, 'r', encoding='utf-8') as f:
+                    failed = kernel.run_batch(f, jobs=jobs)
+            else:
+                failed = kernel.run_batch(sys.stdin, jobs=jobs)
+            sys.exit(1 if failed else 0)
+
+        elif headless:
+            # Headless mode - kernel is up, engines are loaded, nothing to read
             print("[Ghost] Running in headless mode. Press Ctrl+C to exit.")
             try:
                 import time
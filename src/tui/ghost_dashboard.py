@@ -1,7 +1,8 @@
 """
 Ghost Shell Dashboard — Textual TUI
 ======================================
-Live system dashboard with engine status, todos, reminders, and recent journal.
+Live system dashboard with engine status, todos, reminders, recent journal,
+and interface throughput.
 Requires: pip install textual
 
 This module is ONLY imported when textual is available (checked by cmd_dashboard).
@@ -14,6 +15,7 @@ from textual.app import App, ComposeResult
 from textual.widgets import Header, Footer, Static, DataTable, Label
 from textual.containers import Horizontal, Vertical
 from textual import work
+from rich.markup import escape
 
 
 class EngineStatusPanel(Static):
@@ -26,6 +28,9 @@ class EngineStatusPanel(Static):
     def render(self):
         lines = ["[bold]Engines[/bold]"]
         for name, engine in self.kernel.engines.items():
+            if self.kernel.is_lazy(name):
+                lines.append(f"[dim]◌ {name:<14} lazy[/dim]")
+                continue
             status = "✓" if engine is not None else "✗"
             color = "green" if engine is not None else "red"
             ver = getattr(engine, "ENGINE_VERSION", "?") if engine else "—"
@@ -126,17 +131,65 @@ class JournalPanel(Static):
         if not vault:
             return "[dim]Vault unavailable[/dim]"
 
-        result = vault.journal_list(last_n=3)
-        entries = result.get("entries", [])
+        # The last entries come straight from the offset sidecar - no file scan
+        entries = vault.journal_tail(3)["entries"]
         if not entries:
             return "[bold]Journal[/bold]\n[dim](no entries)[/dim]"
 
         lines = ["[bold]Journal[/bold]"]
-        for e in entries:
-            lines.append(f"📓 {e['date']}  ({e['size_bytes']} bytes)")
+        for e in reversed(entries):
+            text = e["text"].split("\n", 1)[0]
+            if len(text) > 48:
+                text = text[:47] + "…"
+            tags = " ".join(f"#{t}" for t in e["tags"])
+            lines.append(f"📓 {e['date']} {e['time'] or ''} [dim]{tags}[/dim]")
+            lines.append(f"   {escape(text)}")
         return "\n".join(lines)
 
 
+class NetworkPanel(Static):
+    """Panel showing interface throughput from BlackBox's traffic monitor."""
+
+    def __init__(self, kernel, **kwargs):
+        super().__init__(**kwargs)
+        self.kernel = kernel
+
+    def render(self):
+        # Don't force a lazy BlackBox to load just to draw this panel
+        if self.kernel.is_lazy("blackbox"):
+            return "[bold]Network[/bold]\n[dim]BlackBox not loaded (net top starts it)[/dim]"
+        blackbox = self.kernel.get_engine("blackbox")
+        if not blackbox:
+            return "[dim]BlackBox unavailable[/dim]"
+
+        report = blackbox.traffic_rates(window=60, history=24)
+        if not report["running"]:
+            return "[bold]Network[/bold]\n[dim]Traffic monitor off (net top starts it)[/dim]"
+
+        iface = self.kernel.get_engine("interface")
+        lines = ["[bold]Network[/bold]"]
+        active = [r for r in report["interfaces"]
+                  if r["present"] and (r["rx_total"] or r["tx_total"])]
+        for r in active[:4]:
+            trend = ""
+            if iface:
+                trend = iface.format_sparkline(
+                    [rx + tx for rx, tx in zip(r["history_rx"], r["history_tx"])], 24)
+            lines.append(f"{r['name'][:8]:<8} ↓ {_rate(r['rx_bps']):>10} ↑ {_rate(r['tx_bps']):>10}"
+                         f"  [cyan]{trend}[/cyan]")
+        if not active:
+            lines.append("[dim](collecting samples...)[/dim]")
+        return "\n".join(lines)
+
+
+def _rate(bytes_per_s):
+    for unit in ("B/s", "KB/s", "MB/s"):
+        if bytes_per_s < 1024:
+            return f"{bytes_per_s:.0f} {unit}" if unit == "B/s" else f"{bytes_per_s:.1f} {unit}"
+        bytes_per_s /= 1024
+    return f"{bytes_per_s:.1f} GB/s"
+
+
 class GhostDashboardApp(App):
     """Ghost Shell Live Dashboard — powered by Textual."""
 
@@ -174,6 +227,11 @@ class GhostDashboardApp(App):
         width: 35%;
         height: 50%;
     }
+    NetworkPanel {
+        border: solid $secondary;
+        padding: 0 1;
+        height: 8;
+    }
     """
 
     TITLE = "Ghost Shell Phoenix Dashboard"
@@ -195,6 +253,7 @@ class GhostDashboardApp(App):
                 with Horizontal():
                     yield ReminderPanel(self.kernel, id="reminders")
                     yield JournalPanel(self.kernel, id="journal")
+                yield NetworkPanel(self.kernel, id="network")
         yield Footer()
 
     def on_mount(self):
@@ -203,7 +262,7 @@ class GhostDashboardApp(App):
 
     def _refresh_all(self):
         """Refresh all panels."""
-        for panel_id in ("engines", "sysinfo", "todos", "reminders", "journal"):
+        for panel_id in ("engines", "sysinfo", "todos", "reminders", "journal", "network"):
             panel = self.query_one(f"#{panel_id}")
             if panel:
                 panel.refresh()
@@ -0,0 +1,118 @@
+"""
+Command API role checks: a caller's key role must govern every permission
+check a command makes, not just the command's REQUIRED_ROLE.
+
+Boots a throwaway copy of the shell (src/ plus a minimal data/ dir) and
+talks to the HTTP transport.
+
+    python -m unittest discover tests
+"""
+
+import contextlib
+import io
+import json
+import os
+import shutil
+import socket
+import sys
+import tempfile
+import unittest
+import urllib.error
+import urllib.request
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def _free_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+class ApiRoleTest(unittest.TestCase):
+
+    @classmethod
+    def setUpClass(cls):
+        cls.root = tempfile.mkdtemp(prefix="ghost_api_test_")
+        shutil.copytree(os.path.join(REPO_ROOT, "src"), os.path.join(cls.root, "src"),
+                        ignore=shutil.ignore_patterns("__pycache__"))
+        config_dir = os.path.join(cls.root, "data", "config")
+        keys_dir = os.path.join(cls.root, "data", "keys")
+        os.makedirs(config_dir)
+        os.makedirs(keys_dir)
+        cls.port = _free_port()
+        with open(os.path.join(config_dir, "settings.json"), "w") as f:
+            json.dump({"hot_reload": "off",
+                       "api": {"port": cls.port, "unix_socket": None}}, f)
+        with open(os.path.join(keys_dir, "god.key"), "w") as f:
+            json.dump({"key_id": "god-master", "role": "GOD", "secret": "test-god-secret"}, f)
+
+        sys.path.insert(0, cls.root)
+        from src.core.kernel import GhostKernel
+        cls.kernel = GhostKernel(root_dir=cls.root)
+        with contextlib.redirect_stdout(io.StringIO()):
+            if not cls.kernel.boot():
+                raise RuntimeError("kernel boot failed")
+
+        sec = cls.kernel.get_engine("security")
+        key, error = sec.issue_key("GUEST", label="api-test")
+        if error:
+            raise RuntimeError(error)
+        cls.guest_secret = key["secret"]
+
+        cls.api = cls.kernel.get_engine("api")
+        status = cls.api.start()
+        if status["errors"]:
+            raise RuntimeError(status["errors"])
+
+    @classmethod
+    def tearDownClass(cls):
+        cls.api.stop()
+        with contextlib.redirect_stdout(io.StringIO()):
+            cls.kernel.shutdown()
+        sys.path.remove(cls.root)
+        shutil.rmtree(cls.root, ignore_errors=True)
+
+    def _execute(self, command, secret):
+        request = urllib.request.Request(
+            f"http://127.0.0.1:{self.port}/execute",
+            data=json.dumps({"command": command}).encode(),
+            headers={"Authorization": f"Bearer {secret}",
+                     "Content-Type": "application/json"},
+        )
+        try:
+            with urllib.request.urlopen(request, timeout=30) as resp:
+                return resp.status, json.loads(resp.read())
+        except urllib.error.HTTPError as e:
+            return e.code, json.loads(e.read())
+
+    def test_guest_key_denied_net_scan(self):
+        # `net` is a GUEST command; `net scan` checks ADMIN inside execute()
+        status, result = self._execute("net scan 127.0.0.1 1", self.guest_secret)
+        self.assertEqual(status, 200)
+        self.assertEqual(result["role"], "GUEST")
+        self.assertIn("Access Denied", result["output"])
+        self.assertIn("requires ADMIN", result["output"])
+
+    def test_god_key_allowed_net_scan(self):
+        status, result = self._execute("net scan 127.0.0.1 1 --no-banner", "test-god-secret")
+        self.assertEqual(status, 200)
+        self.assertEqual(result["role"], "GOD")
+        self.assertNotIn("Access Denied", result["output"])
+
+    def test_guest_key_denied_sysinfo_shell(self):
+        # `sysinfo` is GUEST; bench runs host commands, on/off switch the session
+        for sub in ("bench 2 echo pwned", "on", "off"):
+            status, result = self._execute(f"sysinfo shell {sub}", self.guest_secret)
+            self.assertEqual(status, 200)
+            self.assertIn("requires ADMIN", result["output"])
+            self.assertNotIn("pwned", result["output"])
+
+    def test_session_role_unchanged_after_request(self):
+        self._execute("net scan 127.0.0.1 1", self.guest_secret)
+        sec = self.kernel.get_engine("security")
+        self.assertEqual(sec.effective_role, "GOD")
+
+
+if __name__ == "__main__":
+    unittest.main()